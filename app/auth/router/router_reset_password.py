@@ -5,7 +5,9 @@ from pydantic_core import ValidationError
 
 from app.auth.schema import OtpResponse, RegisterUserResponse, GeneralResponse
 from app.constants import OTP_EMAIL_BODY
-from app.utils import AppModel, generate_otp, send_email
+from app.jobs.job_service import get_job_service
+from app.jobs.schema import JobType
+from app.utils import AppModel, generate_otp
 
 from ..service import Service, get_service
 from . import router
@@ -54,11 +56,16 @@ def reset_password(
         else:
             svc.repository.delete_otp_for_user(existing_otp.id)
     created_otp = generate_otp()
-    svc.repository.create_otp_for_user(otp=created_otp, id=user_data.id)
+    otp_id = svc.repository.create_otp_for_user(otp=created_otp, id=user_data.id)
     reset_otp_email_body = OTP_EMAIL_BODY.format(
         user_name=user_data.name, otp=created_otp
     )
-    response = send_email(
-        subject="Password Reset OTP", email=email, custom_message=reset_otp_email_body
+    # Sent by a background worker; one email per OTP even if enqueued twice. The
+    # payload holds the OTP, so it is cleared once the job is done or dead
+    get_job_service().enqueue(
+        JobType.SEND_EMAIL.value,
+        {"subject": "Password Reset OTP", "email": email, "custom_message": reset_otp_email_body},
+        idempotency_key=f"otp-email:{otp_id}",
+        sensitive=True,
     )
-    return GeneralResponse(detail=response)
+    return GeneralResponse(detail=f"Email queued for delivery to {email}")
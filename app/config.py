@@ -3,18 +3,30 @@ from typing import Any
 from pymongo import MongoClient
 
 from .dependencies import env
+from .responses import ORJSONResponse
 
 # FastAPI configurations
 fastapi_config: dict[str, Any] = {
     "title": "IMS API",
     "separate_input_output_schemas": False,
+    "default_response_class": ORJSONResponse,
 }
 
 if env.mongo_db_url:
     mongo_url = env.mongo_db_url
 
 # MongoDB connection
-client = MongoClient(mongo_url,tz_aware=True)
+client = MongoClient(
+    mongo_url,
+    tz_aware=True,
+    maxPoolSize=env.mongo_max_pool_size,
+    minPoolSize=env.mongo_min_pool_size,
+    connectTimeoutMS=env.mongo_connect_timeout_ms,
+    serverSelectionTimeoutMS=env.mongo_server_selection_timeout_ms,
+    socketTimeoutMS=env.mongo_socket_timeout_ms,
+    waitQueueTimeoutMS=env.mongo_wait_queue_timeout_ms,
+    readPreference=env.mongo_read_preference,
+)
 
 # MongoDB database
 database = client[env.database]
@@ -1,8 +1,13 @@
 from bson.objectid import ObjectId
 from pymongo.database import Database
+from typing import Dict, Any, Optional
 
 from app.constants import ID
 from app.contact.schema import Contact
+from app.search import contact_search_fields, search_collection
+
+# Internal search fields (see app/search.py), left out of contact listings
+HIDE_SEARCH_FIELDS = {"search_name": 0, "search_terms": 0}
 
 
 class ContactRepository:
@@ -24,13 +29,34 @@ class ContactRepository:
             "branch": contact.branch,
             "created_at": contact.created_at,
         }
+        payload.update(contact_search_fields(payload))
 
         result = self.database["contacts"].insert_one(payload)
         return self.get_contact_by_id(contact_id=result.inserted_id)
 
-    def get_contacts(self):
-        result = self.database["contacts"].find({}).to_list()
-        return result
+    def get_contacts(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_spec: Optional[list] = None,
+        skip: int = 0,
+        limit: int = 1000,
+        projection: Optional[Dict[str, Any]] = None,
+    ):
+        """Get contacts with filtering, sorting, pagination and an optional projection.
+        limit=0 means retrieve all."""
+        cursor = self.database["contacts"].find(filters or {}, projection or HIDE_SEARCH_FIELDS)
+        if sort_spec:
+            cursor = cursor.sort(sort_spec)
+        cursor = cursor.skip(skip)
+        if limit > 0:
+            cursor = cursor.limit(limit)
+        return list(cursor)
+
+    def search_contacts(self, query: str, limit: int = 10):
+        """Contacts whose name, company, GSTIN or phone number match ``query``, best first."""
+        return search_collection(
+            self.database["contacts"], query, limit=limit, projection=HIDE_SEARCH_FIELDS
+        )
 
     def get_contact_by_id(self, contact_id: str):
         result = self.database["contacts"].find_one({"_id": ObjectId(contact_id)})
@@ -51,12 +77,33 @@ class ContactRepository:
             "branch": contact.branch,
             "created_at": contact.created_at,
         }
+        payload.update(contact_search_fields(payload))
 
         self.database["contacts"].update_one(
             {ID: ObjectId(contact_id)}, update={"$set": payload}
         )
         return self.get_contact_by_id(contact_id=contact_id)
 
+    def address_proof_in_use(self, filename: str) -> bool:
+        """Whether any contact refers to the file (identical uploads share one file)."""
+        return (
+            self.database["contacts"].find_one({"address_proof": filename}, {"_id": 1})
+            is not None
+        )
+
+    def get_address_proof_variants(self, filename: str):
+        """Thumbnail/preview keys already made for the file by any contact using it."""
+        contact = self.database["contacts"].find_one(
+            {"address_proof": filename, "address_proof_variants.source": filename},
+            {"address_proof_variants": 1},
+        )
+        return contact["address_proof_variants"] if contact else None
+
+    def set_address_proof_variants(self, filename: str, variants: dict):
+        self.database["contacts"].update_many(
+            {"address_proof": filename}, {"$set": {"address_proof_variants": variants}}
+        )
+
     def delete_contact(self, contact_id: str):
         result = self.database["contacts"].delete_one({ID: ObjectId(contact_id)})
         return result.deleted_count
@@ -1,6 +1,18 @@
-from app.config import database
+import os
+
+from app.config import database, env
 from app.contact.contact_repository import ContactRepository
+from app.jobs.job_service import get_job_service
+from app.jobs.schema import JobType
 from app.order.order_repository import OrderRepository
+from app.storage.images import IMAGE_FORMATS, make_image_variants
+from app.storage.storage import get_storage
+
+# Address proof variant -> storage folder
+ADDRESS_PROOF_VARIANT_FOLDERS = {
+    "thumbnail": "contact/thumbnails",
+    "preview": "contact/previews",
+}
 
 
 class ContactService:
@@ -10,6 +22,61 @@ class ContactService:
         self.repository = contact_repository
         self.order_repository = order_repository
 
+    def queue_address_proof_images(self, filename: str):
+        """Make sure the contacts using ``filename`` get a thumbnail and preview: reuse
+        ones made for the same file (and return them), otherwise queue a job to create
+        them."""
+        if not filename:
+            return None
+        variants = self.repository.get_address_proof_variants(filename)
+        if variants:
+            self.repository.set_address_proof_variants(filename, variants)
+            return variants
+        # No idempotency key: the same file name comes back whenever the same bytes
+        # are uploaded again (e.g. after the contact was deleted), and a duplicate
+        # job just rewrites the same variants
+        get_job_service().enqueue(JobType.CONTACT_IMAGES.value, {"filename": filename})
+        return None
+
+    def create_address_proof_images(self, filename: str):
+        """Store a thumbnail and a preview of an address proof and record them on every
+        contact using it. Returns the variant keys, or None if the file is not an image."""
+        storage = get_storage()
+        with storage.local_path(f"contact/{filename}") as path:
+            images = make_image_variants(
+                path,
+                {"thumbnail": env.thumbnail_size, "preview": env.preview_size},
+                env.image_variant_format,
+                env.image_variant_quality,
+            )
+        if not images:
+            return None
+
+        _, ext, content_type = IMAGE_FORMATS[env.image_variant_format]
+        name = os.path.splitext(filename)[0]
+        variants = {"source": filename}
+        for variant, data in images.items():
+            key = f"{ADDRESS_PROOF_VARIANT_FOLDERS[variant]}/{name}.{ext}"
+            storage.put_bytes(key, data, content_type)
+            variants[variant] = key
+        self.repository.set_address_proof_variants(filename, variants)
+        return variants
+
+    def delete_unused_address_proof(self, contact: dict):
+        """Delete a removed contact's address proof and its variants, unless another
+        contact uses the same file (identical uploads share one file)."""
+        filename = contact.get("address_proof")
+        if not filename or self.repository.address_proof_in_use(filename):
+            return
+        storage = get_storage()
+        storage.delete(f"contact/{filename}")
+        variants = contact.get("address_proof_variants") or {}
+        if variants.get("source") == filename:
+            for variant in ADDRESS_PROOF_VARIANT_FOLDERS:
+                if variant in variants:
+                    storage.delete(variants[variant])
+
+
 
 def get_contact_service():
     contact_repository = ContactRepository(database=database)
@@ -1,5 +1,5 @@
-import os
 from typing import Optional
+from anyio import from_thread
 from fastapi import Depends, HTTPException, status, Form, File, UploadFile
 from datetime import datetime, timezone
 from pydantic_core import ValidationError
@@ -7,8 +7,12 @@ from app.auth.schema import Branch
 import time
 from app.contact.contact_service import ContactService, get_contact_service
 from app.contact.schema import Contact
-from app.contact.utils import delete_file, handle_upload
-from app.utils import env
+from app.contact.utils import (
+    address_proof_image_urls,
+    delete_file,
+    file_url,
+    handle_upload,
+)
 from . import router
 
 
@@ -36,9 +40,7 @@ def create_contact(
     unix_time = int(time.time())
 
     if file:
-        _, ext = os.path.splitext(file.filename)
-        new_filename = f"image_{unix_time}{ext}"
-        handle_upload(new_filename=new_filename, file=file)
+        new_filename = from_thread.run(handle_upload, file).name
     try:
         payload = Contact(
             name=name,
@@ -64,20 +66,26 @@ def create_contact(
     contact_data = svc.repository.create_contact(contact=payload)
 
     if not contact_data:
-        delete_file(filename=new_filename)
+        if not svc.repository.address_proof_in_use(new_filename):
+            delete_file(filename=new_filename)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="The Contact was not created"
         )
 
+    # Thumbnail and preview: reused from an identical upload or made in the background
+    variants = svc.queue_address_proof_images(new_filename)
+    if variants:
+        contact_data["address_proof_variants"] = variants
+
     try:
+        contact_data.update(address_proof_image_urls(contact_data))
         if contact_data["address_proof"] != "":
-            contact_data["address_proof"] = (
-                f"{env.image_domain}/public/contact/{contact_data['address_proof']}"
-            )
+            contact_data["address_proof"] = file_url(contact_data["address_proof"])
         contact_data = Contact(**contact_data)
         return contact_data
     except ValidationError:
-        delete_file(filename=new_filename)
+        if not svc.repository.address_proof_in_use(new_filename):
+            delete_file(filename=new_filename)
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Pydantic Validation Error. Please contact the developer.",
@@ -1,7 +1,6 @@
 from fastapi import Depends, HTTPException, Response, status
 
 from app.contact.contact_service import ContactService, get_contact_service
-from app.contact.utils import delete_file
 from . import router
 
 
@@ -16,5 +15,5 @@ def delete_contact(id: str, svc: ContactService = Depends(get_contact_service)):
             detail="The Contact was not deleted. Please try again",
         )
 
-    delete_file(filename=current_contact["address_proof"])
+    svc.delete_unused_address_proof(current_contact)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
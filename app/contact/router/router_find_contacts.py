@@ -0,0 +1,34 @@
+from typing import List
+from fastapi import Depends, HTTPException, status, Query
+from pydantic_core import ValidationError
+
+from app.contact.schema import Contact
+from app.contact.contact_service import ContactService, get_contact_service
+from app.contact.utils import address_proof_image_urls, file_url
+from app.responses import model_list_response
+from . import router
+
+
+# Registered before GET /{id} (modules load alphabetically), which would match "search"
+@router.get("/search", status_code=status.HTTP_200_OK, response_model=List[Contact])
+def search_contacts(
+    q: str = Query(..., min_length=1, description="Start of a name, company, GSTIN or phone number, or whole words"),
+    limit: int = Query(10, ge=1, le=50, description="Number of contacts to return"),
+    svc: ContactService = Depends(get_contact_service),
+) -> List[Contact]:
+    """Typeahead search over contacts, best matches first. Returns an empty list
+    when nothing matches."""
+    contact_data = svc.repository.search_contacts(q, limit=limit)
+
+    for contact in contact_data:
+        contact.update(address_proof_image_urls(contact))
+        if contact["address_proof"]:
+            contact["address_proof"] = file_url(contact["address_proof"])
+
+    try:
+        return model_list_response(Contact, contact_data)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Pydantic Validation Error. Please Contact Admin or Developer. ${e}",
+        )
@@ -1,7 +1,7 @@
 from pydantic_core import ValidationError
 from app.contact.contact_service import ContactService, get_contact_service
 from app.contact.schema import Contact
-from app.utils import env
+from app.contact.utils import address_proof_image_urls, file_url
 from . import router
 from fastapi import Depends, HTTPException, status
 
@@ -17,9 +17,8 @@ def get_contact_by_id(
         )
 
     try:
-        contact_data["address_proof"] = (
-            f"{env.image_domain}/public/contact/{contact_data['address_proof']}"
-        )
+        contact_data.update(address_proof_image_urls(contact_data))
+        contact_data["address_proof"] = file_url(contact_data["address_proof"])
         contact_data = Contact(**contact_data)
         return contact_data
     except ValidationError:
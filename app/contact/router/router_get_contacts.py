@@ -1,35 +1,98 @@
-from typing import List
-from fastapi import Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import Depends, HTTPException, status, Query
 from pydantic_core import ValidationError
 
+from app.auth.schema import Branch
 from app.contact.schema import Contact
 from app.contact.contact_service import ContactService, get_contact_service
-from app.utils import env
+from app.contact.utils import address_proof_image_urls, file_url
+from app.order.filters import FilterBuilder, KeysetPagination, SortBuilder
+from app.responses import model_list_response
 from . import router
 
+# Response fields derived from the stored address_proof and its variants
+ADDRESS_PROOF_FIELDS = {"address_proof", "address_proof_thumbnail", "address_proof_preview"}
+# Names accepted by `fields`: the Contact response fields, as serialized
+CONTACT_FIELDS = {field.alias or name for name, field in Contact.model_fields.items()}
+
+
+def contact_projection(fields: List[str], sort_spec: list) -> dict:
+    """Projection for the requested fields. Sort fields are always included because
+    the next page cursor is built from them."""
+    projection = {field: 1 for field in fields if field not in ADDRESS_PROOF_FIELDS}
+    projection.update({field: 1 for field, _ in sort_spec})
+    if ADDRESS_PROOF_FIELDS.intersection(fields):
+        projection.update({"address_proof": 1, "address_proof_variants": 1})
+    return projection
+
 
 @router.get("", status_code=status.HTTP_200_OK, response_model=List[Contact])
 def get_contacts(
+    filter: Optional[List[str]] = Query(None, description="Filters as 'field:operator:value' or 'field:value'"),
+    sort: Optional[List[str]] = Query(["name:asc"], description="Sort fields as 'field:asc' or 'field:desc'"),
+    skip: int = Query(0, ge=0, description="Number of documents to skip"),
+    limit: int = Query(1000, ge=0, le=1000, description="Number of documents to return (0 means all)"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    branch: Optional[Branch] = Query(None, description="Only contacts of this branch"),
+    fields: Optional[List[str]] = Query(None, description="Fields to return, e.g. fields=name&fields=personal_number"),
     svc: ContactService = Depends(get_contact_service),
 ) -> List[Contact]:
-    contact_data = svc.repository.get_contacts()
+    # Build filters from query parameters
+    filters = FilterBuilder.build_filters(filter) if filter else {}
+    if branch:
+        filters["branch"] = branch.value
+
+    # Build sort specification from query parameters
+    sort_spec = SortBuilder.build_sort(sort) if sort else None
+
+    # Keyset pagination: `after` replaces `skip` and `_id` keeps the order stable
+    try:
+        filters, sort_spec = KeysetPagination.apply(filters, sort_spec, after)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if fields:
+        unknown_fields = sorted(set(fields) - CONTACT_FIELDS)
+        if unknown_fields:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Unknown fields: {', '.join(unknown_fields)}",
+            )
+    projection = contact_projection(fields, sort_spec) if fields else None
+
+    contact_data = svc.repository.get_contacts(
+        filters=filters,
+        sort_spec=sort_spec,
+        skip=0 if after else skip,
+        limit=limit,
+        projection=projection,
+    )
     if not contact_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No Contacts Found. Please create new contact",
         )
 
+    next_cursor = KeysetPagination.next_cursor(contact_data, sort_spec, limit)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+
     for contact in contact_data:
-        try:
+        if "address_proof" in contact:
+            contact.update(address_proof_image_urls(contact))
             if contact["address_proof"]:
-                contact["address_proof"] = (
-                    f"{env.image_domain}/public/contact/{contact["address_proof"]}"
-                )
-            contact = Contact(**contact)
-        except ValidationError as e:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Pydantic Validation Error. Please Contact Admin or Developer. ${e}",
-            )
+                contact["address_proof"] = file_url(contact["address_proof"])
+        if fields:
+            # Sort fields were only projected for the cursor
+            for key in contact.keys() - CONTACT_FIELDS:
+                del contact[key]
 
-    return contact_data
+    # Projected rows are partial contacts of known fields, so they are returned as stored
+    try:
+        return model_list_response(
+            Contact, contact_data, headers=headers, trusted=True if fields else None
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Pydantic Validation Error. Please Contact Admin or Developer. ${e}",
+        )
@@ -8,8 +8,7 @@ from app.auth.schema import Branch
 
 from app.contact.contact_service import ContactService, get_contact_service
 from app.contact.schema import Contact
-from app.contact.utils import handle_upload
-from app.utils import env
+from app.contact.utils import address_proof_image_urls, file_url, handle_upload
 from . import router
 
 
@@ -35,9 +34,7 @@ async def update_contact(
 ):
     unix_time = int(time.time())
     if file:
-        _, ext = os.path.splitext(file.filename)
-        filename = f"image_{unix_time}{ext}"
-        handle_upload(new_filename=filename, file=file)
+        filename = (await handle_upload(file)).name
     else:
         filename = os.path.basename(address_proof)
 
@@ -66,10 +63,15 @@ async def update_contact(
             status_code=status.HTTP_404_NOT_FOUND, detail="The Contact was not created"
         )
 
+    if file:
+        # Thumbnail and preview: reused from an identical upload or made in the background
+        variants = svc.queue_address_proof_images(filename)
+        if variants:
+            contact_data["address_proof_variants"] = variants
+
     try:
-        contact_data["address_proof"] = (
-            f"{env.image_domain}/public/contact/{contact_data['address_proof']}"
-        )
+        contact_data.update(address_proof_image_urls(contact_data))
+        contact_data["address_proof"] = file_url(contact_data["address_proof"])
         contact_data = Contact(**contact_data)
         return contact_data
     except ValidationError:
@@ -16,6 +16,10 @@ class Contact(AppModel):
     address: str
     pincode: str
     address_proof: str
+    # Downscaled copies of address_proof, made in the background after upload;
+    # None until they exist (or when the file is not an image)
+    address_proof_thumbnail: Optional[str] = None
+    address_proof_preview: Optional[str] = None
     company_name: str
     remarks: str = Field(default="")
     branch: Branch = Field(default=Branch.PADUR)
@@ -1,7 +1,9 @@
 import os
-import shutil
 import re
-from fastapi import HTTPException, UploadFile, File, status
+from typing import Optional
+from fastapi import HTTPException, UploadFile, status
+
+from app.storage.storage import FileTooLargeError, StoredFile, get_storage
 
 UPLOAD_DIR = "app/public"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
@@ -17,19 +19,26 @@ def sanitize_filename(filename: str) -> str:
     return sanitized
 
 
-def handle_upload(
-    new_filename: str,
-    file: UploadFile = File(...),
+async def handle_upload(
+    file: UploadFile,
     type: str = "contact",
-):
-    try:
-        directory_path = os.path.join(UPLOAD_DIR, type)
-        os.makedirs(directory_path, exist_ok=True)
-        save_path = os.path.join(directory_path, new_filename)
-        with open(save_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+    new_filename: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+) -> StoredFile:
+    """Stream an upload into storage under the ``type`` folder.
 
-        file.file.close()
+    Without ``new_filename`` the file is named after its SHA-256 (plus extension), so
+    identical uploads share one file and uploads never overwrite each other.
+    """
+    try:
+        return await get_storage().save(
+            file, folder=type, name=new_filename, max_bytes=max_bytes
+        )
+    except FileTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Failed to upload file: {str(e)}",
+        )
     except Exception as e:
         print(f"Error uploading file: {e}")
         raise HTTPException(
@@ -38,7 +47,28 @@ def handle_upload(
         )
 
 
-def delete_file(filename: str):
-    file_path = os.path.join(UPLOAD_DIR, filename)
-    if os.path.exists(file_path):
-        os.remove(file_path)
+def delete_file(filename: str, type: str = "contact"):
+    if not filename:
+        return
+    get_storage().delete(f"{type}/{filename}")
+
+
+def file_url(filename: str, type: str = "contact") -> str:
+    return get_storage().url(f"{type}/{filename}")
+
+
+def address_proof_image_urls(contact: dict) -> dict:
+    """Thumbnail and preview URLs of a stored contact's address proof (None until the
+    background job has made them, or if they belong to a replaced file)."""
+    variants = contact.pop("address_proof_variants", None) or {}
+    if variants.get("source") != contact.get("address_proof"):
+        variants = {}
+    storage = get_storage()
+    return {
+        "address_proof_thumbnail": (
+            storage.url(variants["thumbnail"]) if "thumbnail" in variants else None
+        ),
+        "address_proof_preview": (
+            storage.url(variants["preview"]) if "preview" in variants else None
+        ),
+    }
@@ -87,6 +87,98 @@ class ENV:
         if not self.app_secret:
             print("Missing app secret")
         
+        # MongoDB connection pool, timeouts and read preference
+        self.mongo_max_pool_size = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+        self.mongo_min_pool_size = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+        self.mongo_connect_timeout_ms = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "20000"))
+        self.mongo_server_selection_timeout_ms = int(
+            os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "30000")
+        )
+        self.mongo_socket_timeout_ms = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "0")) or None
+        self.mongo_wait_queue_timeout_ms = (
+            int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "0")) or None
+        )
+        self.mongo_read_preference = os.getenv("MONGO_READ_PREFERENCE", "primary")
+
+        # Run related writes (e.g. purchase order + stock) in multi-document
+        # transactions. Requires MongoDB to run as a replica set.
+        self.mongo_transactions = os.getenv("MONGO_TRANSACTIONS", "false").lower() in ["true", "1", "yes"]
+
+        # Worker threads for sync route handlers; defaults to the MongoDB pool size so
+        # requests wait on a connection instead of on a free thread
+        self.threadpool_size = int(os.getenv("THREADPOOL_SIZE", str(self.mongo_max_pool_size)))
+
+        # In-process cache for reference data (units, product categories)
+        self.reference_cache_ttl_seconds = float(os.getenv("REFERENCE_CACHE_TTL_SECONDS", "300"))
+        self.reference_cache_max_size = int(os.getenv("REFERENCE_CACHE_MAX_SIZE", "1024"))
+
+        # How list endpoints build their JSON: "strict" validates the documents
+        # against the response model once, "trusted" serializes them as stored
+        self.response_validation = os.getenv("RESPONSE_VALIDATION", "strict").lower()
+
+        # Documents fetched per cursor batch (and written per chunk) by the
+        # streaming export endpoints
+        self.export_batch_size = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+        # Timezone used to bucket orders by day/month in reports
+        self.report_timezone = os.getenv("REPORT_TIMEZONE", "Asia/Kolkata")
+
+        # Tail a change stream (replica set required) to invalidate the in-process
+        # caches of every worker when products/units/categories/contacts change
+        self.change_streams = os.getenv("CHANGE_STREAMS", "false").lower() in ["true", "1", "yes"]
+        # Broker the change events are published to (see app/events/broker.py)
+        self.event_broker = os.getenv("EVENT_BROKER", "local")
+
+        # WhatsApp Cloud API. GRAPH_API_URL can point at a local fake server
+        # (scripts/fake_graph_api.py) for testing.
+        self.graph_api_url = os.getenv("GRAPH_API_URL", "https://graph.facebook.com")
+        # Broadcast campaigns: concurrent senders, messages per second and retries
+        # of rate-limited (429) or failed (5xx) requests
+        self.whatsapp_concurrency = int(os.getenv("WHATSAPP_CONCURRENCY", "20"))
+        self.whatsapp_rate_per_second = float(os.getenv("WHATSAPP_RATE_PER_SECOND", "80"))
+        self.whatsapp_max_retries = int(os.getenv("WHATSAPP_MAX_RETRIES", "5"))
+        self.whatsapp_retry_base_seconds = float(os.getenv("WHATSAPP_RETRY_BASE_SECONDS", "1"))
+        self.whatsapp_retry_max_seconds = float(os.getenv("WHATSAPP_RETRY_MAX_SECONDS", "60"))
+        # Uploaded media ids are reused for identical images for this long;
+        # WhatsApp keeps uploaded media for 30 days
+        self.whatsapp_media_ttl_days = float(os.getenv("WHATSAPP_MEDIA_TTL_DAYS", "29"))
+
+        # Where uploads are stored: "local" (app/public) or "s3" (any S3-compatible
+        # store; S3_PUBLIC_URL is the base URL files are served from, default
+        # {S3_ENDPOINT_URL}/{S3_BUCKET})
+        self.storage_backend = os.getenv("STORAGE_BACKEND", "local").lower()
+        self.upload_max_bytes = int(os.getenv("UPLOAD_MAX_BYTES", str(10 * 1024 * 1024)))
+        self.s3_endpoint_url = os.getenv("S3_ENDPOINT_URL", "")
+        self.s3_bucket = os.getenv("S3_BUCKET", "")
+        self.s3_region = os.getenv("S3_REGION", "us-east-1")
+        self.s3_access_key_id = os.getenv("S3_ACCESS_KEY_ID", "")
+        self.s3_secret_access_key = os.getenv("S3_SECRET_ACCESS_KEY", "")
+        self.s3_public_url = os.getenv("S3_PUBLIC_URL", "")
+
+        # Address proof thumbnails/previews: longest side in pixels,
+        # format ("webp" or "jpeg") and encoder quality
+        self.thumbnail_size = int(os.getenv("THUMBNAIL_SIZE", "256"))
+        self.preview_size = int(os.getenv("PREVIEW_SIZE", "1280"))
+        self.image_variant_format = os.getenv("IMAGE_VARIANT_FORMAT", "webp").lower()
+        self.image_variant_quality = int(os.getenv("IMAGE_VARIANT_QUALITY", "75"))
+
+        # Browser cache lifetime of served files that are not content-addressed
+        # (content-addressed uploads are cached as immutable)
+        self.static_max_age_seconds = int(os.getenv("STATIC_MAX_AGE_SECONDS", "0"))
+
+        # Background jobs (emails, WhatsApp DCs). JOB_WORKERS worker threads run in
+        # each API process; set it to 0 when running scripts/run_job_worker.py instead
+        self.job_workers = int(os.getenv("JOB_WORKERS", "1"))
+        self.job_poll_seconds = float(os.getenv("JOB_POLL_SECONDS", "1"))
+        # A job still running after its lease is assumed lost and run again
+        self.job_lease_seconds = float(os.getenv("JOB_LEASE_SECONDS", "300"))
+        self.job_max_attempts = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+        self.job_retry_base_seconds = float(os.getenv("JOB_RETRY_BASE_SECONDS", "10"))
+        self.job_retry_max_seconds = float(os.getenv("JOB_RETRY_MAX_SECONDS", "3600"))
+
+        # Create the MongoDB indexes from app/indexes.py on startup
+        self.ensure_indexes = os.getenv("ENSURE_INDEXES", "true").lower() in ["true", "1", "yes"]
+
         self.version = os.getenv("VERSION", "v18.0")
         if not self.version:
             print("Missing version")
@@ -0,0 +1,53 @@
+import threading
+from typing import Callable, Dict, List
+
+# Events are plain dicts: {"collection", "operation", "document_id"}
+EventHandler = Callable[[dict], None]
+
+
+class LocalBroker:
+    """In-process pub/sub: delivers each published event to every subscriber of
+    this worker process, synchronously and in subscription order."""
+
+    def __init__(self):
+        self._handlers: List[EventHandler] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, handler: EventHandler):
+        with self._lock:
+            self._handlers.append(handler)
+
+    def publish(self, event: dict):
+        with self._lock:
+            handlers = list(self._handlers)
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception as e:
+                print(f"Event handler {getattr(handler, '__name__', handler)} failed: {e}")
+
+    def close(self):
+        pass
+
+
+# Broker implementations by EVENT_BROKER name; register others (e.g. a Redis
+# broker) with register_broker before startup
+BROKERS: Dict[str, Callable[[], LocalBroker]] = {"local": LocalBroker}
+
+_broker = None
+
+
+def register_broker(name: str, factory: Callable):
+    BROKERS[name] = factory
+
+
+def get_broker():
+    """Return the process-wide broker, creating it from EVENT_BROKER on first use."""
+    global _broker
+    if _broker is None:
+        from app.dependencies import env
+
+        if env.event_broker not in BROKERS:
+            raise ValueError(f"Unknown EVENT_BROKER '{env.event_broker}'")
+        _broker = BROKERS[env.event_broker]()
+    return _broker
@@ -0,0 +1,116 @@
+import threading
+from typing import List, Optional
+
+from pymongo.database import Database
+from pymongo.errors import OperationFailure, PyMongoError
+
+from app.cache import CACHES
+
+# Collections whose changes are published (and invalidate caches of the same name)
+WATCHED_COLLECTIONS = ["products", "units", "product_categories", "contacts"]
+
+# MongoDB error code when a resume token is no longer in the oplog
+CHANGE_STREAM_HISTORY_LOST = 286
+
+
+def invalidate_caches(event: dict):
+    """Drop the changed document from the cache named after its collection, or the
+    whole cache when the collection itself was dropped/renamed or events were lost."""
+    cache = CACHES.get(event["collection"])
+    if cache is None:
+        return
+    if event.get("document_id") is None:
+        cache.clear()
+    else:
+        cache.invalidate(event["document_id"])
+
+
+class ChangeStreamWatcher:
+    """Tails a change stream on the watched collections in a daemon thread and
+    publishes one event per change to ``broker``.
+
+    Every worker process runs its own watcher, so each process sees every change.
+    The resume token is only kept in memory, to reconnect without missing changes
+    after a transient error; a restarted process starts from now with every cache
+    invalidated, since nothing cached before the stream opened can be trusted.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        broker,
+        collections: Optional[List[str]] = None,
+        name: str = "cache-invalidation",
+        retry_seconds: float = 5,
+    ):
+        self.database = database
+        self.broker = broker
+        self.collections = collections or WATCHED_COLLECTIONS
+        self.name = name
+        self.retry_seconds = retry_seconds
+        self._stop = threading.Event()
+        self._thread = None
+        self._stream = None
+        self._resume_token = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name=f"change-stream-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        stream = self._stream
+        if stream is not None:
+            stream.close()
+        if self._thread is not None:
+            self._thread.join(timeout=self.retry_seconds)
+
+    def _invalidate_all(self):
+        for collection in self.collections:
+            self.broker.publish(
+                {"collection": collection, "operation": "invalidate", "document_id": None}
+            )
+
+    def _run(self):
+        pipeline = [{"$match": {"ns.coll": {"$in": self.collections}}}]
+        self._invalidate_all()
+        while not self._stop.is_set():
+            try:
+                with self.database.watch(
+                    pipeline, resume_after=self._resume_token, max_await_time_ms=1000
+                ) as stream:
+                    self._stream = stream
+                    while not self._stop.is_set() and stream.alive:
+                        change = stream.try_next()
+                        if change is not None:
+                            self._handle(change)
+                        # Also advances while idle, so a reconnect resumes from here
+                        self._resume_token = stream.resume_token
+            except OperationFailure as e:
+                if e.code == CHANGE_STREAM_HISTORY_LOST:
+                    # Changes were missed: start from now and drop everything cached
+                    print(f"Change stream {self.name} history lost, restarting from now")
+                    self._resume_token = None
+                    self._invalidate_all()
+                    continue
+                print(f"Change stream {self.name} failed: {e}")
+            except PyMongoError as e:
+                if self._stop.is_set():
+                    break
+                print(f"Change stream {self.name} failed: {e}")
+            finally:
+                self._stream = None
+            self._stop.wait(self.retry_seconds)
+
+    def _handle(self, change: dict):
+        document_key = change.get("documentKey") or {}
+        document_id = document_key.get("_id")
+        self.broker.publish(
+            {
+                "collection": change.get("ns", {}).get("coll"),
+                "operation": change.get("operationType"),
+                "document_id": str(document_id) if document_id is not None else None,
+            }
+        )
@@ -0,0 +1,157 @@
+from typing import Dict, List
+
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.database import Database
+from pymongo.errors import OperationFailure
+
+
+def _index(*keys, **options) -> IndexModel:
+    """Build an IndexModel from field names; prefix a field with '-' for descending."""
+    spec = [
+        (key[1:], DESCENDING) if key.startswith("-") else (key, ASCENDING)
+        for key in keys
+    ]
+    return IndexModel(spec, **options)
+
+
+def _text_index(**weights) -> IndexModel:
+    """Text index over the weighted fields; a collection can only have one."""
+    return IndexModel(
+        [(field, TEXT) for field in weights], weights=weights, name="search_text"
+    )
+
+
+# Declarative index registry: collection name -> indexes the application relies on.
+# Anchored, case-sensitive regexes (e.g. "^RO/PADUR-1/") can use the order_id and
+# invoice_id indexes; FilterBuilder's "regex" operator is case-insensitive and cannot.
+ORDER_INDEXES = [
+    _index("order_id"),
+    _index("invoice_id", sparse=True),
+    _index("created_at"),
+    _index("status"),
+    _index("branch"),
+    _index("customer._id"),
+]
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    "rental_orders": ORDER_INDEXES
+    + [
+        _index("invoice_date"),
+        _index("out_date"),
+        # Overdue rentals: status == pending and due_date < now
+        _index("status", "due_date"),
+        # Stored on write, e.g. final_amount:gte:10000
+        _index("final_amount"),
+    ],
+    "sales_orders": ORDER_INDEXES + [_index("invoice_date"), _index("bill_date")],
+    "service_orders": ORDER_INDEXES + [_index("invoice_date"), _index("out_date")],
+    "purchase_orders": [
+        _index("order_id"),
+        _index("invoice_id", sparse=True),
+        _index("purchase_date"),
+        _index("supplier._id"),
+    ],
+    "petty_cash": [
+        _index("created_date"),
+        _index("customer._id"),
+    ],
+    "contacts": [
+        # GET /contacts sorts by name with _id as the keyset tie-breaker,
+        # optionally within one branch
+        _index("name", "_id"),
+        _index("personal_number"),
+        _index("branch", "name", "_id"),
+        # Uploads are shared by content; find every contact using a file
+        _index("address_proof"),
+        _index("created_at"),
+        # Typeahead search (app/search.py): normalized prefixes, then whole words
+        _index("search_name"),
+        _index("search_terms"),
+        _text_index(name=10, company_name=5, gstin=2, personal_number=2, office_number=1),
+    ],
+    "products": [
+        _index("product_code"),
+        _index("category"),
+        _index("unit"),
+        _index("search_name"),
+        _index("search_terms"),
+        _text_index(name=10, product_code=5, description=1),
+    ],
+    "otp": [
+        _index("user_id"),
+        # Expired OTPs are removed by MongoDB's TTL monitor
+        _index("expiration_time", expireAfterSeconds=0),
+    ],
+    "users": [
+        _index("email", unique=True),
+    ],
+    "jobs": [
+        # Workers claim the oldest due job
+        _index("status", "run_at"),
+        _index("idempotency_key", unique=True, sparse=True),
+        # Finished jobs are removed a week after they are done
+        _index("finished_at", expireAfterSeconds=7 * 24 * 3600),
+    ],
+    "whatsapp_media": [
+        _index("content_hash", "phone_number_id", unique=True),
+        # Media ids WhatsApp no longer honours are removed by the TTL monitor
+        _index("expires_at", expireAfterSeconds=0),
+    ],
+    "daily_order_rollups": [
+        # One row per day and dimension; the incremental upserts match on it
+        _index("date", "branch", "order_type", "billing_mode", "status", unique=True),
+    ],
+}
+
+
+def _index_name(index: IndexModel) -> str:
+    return index.document["name"]
+
+
+def ensure_indexes(database: Database, registry: Dict[str, List[IndexModel]] = INDEXES):
+    """Create every index in the registry. Existing identical indexes are left untouched,
+    so this is safe to run on every startup.
+
+    Returns a dict of collection name -> list of errors for indexes that could not be
+    created (e.g. an index with the same name but different options already exists).
+    """
+    errors = {}
+    for collection_name, indexes in registry.items():
+        for index in indexes:
+            try:
+                database[collection_name].create_indexes([index])
+            except OperationFailure as e:
+                errors.setdefault(collection_name, []).append(
+                    f"{_index_name(index)}: {e}"
+                )
+    return errors
+
+
+def index_report(database: Database, registry: Dict[str, List[IndexModel]] = INDEXES):
+    """Compare the registry with the indexes that exist in the database.
+
+    Returns a dict of collection name -> {"missing", "unregistered", "unused"} where
+    "unused" lists indexes with no recorded accesses since the server last started.
+    """
+    report = {}
+    for collection_name, indexes in registry.items():
+        collection = database[collection_name]
+        existing = set(collection.index_information().keys())
+        expected = {_index_name(index) for index in indexes}
+
+        try:
+            unused = sorted(
+                stats["name"]
+                for stats in collection.aggregate([{"$indexStats": {}}])
+                if stats["name"] != "_id_" and stats["accesses"]["ops"] == 0
+            )
+        except OperationFailure:
+            # $indexStats is not available on every deployment
+            unused = []
+
+        report[collection_name] = {
+            "missing": sorted(expected - existing),
+            "unregistered": sorted(existing - expected - {"_id_"}),
+            "unused": unused,
+        }
+    return report
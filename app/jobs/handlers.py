@@ -0,0 +1,49 @@
+from functools import partial
+
+import httpx
+
+from app.contact.contact_service import get_contact_service
+from app.jobs.schema import JobType
+from app.order.utils import send_whatsapp_message_with_img, upload_media_to_whatsapp
+from app.utils import deliver_email
+from app.whatsapp.client import is_rejected
+
+
+def send_email_job(payload: dict):
+    deliver_email(
+        subject=payload["subject"],
+        email=payload["email"],
+        custom_message=payload["custom_message"],
+    )
+
+
+def whatsapp_dc_job(payload: dict):
+    send_message = partial(
+        send_whatsapp_message_with_img,
+        mobile_number=payload["mobile_number"],
+        customer_name=payload["customer_name"],
+        order_id=payload["order_id"],
+        bill_type=payload["bill_type"],
+    )
+    file_id = upload_media_to_whatsapp(file_name=payload["file_name"])
+    try:
+        send_message(file_id=file_id)
+    except httpx.HTTPStatusError as e:
+        if not is_rejected(e.response):
+            raise
+        # The cached media id may have expired on WhatsApp's side: upload once more
+        file_id = upload_media_to_whatsapp(file_name=payload["file_name"], refresh=True)
+        send_message(file_id=file_id)
+
+
+def contact_images_job(payload: dict):
+    get_contact_service().create_address_proof_images(payload["filename"])
+
+
+# Job type -> function run by the workers with the job's payload. A handler that
+# raises is retried, so it must be safe to run more than once.
+JOB_HANDLERS = {
+    JobType.SEND_EMAIL.value: send_email_job,
+    JobType.WHATSAPP_DC.value: whatsapp_dc_job,
+    JobType.CONTACT_IMAGES.value: contact_images_job,
+}
@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from bson.objectid import ObjectId
+from pymongo import ReturnDocument
+from pymongo.database import Database
+from pymongo.errors import DuplicateKeyError
+
+from app.jobs.schema import JobStatus
+
+
+class JobRepository:
+    """Background jobs in the ``jobs`` collection.
+
+    A worker claims a job by atomically moving it to running with a lease; a job
+    whose lease runs out (its worker died) is claimed again, so every job runs at
+    least once.
+    """
+
+    def __init__(self, database: Database):
+        self.database = database
+
+    def enqueue(
+        self,
+        job_type: str,
+        payload: dict,
+        now: datetime,
+        max_attempts: int,
+        idempotency_key: Optional[str] = None,
+        sensitive: bool = False,
+    ):
+        """Queue a job; a job with the same idempotency_key is returned instead of
+        queueing a duplicate. The payload of a ``sensitive`` job (e.g. one holding an
+        OTP) is cleared once the job is done or dead."""
+        job = {
+            "type": job_type,
+            "payload": payload,
+            "status": JobStatus.QUEUED.value,
+            "attempts": 0,
+            "max_attempts": max_attempts,
+            "run_at": now,
+            "created_at": now,
+            "locked_by": None,
+            "lease_expires_at": None,
+            "last_error": None,
+            "finished_at": None,
+            "sensitive": sensitive,
+        }
+        if idempotency_key is None:
+            result = self.database["jobs"].insert_one(job)
+            return self.get_job_by_id(result.inserted_id)
+
+        job["idempotency_key"] = idempotency_key
+        try:
+            return self.database["jobs"].find_one_and_update(
+                {"idempotency_key": idempotency_key},
+                {"$setOnInsert": job},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # Lost an upsert race on the unique index: the other job wins
+            return self.database["jobs"].find_one({"idempotency_key": idempotency_key})
+
+    def get_job_by_id(self, job_id: str):
+        return self.database["jobs"].find_one({"_id": ObjectId(job_id)})
+
+    def claim(
+        self,
+        worker_id: str,
+        now: datetime,
+        lease_seconds: float,
+        job_types: Optional[List[str]] = None,
+    ):
+        """Take the next due job (or one whose lease expired) for ``worker_id``."""
+        query = {
+            "$or": [
+                {"status": JobStatus.QUEUED.value, "run_at": {"$lte": now}},
+                {"status": JobStatus.RUNNING.value, "lease_expires_at": {"$lt": now}},
+            ]
+        }
+        if job_types:
+            query["type"] = {"$in": job_types}
+        return self.database["jobs"].find_one_and_update(
+            query,
+            {
+                "$set": {
+                    "status": JobStatus.RUNNING.value,
+                    "locked_by": worker_id,
+                    "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("run_at", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    def complete(
+        self, job_id, worker_id: str, now: datetime, clear_payload: bool = False
+    ) -> bool:
+        fields = {"status": JobStatus.DONE.value, "finished_at": now}
+        if clear_payload:
+            fields["payload"] = None
+        return self._finish(job_id, worker_id, fields)
+
+    def retry(self, job_id, worker_id: str, error: str, run_at: datetime) -> bool:
+        return self._finish(
+            job_id,
+            worker_id,
+            {"status": JobStatus.QUEUED.value, "run_at": run_at, "last_error": error},
+        )
+
+    def bury(
+        self,
+        job_id,
+        worker_id: str,
+        error: str,
+        now: datetime,
+        clear_payload: bool = False,
+    ) -> bool:
+        fields = {"status": JobStatus.DEAD.value, "last_error": error, "failed_at": now}
+        if clear_payload:
+            fields["payload"] = None
+        return self._finish(job_id, worker_id, fields)
+
+    def _finish(self, job_id, worker_id: str, fields: dict) -> bool:
+        # Only the worker holding the lease may settle the job; if the lease expired
+        # and another worker re-claimed it, that worker's outcome counts
+        result = self.database["jobs"].update_one(
+            {"_id": job_id, "status": JobStatus.RUNNING.value, "locked_by": worker_id},
+            {"$set": {**fields, "locked_by": None, "lease_expires_at": None}},
+        )
+        return result.modified_count == 1
+
+    def get_dead_jobs(self, job_types: Optional[List[str]] = None):
+        query = {"status": JobStatus.DEAD.value}
+        if job_types:
+            query["type"] = {"$in": job_types}
+        return list(self.database["jobs"].find(query).sort("failed_at", 1))
+
+    def requeue(self, job_ids: list, now: datetime) -> int:
+        """Give dead jobs a fresh set of attempts. Sensitive jobs whose payload was
+        cleared are skipped; they have nothing left to run."""
+        result = self.database["jobs"].update_many(
+            {"_id": {"$in": job_ids}, "status": JobStatus.DEAD.value, "payload": {"$ne": None}},
+            {"$set": {"status": JobStatus.QUEUED.value, "attempts": 0, "run_at": now}},
+        )
+        return result.modified_count
@@ -0,0 +1,37 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.config import database, env
+from app.jobs.job_repository import JobRepository
+
+
+class JobService:
+    def __init__(self, job_repository: JobRepository):
+        self.job_repository = job_repository
+
+    def enqueue(
+        self,
+        job_type: str,
+        payload: dict,
+        idempotency_key: Optional[str] = None,
+        max_attempts: Optional[int] = None,
+        sensitive: bool = False,
+    ):
+        """Queue a job for the workers (see app/jobs/worker.py) and return it."""
+        return self.job_repository.enqueue(
+            job_type=job_type,
+            payload=payload,
+            now=datetime.now(timezone.utc),
+            max_attempts=max_attempts or env.job_max_attempts,
+            idempotency_key=idempotency_key,
+            sensitive=sensitive,
+        )
+
+    def get_job(self, job_id: str):
+        return self.job_repository.get_job_by_id(job_id)
+
+
+def get_job_service():
+    job_repository = JobRepository(database=database)
+    svc = JobService(job_repository=job_repository)
+    return svc
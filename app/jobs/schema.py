@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    # Failed max_attempts times; left for inspection (scripts/requeue_dead_jobs.py)
+    DEAD = "dead"
+
+
+class JobType(str, Enum):
+    SEND_EMAIL = "send_email"
+    WHATSAPP_DC = "whatsapp_dc"
+    CONTACT_IMAGES = "contact_images"
@@ -0,0 +1,139 @@
+import os
+import random
+import socket
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+from app.jobs.job_repository import JobRepository
+
+
+def retry_delay(attempts: int, base_seconds: float, max_seconds: float) -> float:
+    """Exponential backoff with jitter after the ``attempts``-th failure."""
+    delay = min(max_seconds, base_seconds * 2 ** (attempts - 1))
+    return delay * random.uniform(0.5, 1)
+
+
+class JobWorker:
+    """Claims jobs from ``jobs`` and runs their handler in a daemon thread.
+
+    A job that raises is retried with backoff until it has been tried
+    ``max_attempts`` times, then marked dead. Several workers (threads or
+    processes) can share the collection; each job is claimed by one at a time.
+    """
+
+    def __init__(
+        self,
+        job_repository: JobRepository,
+        handlers: Dict[str, Callable[[dict], None]],
+        job_types: Optional[List[str]] = None,
+        poll_seconds: float = 1,
+        lease_seconds: float = 300,
+        retry_base_seconds: float = 10,
+        retry_max_seconds: float = 3600,
+        name: Optional[str] = None,
+    ):
+        self.job_repository = job_repository
+        self.handlers = handlers
+        self.job_types = job_types or list(handlers)
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.worker_id = name or f"{socket.gethostname()}-{os.getpid()}-{id(self):x}"
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.run, name=f"job-worker-{self.worker_id}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+    def run(self):
+        while not self._stop.is_set():
+            try:
+                worked = self.run_once()
+            except Exception as e:
+                print(f"Job worker {self.worker_id} failed: {e}")
+                worked = False
+            if not worked:
+                self._stop.wait(self.poll_seconds)
+
+    def run_once(self) -> bool:
+        """Claim and run one job; returns False if there was nothing to do."""
+        now = datetime.now(timezone.utc)
+        job = self.job_repository.claim(
+            self.worker_id, now, self.lease_seconds, self.job_types
+        )
+        if not job:
+            return False
+
+        if job["attempts"] > job["max_attempts"]:
+            # Its worker died on every attempt without recording a failure
+            self.job_repository.bury(
+                job["_id"],
+                self.worker_id,
+                job.get("last_error") or "Lease expired",
+                now,
+                clear_payload=job.get("sensitive", False),
+            )
+            return True
+
+        try:
+            self.handlers[job["type"]](job["payload"])
+        except Exception as e:
+            error = f"{type(e).__name__}: {getattr(e, 'detail', e)}"
+            now = datetime.now(timezone.utc)
+            if job["attempts"] >= job["max_attempts"]:
+                print(f"Job {job['_id']} ({job['type']}) failed for good: {error}")
+                self.job_repository.bury(
+                    job["_id"],
+                    self.worker_id,
+                    error,
+                    now,
+                    clear_payload=job.get("sensitive", False),
+                )
+            else:
+                print(f"Job {job['_id']} ({job['type']}) failed, retrying: {error}")
+                delay = retry_delay(
+                    job["attempts"], self.retry_base_seconds, self.retry_max_seconds
+                )
+                self.job_repository.retry(
+                    job["_id"], self.worker_id, error, now + timedelta(seconds=delay)
+                )
+            return True
+
+        self.job_repository.complete(
+            job["_id"],
+            self.worker_id,
+            datetime.now(timezone.utc),
+            clear_payload=job.get("sensitive", False),
+        )
+        return True
+
+
+def create_job_workers(
+    database, count: int, job_types: Optional[List[str]] = None
+) -> List[JobWorker]:
+    """``count`` workers for the registered handlers, configured from the JOB_* envs."""
+    from app.config import env
+    from app.jobs.handlers import JOB_HANDLERS
+
+    return [
+        JobWorker(
+            JobRepository(database=database),
+            JOB_HANDLERS,
+            job_types=job_types,
+            poll_seconds=env.job_poll_seconds,
+            lease_seconds=env.job_lease_seconds,
+            retry_base_seconds=env.job_retry_base_seconds,
+            retry_max_seconds=env.job_retry_max_seconds,
+        )
+        for _ in range(count)
+    ]
@@ -1,9 +1,10 @@
-from fastapi import FastAPI, HTTPException, status
-from fastapi.staticfiles import StaticFiles
+from anyio import to_thread
+from fastapi import FastAPI, HTTPException, Request, status
 from starlette.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import RedirectResponse
 import os
 import re
+import stat
 
 from app.auth.router import router as auth_router
 from app.middleware.AuthMiddleware import AuthMiddleware
@@ -12,8 +13,17 @@ from app.contact.router import router as contact_router
 from app.product_category.router import router as product_category_router
 from app.unit.router import router as unit
 from app.order.router import router as orders
-from app.config import client, env, fastapi_config
+from app.cache import get_cache_stats
+from app.config import client, database, env, fastapi_config
+from app.events.broker import get_broker
+from app.events.change_stream import ChangeStreamWatcher, invalidate_caches
+from app.indexes import ensure_indexes
+from app.jobs.worker import create_job_workers
 from app.petty_cash.router import router as petty_cash
+from app.static import CachedStaticFiles, static_file_response
+from app.storage.storage import get_storage
+from app.whatsapp.campaign_service import cancel_running_campaigns, get_campaign_service
+from app.whatsapp.client import close_async_client
 
 
 
@@ -29,9 +39,46 @@ app = FastAPI(**fastapi_config)
 def startup_db_client():
     app.state.mongodb = client
 
+    # Sync route handlers run on this threadpool; keep it in step with the Mongo pool
+    to_thread.current_default_thread_limiter().total_tokens = env.threadpool_size
+
+    if env.ensure_indexes:
+        for collection_name, errors in ensure_indexes(database).items():
+            for error in errors:
+                print(f"Failed to create index on {collection_name}: {error}")
+
+    app.state.change_stream_watcher = None
+    if env.change_streams:
+        broker = get_broker()
+        broker.subscribe(invalidate_caches)
+        app.state.change_stream_watcher = ChangeStreamWatcher(database, broker)
+        app.state.change_stream_watcher.start()
+
+    # Campaigns run inside the API process, so ones left running by a crash or
+    # redeploy would otherwise stay "running" for good
+    interrupted = get_campaign_service().fail_interrupted_campaigns()
+    if interrupted:
+        print(f"Marked {interrupted} interrupted WhatsApp campaigns as failed")
+
+    app.state.job_workers = create_job_workers(database, env.job_workers)
+    for worker in app.state.job_workers:
+        worker.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_whatsapp_client():
+    # Before the MongoDB client closes, so interrupted campaigns record their progress
+    await cancel_running_campaigns()
+    await close_async_client()
+
 
 @app.on_event("shutdown")
 def shutdown_db_client():
+    for worker in app.state.job_workers:
+        worker.stop(timeout=env.job_poll_seconds)
+    if app.state.change_stream_watcher:
+        app.state.change_stream_watcher.stop()
+    get_broker().close()
     client.close()
 
 
@@ -47,10 +94,12 @@ app.add_middleware(
     allow_methods=env.cors_methods,
     allow_headers=env.cors_headers,
     allow_credentials=True,
+    # Lets browser clients read the keyset pagination cursor of list endpoints
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Mount static files after middleware so responses go through middleware stack
-app.mount("/public", StaticFiles(directory="app/public"), name="public")
+app.mount("/public", CachedStaticFiles(directory="app/public"), name="public")
 
 app.include_router(auth_router, prefix="/auth", tags=["Auth"])
 app.include_router(product_router, prefix="/products", tags=["Product"])
@@ -68,35 +117,42 @@ def root():
     return f"Documentation is available at {app.docs_url}"
 
 
+@app.get("/cache/stats")
+def cache_stats():
+    """Hit/miss counters and sizes of the in-process reference data caches."""
+    return get_cache_stats()
+
+
+CONTACT_FILES_DIR = os.path.join(os.path.dirname(__file__), "public", "contact")
+
+
 @app.get("/download-static/contact/{file_name}")
-def download_contact_file(file_name: str):
-    """Serve a file from app/public/contact safely.
+def download_contact_file(file_name: str, request: Request):
+    """Serve a file from app/public/contact safely, with the cache headers, 304s and
+    Range support of /public.
 
     Example: GET /download-static/contact/image_123.png
     """
-    # Sanitize the filename
+    # Sanitize the filename; no path separators are left after this
     file_name = sanitize_filename(file_name)
-    
+
     # Additional path traversal validation
-    if ".." in file_name or file_name.startswith("/"):
+    if not file_name or ".." in file_name:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid file name"
         )
 
-    base_dir = os.path.join(os.path.dirname(__file__), "public", "contact")
-    file_path = os.path.join(base_dir, file_name)
+    if env.storage_backend != "local":
+        return RedirectResponse(get_storage().url(f"contact/{file_name}"))
 
-    # Ensure resolved path is inside the base_dir
+    file_path = os.path.join(CONTACT_FILES_DIR, file_name)
     try:
-        if os.path.commonpath([os.path.abspath(file_path), os.path.abspath(base_dir)]) != os.path.abspath(base_dir):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid file path"
-            )
-    except ValueError:
-        # commonpath can raise ValueError on different drives on Windows
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid file path")
-
-    if not os.path.exists(file_path) or not os.path.isfile(file_path):
+        stat_result = os.stat(file_path)
+    except FileNotFoundError:
+        stat_result = None
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
 
-    return FileResponse(path=file_path, filename=file_name)
+    return static_file_response(
+        file_path, stat_result, request.headers, filename=file_name
+    )
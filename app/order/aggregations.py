@@ -0,0 +1,189 @@
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from app.product.schema import DiscountType
+
+
+class SummaryGroup(str, Enum):
+    BRANCH = "branch"
+    BILLING_MODE = "billing_mode"
+    STATUS = "status"
+
+
+class SummaryPeriod(str, Enum):
+    DAY = "day"
+    MONTH = "month"
+
+
+class SummaryDateField(str, Enum):
+    CREATED_AT = "created_at"
+    OUT_DATE = "out_date"
+    INVOICE_DATE = "invoice_date"
+
+
+PERIOD_FORMATS = {
+    SummaryPeriod.DAY: "%Y-%m-%d",
+    SummaryPeriod.MONTH: "%Y-%m",
+}
+
+# Summed per group; final_amount is the balance still due on the orders
+SUMMARY_AMOUNT_FIELDS = [
+    "total_amount",
+    "discount_amount",
+    "gst_amount",
+    "eway_amount",
+    "damage_expenses",
+    "round_off",
+    "balance_paid",
+    "final_amount",
+]
+
+
+def _field(name: str, default: Any = 0) -> dict:
+    return {"$ifNull": [f"${name}", default]}
+
+
+def final_amount_stages() -> List[dict]:
+    """
+    Stages adding the amounts of ``calculate_final_amount`` to each rental order.
+    Any change to calculate_final_amount must be made here too
+    (scripts/check_order_summary_parity.py compares the two).
+
+    Adds total_amount, discount_amount, gst_amount and final_amount (rounded to 2).
+    """
+    return [
+        {
+            "$addFields": {
+                # Summed line by line like the Python loop
+                "total_amount": {
+                    "$reduce": {
+                        "input": _field("product_details", []),
+                        "initialValue": 0,
+                        "in": {
+                            "$add": [
+                                "$$value",
+                                {
+                                    "$multiply": [
+                                        {"$ifNull": ["$$this.order_quantity", 0]},
+                                        {"$ifNull": ["$$this.duration", 0]},
+                                        {"$ifNull": ["$$this.rent_per_unit", 0]},
+                                    ]
+                                },
+                            ]
+                        },
+                    }
+                },
+                "discount": _field("discount"),
+                "round_off": _field("round_off"),
+                "eway_amount": _field("eway_amount"),
+                "damage_expenses": _field("damage_expenses"),
+                "balance_paid": _field("balance_paid"),
+                # A GST of 0 or no GST at all falls back to 18%
+                "gst_percentage": {
+                    "$cond": [{"$eq": [_field("gst"), 0]}, 18, "$gst"]
+                },
+            }
+        },
+        {
+            "$addFields": {
+                "discount_amount": {
+                    "$cond": [
+                        {"$eq": [_field("discount_type", DiscountType.RUPEES.value), DiscountType.PERCENT.value]},
+                        {"$divide": [{"$multiply": ["$total_amount", "$discount"]}, 100]},
+                        "$discount",
+                    ]
+                }
+            }
+        },
+        {
+            "$addFields": {
+                # GST is only charged on B2B orders, on the rent plus transport
+                "gst_amount": {
+                    "$cond": [
+                        {"$eq": [_field("billing_mode", "B2C"), "B2B"]},
+                        {
+                            "$divide": [
+                                {
+                                    "$multiply": [
+                                        {
+                                            "$subtract": [
+                                                {"$add": ["$total_amount", "$eway_amount"]},
+                                                "$discount_amount",
+                                            ]
+                                        },
+                                        "$gst_percentage",
+                                    ]
+                                },
+                                100,
+                            ]
+                        },
+                        0,
+                    ]
+                }
+            }
+        },
+        {
+            "$addFields": {
+                "final_amount": {
+                    "$round": [
+                        {
+                            "$subtract": [
+                                {
+                                    "$add": [
+                                        {"$subtract": ["$total_amount", "$discount_amount"]},
+                                        "$gst_amount",
+                                        "$round_off",
+                                        "$eway_amount",
+                                        "$damage_expenses",
+                                    ]
+                                },
+                                "$balance_paid",
+                            ]
+                        },
+                        2,
+                    ]
+                }
+            }
+        },
+    ]
+
+
+def rental_summary_pipeline(
+    filters: Optional[Dict[str, Any]] = None,
+    group_by: Optional[List[SummaryGroup]] = None,
+    period: Optional[SummaryPeriod] = None,
+    date_field: SummaryDateField = SummaryDateField.CREATED_AT,
+    timezone: str = "UTC",
+) -> List[dict]:
+    """Pipeline totalling rental order amounts per group (and per day/month in
+    ``timezone`` when ``period`` is set)."""
+    group_id = {group.value: f"${group.value}" for group in group_by or []}
+    if period:
+        group_id["period"] = {
+            "$dateToString": {
+                "format": PERIOD_FORMATS[period],
+                "date": f"${date_field.value}",
+                "timezone": timezone,
+            }
+        }
+
+    return [
+        {"$match": filters or {}},
+        *final_amount_stages(),
+        {
+            "$group": {
+                "_id": group_id or None,
+                "orders": {"$sum": 1},
+                **{field: {"$sum": f"${field}"} for field in SUMMARY_AMOUNT_FIELDS},
+            }
+        },
+        {"$sort": {"_id": 1}},
+        {
+            "$project": {
+                "_id": 0,
+                **{key: f"$_id.{key}" for key in group_id},
+                "orders": 1,
+                **{field: {"$round": [f"${field}", 2]} for field in SUMMARY_AMOUNT_FIELDS},
+            }
+        },
+    ]
@@ -0,0 +1,83 @@
+import csv
+import io
+from datetime import datetime
+from enum import Enum
+from typing import Iterable, Iterator, List
+
+from bson import ObjectId
+
+from app.order.filters import get_field
+from app.order.schema import PurchaseOrder, RentalOrder, SalesOrder, ServiceOrder
+from app.responses import dump_json
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+# Path segment of the list endpoints -> (collection, response model)
+EXPORT_ORDER_TYPES = {
+    "rentals": ("rental_orders", RentalOrder),
+    "sales": ("sales_orders", SalesOrder),
+    "service": ("service_orders", ServiceOrder),
+    "purchase": ("purchase_orders", PurchaseOrder),
+}
+
+
+def default_columns(model) -> List[str]:
+    """Top-level fields of ``model`` (by alias), used when no columns are requested."""
+    return [field.alias or name for name, field in model.model_fields.items()]
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (dict, list)):
+        return dump_json(value).decode()
+    return value
+
+
+def _chunks(documents: Iterable[dict], chunk_size: int, render) -> Iterator[bytes]:
+    """Render documents and yield them ``chunk_size`` at a time so only one chunk
+    is held in memory and the response is not written one row per thread hop."""
+    lines = []
+    for document in documents:
+        lines.append(render(document))
+        if len(lines) >= chunk_size:
+            yield b"".join(lines)
+            lines = []
+    if lines:
+        yield b"".join(lines)
+
+
+def ndjson_stream(documents: Iterable[dict], chunk_size: int) -> Iterator[bytes]:
+    """One JSON document per line."""
+    return _chunks(documents, chunk_size, lambda document: dump_json(document) + b"\n")
+
+
+def csv_stream(documents: Iterable[dict], columns: List[str], chunk_size: int) -> Iterator[bytes]:
+    """CSV with a header row; ``columns`` may be dotted paths (e.g. customer.name),
+    nested objects and lists are written as JSON."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def render(row: list) -> bytes:
+        writer.writerow(row)
+        line = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    yield render(columns)
+    yield from _chunks(
+        documents,
+        chunk_size,
+        lambda document: render(
+            [_csv_value(get_field(document, column)) for column in columns]
+        ),
+    )
@@ -1,6 +1,9 @@
+import base64
 from typing import Any, Dict, Optional
 from datetime import datetime
 
+from bson import json_util
+
 
 class SortBuilder:
     """
@@ -228,3 +231,137 @@ class PaginationParams:
     def to_dict(self) -> Dict[str, int]:
         """Return as dictionary."""
         return {"skip": self.skip, "limit": self.limit}
+
+
+def get_field(document: dict, field: str) -> Any:
+    """Value of a dotted field path (e.g. "customer.name") in ``document``, or None
+    if any part of the path is missing."""
+    value = document
+    for part in field.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def check_projection_fields(fields: list):
+    """
+    Raise ValueError if one field is a dotted path inside another (e.g. "customer"
+    and "customer.name"), which MongoDB rejects as a projection path collision.
+    """
+    for field in fields:
+        for other in fields:
+            if other.startswith(field + "."):
+                raise ValueError(f"Fields '{field}' and '{other}' overlap; choose one of them")
+
+
+class KeysetPagination:
+    """
+    Cursor (keyset) pagination on top of a SortBuilder sort specification.
+
+    Instead of skipping N documents, the next page is requested with an opaque
+    ``after`` token that encodes the sort values of the last document returned.
+    The token is turned into a range filter, so every page costs the same no
+    matter how deep it is. ``_id`` is always appended to the sort as a
+    tie-breaker, which keeps the order stable under concurrent inserts.
+    """
+
+    TIE_BREAKER = "_id"
+
+    @staticmethod
+    def with_tie_breaker(sort_spec: Optional[list] = None) -> list:
+        """
+        Append ``_id`` to the sort specification unless it is already there.
+        The tie-breaker follows the direction of the last sort field.
+
+        Example:
+            [("order_id", -1)] -> [("order_id", -1), ("_id", -1)]
+        """
+        sort_spec = list(sort_spec or [])
+        if any(field == KeysetPagination.TIE_BREAKER for field, _ in sort_spec):
+            return sort_spec
+
+        direction = sort_spec[-1][1] if sort_spec else 1
+        return sort_spec + [(KeysetPagination.TIE_BREAKER, direction)]
+
+    @staticmethod
+    def encode_cursor(document: dict, sort_spec: list) -> str:
+        """Encode the sort values of ``document`` into an opaque, URL-safe token."""
+        token = {
+            "s": [[field, direction] for field, direction in sort_spec],
+            "v": [get_field(document, field) for field, _ in sort_spec],
+        }
+        return base64.urlsafe_b64encode(json_util.dumps(token).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str, sort_spec: list) -> list:
+        """
+        Decode a token produced by ``encode_cursor`` and return its sort values.
+        Raises ValueError if the token is malformed or was issued for another sort.
+        """
+        try:
+            token = json_util.loads(base64.urlsafe_b64decode(cursor.encode()))
+            token_sort = [(field, direction) for field, direction in token["s"]]
+            values = token["v"]
+        except Exception:
+            raise ValueError("Invalid pagination cursor")
+
+        if token_sort != list(sort_spec) or len(values) != len(sort_spec):
+            raise ValueError("Pagination cursor does not match the requested sort")
+
+        return values
+
+    @staticmethod
+    def _after(field: str, direction: int, value: Any) -> Optional[Dict[str, Any]]:
+        """Condition for documents strictly after ``value`` (MongoDB sorts null first)."""
+        if value is None:
+            return {field: {"$ne": None}} if direction == 1 else None
+        if direction == 1:
+            return {field: {"$gt": value}}
+        return {"$or": [{field: {"$lt": value}}, {field: None}]}
+
+    @staticmethod
+    def build_cursor_filter(sort_spec: list, values: list) -> Dict[str, Any]:
+        """
+        Build the range filter that selects documents after the cursor position.
+
+        Example:
+            sort_spec = [("created_at", -1), ("_id", -1)], values = [t, id]
+            -> {"$or": [{"created_at": {"$lt": t}},
+                        {"created_at": t, "_id": {"$lt": id}}]}
+        """
+        branches = []
+        for i, (field, direction) in enumerate(sort_spec):
+            after = KeysetPagination._after(field, direction, values[i])
+            if after is None:
+                continue
+
+            equal = {sort_spec[j][0]: values[j] for j in range(i)}
+            branches.append({"$and": [equal, after]} if equal else after)
+
+        return {"$or": branches} if branches else {KeysetPagination.TIE_BREAKER: None}
+
+    @staticmethod
+    def apply(
+        filters: Dict[str, Any], sort_spec: Optional[list], after: Optional[str]
+    ) -> tuple:
+        """
+        Return the (filters, sort_spec) to query with for a keyset page.
+        Raises ValueError for an invalid ``after`` token.
+        """
+        sort_spec = KeysetPagination.with_tie_breaker(sort_spec)
+        if not after:
+            return filters, sort_spec
+
+        values = KeysetPagination.decode_cursor(after, sort_spec)
+        cursor_filter = KeysetPagination.build_cursor_filter(sort_spec, values)
+        if filters:
+            return {"$and": [filters, cursor_filter]}, sort_spec
+        return cursor_filter, sort_spec
+
+    @staticmethod
+    def next_cursor(documents: list, sort_spec: list, limit: int) -> Optional[str]:
+        """Return the token for the next page, or None if this was the last page."""
+        if limit <= 0 or len(documents) < limit:
+            return None
+        return KeysetPagination.encode_cursor(documents[-1], sort_spec)
@@ -1,8 +1,38 @@
+from datetime import datetime, timedelta
 from bson.objectid import ObjectId
 from pymongo.database import Database
 from typing import Dict, Any, Optional
 
-from app.order.schema import RentalOrder, SalesOrder, ServiceOrder, PurchaseOrder
+from app.order.schema import (
+    PaymentStatus,
+    RentalOrder,
+    SalesOrder,
+    ServiceOrder,
+    PurchaseOrder,
+)
+from app.order.utils import calculate_order_amounts
+
+
+def with_due_date(payload: dict) -> dict:
+    """Store when a rental falls due (out_date + rental_duration days) so overdue
+    rentals can be found with an indexed range query."""
+    out_date = payload.get("out_date")
+    payload["due_date"] = (
+        out_date + timedelta(days=payload.get("rental_duration") or 0)
+        if out_date
+        else None
+    )
+    return payload
+
+
+def with_amounts(payload: dict) -> dict:
+    """Store subtotal, gst_amount and final_amount (see calculate_order_amounts) so
+    they can be filtered and sorted on with an index."""
+    amounts = calculate_order_amounts(payload)
+    payload["subtotal"] = amounts["subtotal"]
+    payload["gst_amount"] = amounts["gst_amount"]
+    payload["final_amount"] = amounts["final_amount"]
+    return payload
 
 
 class OrderRepository:
@@ -13,23 +43,36 @@ class OrderRepository:
     # RENTAL ORDERS
     # ----------------------------
 
-    def create_rental_order(self, order: RentalOrder):
-        payload = order.model_dump(exclude=["id"], by_alias=True)
-        result = self.database["rental_orders"].insert_one(payload)
-        return self.get_rental_order_by_id(order_id=result.inserted_id)
+    def create_rental_order(
+        self, order: RentalOrder, stock_reserved: bool = False, session=None
+    ):
+        payload = with_amounts(
+            with_due_date(order.model_dump(exclude=["id"], by_alias=True))
+        )
+        # Orders created before stock reservation existed never took stock out,
+        # so only orders flagged here have their stock given back later.
+        payload["stock_reserved"] = stock_reserved
+        result = self.database["rental_orders"].insert_one(payload, session=session)
+        return self.get_rental_order_by_id(order_id=result.inserted_id, session=session)
 
-    def update_rental_order(self, order_id: str, order: RentalOrder):
-        payload = order.model_dump(exclude=["id"], by_alias=True)
+    def update_rental_order(self, order_id: str, order: RentalOrder, session=None):
+        payload = with_amounts(
+            with_due_date(order.model_dump(exclude=["id"], by_alias=True))
+        )
         self.database["rental_orders"].update_one(
-            {"_id": ObjectId(order_id)}, {"$set": payload}
+            {"_id": ObjectId(order_id)}, {"$set": payload}, session=session
         )
-        return self.get_rental_order_by_id(order_id=order_id)
+        return self.get_rental_order_by_id(order_id=order_id, session=session)
 
-    def get_rental_order_by_id(self, order_id: str):
-        return self.database["rental_orders"].find_one({"_id": ObjectId(order_id)})
+    def get_rental_order_by_id(self, order_id: str, session=None):
+        return self.database["rental_orders"].find_one(
+            {"_id": ObjectId(order_id)}, session=session
+        )
 
-    def delete_rental_order_by_id(self, order_id: str):
-        result = self.database["rental_orders"].delete_one({"_id": ObjectId(order_id)})
+    def delete_rental_order_by_id(self, order_id: str, session=None):
+        result = self.database["rental_orders"].delete_one(
+            {"_id": ObjectId(order_id)}, session=session
+        )
         return result.deleted_count
 
     def get_rental_orders(
@@ -49,6 +92,55 @@ class OrderRepository:
             cursor = cursor.limit(limit)
         return list(cursor)
 
+    def get_expired_rental_orders(
+        self,
+        now: datetime,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_spec: Optional[list] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ):
+        """Get pending rental orders whose due_date has passed. limit=0 means retrieve all.
+
+        Orders written before due_date existed are matched by computing it on the fly.
+        """
+        query = {
+            "status": PaymentStatus.PENDING.value,
+            "$or": [
+                {"due_date": {"$lt": now}},
+                {
+                    # Without an out_date there is no due date ($dateAdd gives null)
+                    "due_date": {"$exists": False},
+                    "out_date": {"$ne": None},
+                    "$expr": {
+                        "$lt": [
+                            {
+                                "$dateAdd": {
+                                    "startDate": "$out_date",
+                                    "unit": "day",
+                                    "amount": {"$ifNull": ["$rental_duration", 0]},
+                                }
+                            },
+                            now,
+                        ]
+                    },
+                },
+            ],
+        }
+        if filters:
+            query = {"$and": [query, filters]}
+
+        cursor = self.database["rental_orders"].find(query)
+        if sort_spec:
+            cursor = cursor.sort(sort_spec)
+        cursor = cursor.skip(skip)
+        if limit > 0:
+            cursor = cursor.limit(limit)
+        return list(cursor)
+
+    def aggregate_rental_orders(self, pipeline: list):
+        return list(self.database["rental_orders"].aggregate(pipeline))
+
     def update_rental_orders_contact_info(self, contact_id: str, customer: object):
         self.database["rental_orders"].update_many(
             {"customer._id": contact_id},
@@ -66,6 +158,22 @@ class OrderRepository:
             },
         )
 
+    def iter_orders(
+        self,
+        collection_name: str,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_spec: Optional[list] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ):
+        """Cursor over every matching order, fetched ``batch_size`` documents at a time."""
+        cursor = self.database[collection_name].find(
+            filters or {}, projection, batch_size=batch_size
+        )
+        if sort_spec:
+            cursor = cursor.sort(sort_spec)
+        return cursor
+
     def get_orders_with_invoice_ids(self, order_type: str = "rental") -> list:
         """Get all orders that have invoice IDs (for invoice generation)."""
         collection = self.database[f"{order_type}_orders"]
@@ -154,20 +262,24 @@ class OrderRepository:
     # PURCHASE ORDERS
     # ----------------------------
 
-    def create_purchase_order(self, order: "PurchaseOrder"):
+    def create_purchase_order(self, order: "PurchaseOrder", session=None):
         payload = order.model_dump(exclude=["id"], by_alias=True)
-        result = self.database["purchase_orders"].insert_one(payload)
-        return self.get_purchase_order_by_id(order_id=str(result.inserted_id))
+        result = self.database["purchase_orders"].insert_one(payload, session=session)
+        return self.get_purchase_order_by_id(
+            order_id=str(result.inserted_id), session=session
+        )
 
-    def update_purchase_order(self, order_id: str, order: "PurchaseOrder"):
+    def update_purchase_order(self, order_id: str, order: "PurchaseOrder", session=None):
         payload = order.model_dump(exclude=["id"], by_alias=True)
         self.database["purchase_orders"].update_one(
-            {"_id": ObjectId(order_id)}, {"$set": payload}
+            {"_id": ObjectId(order_id)}, {"$set": payload}, session=session
         )
-        return self.get_purchase_order_by_id(order_id=order_id)
+        return self.get_purchase_order_by_id(order_id=order_id, session=session)
 
-    def get_purchase_order_by_id(self, order_id: str):
-        return self.database["purchase_orders"].find_one({"_id": ObjectId(order_id)})
+    def get_purchase_order_by_id(self, order_id: str, session=None):
+        return self.database["purchase_orders"].find_one(
+            {"_id": ObjectId(order_id)}, session=session
+        )
 
     def delete_purchase_order_by_id(self, order_id: str):
         result = self.database["purchase_orders"].delete_one(
@@ -1,18 +1,63 @@
 from datetime import datetime, timezone
 from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
-from app.config import database
+from app.config import database, env
 from app.order.order_repository import OrderRepository
-from app.order.schema import RentalOrder
+from app.order.schema import (
+    PaymentStatus,
+    PurchaseOrder,
+    RentalOrder,
+    SalesOrder,
+    ServiceOrder,
+)
 from app.product.product_repository import ProductRepository
-from app.product.schema import ProductResponse
+from app.product.schema import ProductType
 from app.product_category.product_category_repository import ProductCategoryRepository
-from app.product_category.schema import ProductCategory
+from app.rollup.rollup_repository import RollupRepository
+from app.rollup.rollup_service import RollupService
 from app.unit.schema import Unit, UnitResponse
 from app.unit.unit_repository import UnitRepository
 from fastapi import HTTPException
 
 
+class InsufficientStockError(Exception):
+    """Raised when a rental needs more of a product than is in stock."""
+
+    def __init__(self, product_id: str, quantity: int):
+        self.product_id = product_id
+        self.quantity = quantity
+        super().__init__(
+            f"Not enough stock for product {product_id} (requested {quantity})"
+        )
+
+
+def rental_stock_holdings(order: dict) -> dict:
+    """Quantity of each product a rental order currently keeps out of stock.
+
+    Rental lines are held until they are returned (the line's or the order's
+    in_date is set); other lines (e.g. sales items) are consumed and stay held.
+    Cancelled orders hold nothing.
+    """
+    holdings = {}
+    if not order or order.get("status") == PaymentStatus.CANCELLED:
+        return holdings
+
+    order_returned = bool(order.get("in_date"))
+    for line in order.get("product_details", []):
+        product_id = str(line.get("_id") or "")
+        if not ObjectId.is_valid(product_id):
+            continue
+        returned = order_returned or bool(line.get("in_date"))
+        if returned and line.get("type", ProductType.RENTAL) == ProductType.RENTAL:
+            continue
+        holdings[product_id] = holdings.get(product_id, 0) + int(
+            line.get("order_quantity") or 0
+        )
+    return holdings
+
+
 class OrderService:
     def __init__(
         self,
@@ -20,6 +65,7 @@ class OrderService:
         product_repository: ProductRepository = None,
         product_category_repository=None,
         unit_repository=None,
+        rollup_service: RollupService = None,
     ):
         self.repository = order_repository
         self.product_repository = product_repository or ProductRepository(
@@ -29,61 +75,122 @@ class OrderService:
             product_category_repository or ProductCategoryRepository(database=database)
         )
         self.unit_repository = unit_repository or UnitRepository(database=database)
+        self.rollup_service = rollup_service or RollupService(
+            RollupRepository(database=order_repository.database)
+        )
 
-    def process_purchase_products(self, purchase_products: list):
+    def _purchase_product_upsert(self, product_id: str, product, quantity: int) -> UpdateOne:
+        """Increment the stock of a purchased product, creating the product if it does
+        not exist yet (with the line's details and ``quantity`` in stock)."""
+        return UpdateOne(
+            {"_id": ObjectId(product_id)},
+            {
+                "$inc": {"quantity": quantity, "available_stock": quantity},
+                "$setOnInsert": self.product_repository.purchase_product_fields(
+                    name=product.name,
+                    product_code=product.product_code,
+                    category_id=str(product.category.id),
+                    unit_id=str(product.unit.id),
+                    type_str=product.type.value,
+                    rent_per_unit=float(product.rent_per_unit),
+                    price=float(product.price),
+                    gst_percentage=float(product.gst_percentage),
+                    profit=float(product.profit),
+                    profit_type=product.profit_type.value,
+                ),
+            },
+            upsert=True,
+        )
+
+    def _apply_purchase_product_operations(
+        self, operations: list, outcomes: list, session=None
+    ) -> list:
+        """Run the stock operations as one bulk write and fill in per-line outcomes.
+
+        ``operations`` holds (outcome index, operation) pairs. Lines created by an
+        upsert are reported as "created". Outside a transaction a failed write marks
+        its line "failed" and the lines after it "skipped"; inside a transaction the
+        error is raised so the whole transaction is aborted.
+        """
+        try:
+            result = self.product_repository.bulk_write_products(
+                [operation for _, operation in operations], session=session
+            )
+            upserted = set(result.upserted_ids) if result else set()
+            failed_index, error = None, None
+        except BulkWriteError as e:
+            if session:
+                raise
+            upserted = {upsert["index"] for upsert in e.details.get("upserted", [])}
+            write_error = e.details["writeErrors"][0]
+            failed_index, error = write_error["index"], write_error["errmsg"]
+            print(f"Failed to update purchase product stock: {error}")
+
+        for op_index, (outcome_index, _) in enumerate(operations):
+            outcome = outcomes[outcome_index]
+            if failed_index is not None and op_index == failed_index:
+                outcome["action"] = "failed"
+                outcome["error"] = error
+            elif failed_index is not None and op_index > failed_index:
+                outcome["action"] = "skipped"
+            elif op_index in upserted:
+                outcome["action"] = "created"
+        return outcomes
+
+    def process_purchase_products(self, purchase_products: list, session=None) -> list:
         """Process products in a purchase order.
         If product exists in database, increment its quantity.
         If product doesn't exist, create a new product.
 
+        All lines are written with a single bulk write of upserts.
+
         Args:
             purchase_products: List of PurchaseOrderProduct objects
+            session: Optional session to run the writes in a transaction
+
+        Returns:
+            One outcome dict per line: product_id, name, quantity_delta and action
+            ("created" or "incremented", or "failed"/"skipped" on a write error)
         """
+        operations = []
+        outcomes = []
         for product in purchase_products:
-            product_id = product.id
+            product_id = str(product.id) if product.id else str(ObjectId())
             quantity = int(product.quantity)
 
-            if product_id:
-                # Try to get the product from database
-                existing_product = self.product_repository.get_product_by_id(
-                    product_id=str(product_id)
-                )
-                if existing_product:
-                    # Product exists, increment quantity
-                    self.product_repository.increment_product_quantity(
-                        product_id=str(product_id), quantity=quantity
-                    )
-                else:
-                    # Product ID provided but doesn't exist, create it
-                    self.product_repository.create_product_from_purchase(
-                        name=product.name,
-                        product_code=product.product_code,
-                        category_id=str(product.category.id),
-                        unit_id=str(product.unit.id),
-                        type_str=product.type.value,
-                        rent_per_unit=float(product.rent_per_unit),
-                        quantity=quantity,
-                        price=float(product.price),
-                    )
-            else:
-                # New product, create it
-                self.product_repository.create_product_from_purchase(
-                    name=product.name,
-                    product_code=product.product_code,
-                    category_id=str(product.category.id),
-                    unit_id=str(product.unit.id),
-                    type_str=product.type.value,
-                    rent_per_unit=float(product.rent_per_unit),
-                    quantity=quantity,
-                    price=float(product.price),
-                )
+            operations.append(
+                (len(outcomes), self._purchase_product_upsert(product_id, product, quantity))
+            )
+            outcomes.append(
+                {
+                    "product_id": product_id,
+                    "name": product.name,
+                    "quantity_delta": quantity,
+                    "action": "incremented",
+                }
+            )
 
-    def process_purchase_products_update(self, old_products: list, new_products: list):
+        return self._apply_purchase_product_operations(operations, outcomes, session)
+
+    def process_purchase_products_update(
+        self, old_products: list, new_products: list, session=None
+    ) -> list:
         """Process product quantity changes during purchase order update.
         Compare old and new products to calculate quantity deltas.
 
+        Existing products are looked up with one batched query, then every change
+        (stock deltas, GST percentage updates, new products) is applied with a
+        single bulk write.
+
         Args:
             old_products: List of old product dicts from existing purchase order
             new_products: List of new PurchaseOrderProduct objects
+            session: Optional session to run the writes in a transaction
+
+        Returns:
+            One outcome dict per line: product_id, name, quantity_delta and action
+            ("created", "incremented", "gst_updated" or "unchanged", or
+            "failed"/"skipped" on a write error)
         """
         # Create a map of old product IDs to quantities
         old_product_map = {}
@@ -92,178 +199,297 @@ class OrderService:
             if product_id:
                 old_product_map[product_id] = int(old_product.get("quantity", 0))
 
-        # Process new products
+        # One batched existence check for every line
+        existing_products = {
+            str(product["_id"]): product
+            for product in self.product_repository.get_products_by_ids(
+                [str(product.id) for product in new_products if product.id],
+                projection={"gst_percentage": 1},
+                session=session,
+            )
+        }
+
+        operations = []
+        outcomes = []
         for new_product in new_products:
-            product_id = str(new_product.id) if new_product.id else None
+            product_id = str(new_product.id) if new_product.id else str(ObjectId())
             new_quantity = int(new_product.quantity)
-
-            if product_id:
-                # Try to get the product from database
-                existing_product = self.product_repository.get_product_by_id(
-                    product_id=product_id
-                )
-                if existing_product:
-                    # Product exists, calculate and apply quantity delta
-                    old_quantity = old_product_map.get(product_id, 0)
-                    quantity_delta = new_quantity - old_quantity
-                    try:
-                        if (
-                            existing_product.get("gst_percentage") is None
-                            or existing_product.get("gst_percentage")
-                            != new_product.gst_percentage
-                        ):
-                            existing_product["gst_percentage"] = float(
-                                new_product.gst_percentage
-                            )
-                            existing_product["category"] = ProductCategory(
-                                **self.product_category_repository.get_product_category_by_id(
-                                    product_category_id=existing_product["category"]
-                                )
-                            )
-                            existing_product["unit"] = Unit(
-                                **self.unit_repository.get_unit_by_id(
-                                    unit_id=existing_product["unit"]
-                                )
-                            )
-                            try:
-                                self.product_repository.update_product(
-                                    product_id=product_id,
-                                    product=ProductResponse(**existing_product),
-                                )
-                            except Exception as e:
-                                print(
-                                    f"Failed to update product GST percentage: {str(e)}"
-                                )
-
-                        if quantity_delta > 0:
-                            # Increase quantity
-                            self.product_repository.increment_product_quantity(
-                                product_id=product_id, quantity=quantity_delta
-                            )
-                        elif quantity_delta < 0:
-                            # Decrease quantity
-                            self.product_repository.increment_product_quantity(
-                                product_id=product_id, quantity=quantity_delta
-                            )
-                        # If delta is 0, no change needed
-                    except Exception as e:
-                        print(f"Failed to update product quantity: {str(e)}")
-                else:
-                    # Product ID provided but doesn't exist, create it
-                    self.product_repository.create_product_from_purchase(
-                        name=new_product.name,
-                        product_code=new_product.product_code,
-                        category_id=str(new_product.category.id),
-                        unit_id=str(new_product.unit.id),
-                        type_str=new_product.type.value,
-                        rent_per_unit=float(new_product.rent_per_unit),
-                        quantity=new_quantity,
-                        price=float(new_product.price),
-                        gst_percentage=float(new_product.gst_percentage),
-                        profit=float(new_product.profit),
-                        profit_type=new_product.profit_type.value,
-                        product_id=product_id,
+            existing_product = existing_products.get(product_id)
+
+            if not existing_product:
+                # Product doesn't exist, create it with the full quantity
+                operations.append(
+                    (
+                        len(outcomes),
+                        self._purchase_product_upsert(product_id, new_product, new_quantity),
                     )
+                )
+                outcomes.append(
+                    {
+                        "product_id": product_id,
+                        "name": new_product.name,
+                        "quantity_delta": new_quantity,
+                        "action": "created",
+                    }
+                )
+                continue
+
+            # Product exists, calculate and apply quantity delta
+            quantity_delta = new_quantity - old_product_map.get(product_id, 0)
+            update = {}
+            if quantity_delta:
+                update["$inc"] = {
+                    "quantity": quantity_delta,
+                    "available_stock": quantity_delta,
+                }
+            if existing_product.get("gst_percentage") != new_product.gst_percentage:
+                update["$set"] = {"gst_percentage": float(new_product.gst_percentage)}
+
+            if quantity_delta:
+                action = "incremented"
+            elif update:
+                action = "gst_updated"
             else:
-                # New product, create it
-                self.product_repository.create_product_from_purchase(
-                    name=new_product.name,
-                    product_code=new_product.product_code,
-                    category_id=str(new_product.category.id),
-                    unit_id=str(new_product.unit.id),
-                    type_str=new_product.type.value,
-                    rent_per_unit=float(new_product.rent_per_unit),
-                    quantity=new_quantity,
-                    price=float(new_product.price),
-                    gst_percentage=float(new_product.gst_percentage),
-                    profit=float(new_product.profit),
-                    profit_type=new_product.profit_type.value,
-                    product_id=str(new_product.id) if new_product.id else None,
+                action = "unchanged"
+
+            if update:
+                operations.append(
+                    (len(outcomes), UpdateOne({"_id": ObjectId(product_id)}, update))
                 )
+            outcomes.append(
+                {
+                    "product_id": product_id,
+                    "name": new_product.name,
+                    "quantity_delta": quantity_delta,
+                    "action": action,
+                }
+            )
+
+        return self._apply_purchase_product_operations(operations, outcomes, session)
+
+    def _run_in_transaction(self, write):
+        """Call ``write(session)`` inside a multi-document transaction when
+        MONGO_TRANSACTIONS is enabled (requires a replica set), else without one."""
+        if not env.mongo_transactions:
+            return write(None)
+
+        with self.repository.database.client.start_session() as session:
+            return session.with_transaction(write)
+
+    def create_purchase_order_with_products(self, order: PurchaseOrder, products: list):
+        """Apply the purchase's stock changes and insert the purchase order.
+
+        Returns:
+            (created purchase order document, per-line stock outcomes)
+        """
+
+        def write(session):
+            outcomes = self.process_purchase_products(products, session=session)
+            order_data = self.repository.create_purchase_order(order=order, session=session)
+            return order_data, outcomes
+
+        return self._run_in_transaction(write)
+
+    def update_purchase_order_with_products(
+        self, order_id: str, order: PurchaseOrder, old_products: list, products: list
+    ):
+        """Apply the stock deltas between the old and new lines and update the order.
+
+        Returns:
+            (updated purchase order document, per-line stock outcomes)
+        """
+
+        def write(session):
+            outcomes = self.process_purchase_products_update(
+                old_products, products, session=session
+            )
+            order_data = self.repository.update_purchase_order(
+                order_id=order_id, order=order, session=session
+            )
+            return order_data, outcomes
+
+        return self._run_in_transaction(write)
 
     def create_rental_order_with_invoice(self, order: RentalOrder):
-        """Create rental order with automatic invoice ID generation for PAID status."""
+        """Create rental order with automatic invoice ID generation for PAID status.
+
+        The order and invoice numbers are only taken once the rented quantities have
+        been reserved, so an order that is short of stock does not use them up.
+        """
         from app.order.utils import generate_invoice_id, generate_order_id
         from app.order.schema import PaymentStatus
 
-        # Auto-generate order ID if it's empty or None
-        if not order.order_id or order.order_id == "":
-            order.order_id = generate_order_id(self.repository.database, order.branch)
+        holdings = rental_stock_holdings(order.model_dump(by_alias=True))
+
+        # Take the rented quantities out of stock together with the insert
+        def write(session):
+            self._adjust_rental_stock({}, holdings, session)
+            # The numbers are set on the order, so a retried transaction reuses them
+            try:
+                # Auto-generate order ID if it's empty or None
+                if not order.order_id or order.order_id == "":
+                    order.order_id = generate_order_id(
+                        self.repository.database, order.branch
+                    )
 
-        # Auto-generate invoice ID if status is PAID and no invoice ID is set
-        if order.status == PaymentStatus.PAID and not order.invoice_id:
-            order.invoice_id = generate_invoice_id(
-                self.repository.database, order.branch, order.billing_mode
-            )
-            order.invoice_date = datetime.now(timezone.utc)
+                # Auto-generate invoice ID if status is PAID and no invoice ID is set
+                if order.status == PaymentStatus.PAID and not order.invoice_id:
+                    order.invoice_id = generate_invoice_id(
+                        self.repository.database, order.branch, order.billing_mode
+                    )
+                    order.invoice_date = datetime.now(timezone.utc)
 
-        # Proceed with normal order creation
-        return self.repository.create_rental_order(order)
+                order_data = self.repository.create_rental_order(
+                    order, stock_reserved=True, session=session
+                )
+            except Exception:
+                # Without a transaction nothing rolls the reservation back
+                if not session:
+                    self.product_repository.release_stock(holdings)
+                raise
+            self._update_rollups(None, order_data, session)
+            return order_data
+
+        return self._run_in_transaction(write)
 
     def update_rental_order_with_invoice(self, order_id: str, order: RentalOrder):
         """Update rental order with automatic invoice ID generation when status changes to PAID 
-        or when in_date is set with PAID status (indicating items returned and payment complete)."""
+        or when in_date is set with PAID status (indicating items returned and payment complete).
+
+        As on create, the invoice number is only taken once the stock change went through.
+        """
         from app.order.utils import generate_invoice_id
         from app.order.schema import PaymentStatus
 
-        # Get existing order to check status change and in_date change
-        existing_order = self.repository.get_rental_order_by_id(order_id)
-        if existing_order:
-            old_status = existing_order.get("status")
-            old_in_date = existing_order.get("in_date")
-            
-            # Auto-generate invoice ID in two scenarios:
-            # 1. Status changed to PAID
-            # 2. in_date is now set (items returned) and status is PAID (payment complete)
-            if not order.invoice_id and not existing_order.get("invoice_id", ""):
-                # Case 1: Status changed to PAID
-                if (
-                    order.status == PaymentStatus.PAID
-                    and old_status != PaymentStatus.PAID
-                ):
-                    order.invoice_id = generate_invoice_id(
-                        self.repository.database, order.branch, order.billing_mode
-                    )
-                    order.invoice_date = datetime.now(timezone.utc)
-                # Case 2: in_date is now set (items returned) and status is PAID (payment complete)
-                elif (
-                    order.status == PaymentStatus.PAID
-                    and order.in_date
-                    and not old_in_date
+        # Move stock by the difference between what the order held and now holds
+        # (returned lines come back, added/increased lines are reserved)
+        def write(session):
+            current_order = self.repository.get_rental_order_by_id(
+                order_id, session=session
+            )
+            if current_order and current_order.get("stock_reserved"):
+                self._adjust_rental_stock(
+                    rental_stock_holdings(current_order),
+                    rental_stock_holdings(order.model_dump(by_alias=True)),
+                    session,
+                )
+
+            # Auto-generate an invoice ID for a PAID order that has none yet: the
+            # status changed to PAID, or the items were returned (in_date set) with
+            # the payment complete. Set on the order, so a retried transaction
+            # reuses the same number.
+            if (
+                current_order
+                and order.status == PaymentStatus.PAID
+                and not order.invoice_id
+                and not current_order.get("invoice_id", "")
+            ):
+                order.invoice_id = generate_invoice_id(
+                    self.repository.database, order.branch, order.billing_mode
+                )
+                order.invoice_date = datetime.now(timezone.utc)
+
+            order_data = self.repository.update_rental_order(
+                order_id=order_id, order=order, session=session
+            )
+            self._update_rollups(current_order, order_data, session)
+            return order_data
+
+        return self._run_in_transaction(write)
+
+    def delete_rental_order(self, order_id: str):
+        """Delete a rental order, giving back any stock it still holds."""
+
+        def write(session):
+            current_order = self.repository.get_rental_order_by_id(
+                order_id, session=session
+            )
+            if current_order and current_order.get("stock_reserved"):
+                self._adjust_rental_stock(
+                    rental_stock_holdings(current_order), {}, session
+                )
+            deleted_count = self.repository.delete_rental_order_by_id(
+                order_id=order_id, session=session
+            )
+            if deleted_count:
+                self._update_rollups(current_order, None, session)
+            return deleted_count
+
+        return self._run_in_transaction(write)
+
+    def _update_rollups(
+        self, old_order, new_order, session=None, order_type: str = "rental"
+    ):
+        """Keep daily_order_rollups in step with an order write.
+
+        Inside a transaction a failure aborts the write; otherwise it is only
+        logged (scripts/rebuild_daily_rollups.py repairs the rollups).
+        """
+        try:
+            self.rollup_service.apply_order_change(
+                old_order, new_order, order_type=order_type, session=session
+            )
+        except Exception as e:
+            if session:
+                raise
+            print(f"Failed to update daily order rollups: {e}")
+
+    def _adjust_rental_stock(self, old_holdings: dict, new_holdings: dict, session=None):
+        """Apply the stock difference between two rental holdings.
+
+        Increases are reserved product by product with a guarded $inc, so
+        available_stock never goes negative; decreases are released in one bulk
+        write. If a product is short, InsufficientStockError is raised: inside a
+        transaction this aborts everything, otherwise the reservations already
+        made here are given back first.
+
+        Raises:
+            InsufficientStockError: If a product does not have enough stock
+            HTTPException: If a product does not exist
+        """
+        reserved = {}
+        released = {}
+        # Sorted so concurrent orders touch products in the same order
+        for product_id in sorted(set(old_holdings) | set(new_holdings)):
+            delta = new_holdings.get(product_id, 0) - old_holdings.get(product_id, 0)
+            if delta < 0:
+                released[product_id] = -delta
+            elif delta > 0:
+                if not self.product_repository.reserve_stock(
+                    product_id, delta, session=session
                 ):
-                    order.invoice_id = generate_invoice_id(
-                        self.repository.database, order.branch, order.billing_mode
-                    )
-                    order.invoice_date = datetime.now(timezone.utc)
-                elif order.status == PaymentStatus.PAID:
-                    # Fallback: if status is PAID but no invoice_id was generated in Cases 1 & 2, generate now
-                    order.invoice_id = generate_invoice_id(
-                        self.repository.database, order.branch, order.billing_mode
-                    )
-                    order.invoice_date = datetime.now(timezone.utc)
+                    if not session:
+                        self.product_repository.release_stock(reserved)
+                    if not self.product_repository.get_products_by_ids(
+                        [product_id], projection={"_id": 1}, session=session
+                    ):
+                        raise HTTPException(
+                            status_code=404, detail=f"Product {product_id} not found"
+                        )
+                    raise InsufficientStockError(product_id, delta)
+                reserved[product_id] = delta
 
-        # Proceed with normal order update
-        return self.repository.update_rental_order(order_id=order_id, order=order)
+        self.product_repository.release_stock(released, session=session)
 
-    def create_sales_order_with_invoice(self, order):
+
+    def create_sales_order_with_invoice(self, order: SalesOrder):
         """Create sales order with automatic invoice ID generation for PAID status."""
         from app.order.utils import generate_invoice_id
         from app.order.schema import PaymentStatus
 
         # Auto-generate invoice ID if status is PAID and no invoice ID is set
-        if order.get("status") == PaymentStatus.PAID and not order.get("invoice_id"):
-            # Extract branch and billing_mode from order
-            order_branch = order.get("branch")
-            order_billing_mode = order.get("billing_mode")
-            order["invoice_id"] = generate_invoice_id(
-                self.repository.database, order_branch, order_billing_mode
+        if order.status == PaymentStatus.PAID and not order.invoice_id:
+            order.invoice_id = generate_invoice_id(
+                self.repository.database, order.branch, order.billing_mode
             )
-            order["invoice_date"] = datetime.now(timezone.utc)
+            order.invoice_date = datetime.now(timezone.utc)
 
         # Proceed with normal order creation
-        return self.repository.create_sales_order(order)
+        order_data = self.repository.create_sales_order(order)
+        self._update_rollups(None, order_data, order_type="sales")
+        return order_data
 
-    def update_sales_order_with_invoice(self, order_id: str, order):
+    def update_sales_order_with_invoice(self, order_id: str, order: SalesOrder):
         """Update sales order with automatic invoice ID generation when status changes to PAID."""
         from app.order.utils import generate_invoice_id
         from app.order.schema import PaymentStatus
@@ -274,41 +500,46 @@ class OrderService:
             old_status = existing_order.get("status")
             # Auto-generate invoice ID if status changed to PAID and no invoice ID exists
             if (
-                order.get("status") == PaymentStatus.PAID
+                order.status == PaymentStatus.PAID
                 and old_status != PaymentStatus.PAID
-                and not order.get("invoice_id")
+                and not order.invoice_id
                 and not existing_order.get("invoice_id")
             ):
-                # Extract branch and billing_mode from order
-                order_branch = order.get("branch")
-                order_billing_mode = order.get("billing_mode")
-                order["invoice_id"] = generate_invoice_id(
-                    self.repository.database, order_branch, order_billing_mode
+                order.invoice_id = generate_invoice_id(
+                    self.repository.database, order.branch, order.billing_mode
                 )
-                order["invoice_date"] = datetime.now(timezone.utc)
+                order.invoice_date = datetime.now(timezone.utc)
 
         # Proceed with normal order update
-        return self.repository.update_sales_order(order_id=order_id, order=order)
-
-    def create_service_order_with_invoice(self, order):
+        order_data = self.repository.update_sales_order(order_id=order_id, order=order)
+        self._update_rollups(existing_order, order_data, order_type="sales")
+        return order_data
+
+    def delete_sales_order(self, order_id: str):
+        current_order = self.repository.get_sales_order_by_id(order_id)
+        deleted_count = self.repository.delete_sales_order_by_id(order_id=order_id)
+        if deleted_count:
+            self._update_rollups(current_order, None, order_type="sales")
+        return deleted_count
+
+    def create_service_order_with_invoice(self, order: ServiceOrder):
         """Create service order with automatic invoice ID generation for PAID status."""
         from app.order.utils import generate_invoice_id
         from app.order.schema import PaymentStatus
 
         # Auto-generate invoice ID if status is PAID and no invoice ID is set
-        if order.get("status") == PaymentStatus.PAID and not order.get("invoice_id"):
-            # Extract branch and billing_mode from order
-            order_branch = order.get("branch")
-            order_billing_mode = order.get("billing_mode")
-            order["invoice_id"] = generate_invoice_id(
-                self.repository.database, order_branch, order_billing_mode
+        if order.status == PaymentStatus.PAID and not order.invoice_id:
+            order.invoice_id = generate_invoice_id(
+                self.repository.database, order.branch, order.billing_mode
             )
-            order["invoice_date"] = datetime.now(timezone.utc)
+            order.invoice_date = datetime.now(timezone.utc)
 
         # Proceed with normal order creation
-        return self.repository.create_service_order(order)
+        order_data = self.repository.create_service_order(order)
+        self._update_rollups(None, order_data, order_type="service")
+        return order_data
 
-    def update_service_order_with_invoice(self, order_id: str, order):
+    def update_service_order_with_invoice(self, order_id: str, order: ServiceOrder):
         """Update service order with automatic invoice ID generation when status changes to PAID 
         or when in_date is set with PAID status (indicating service completion and payment complete)."""
         from app.order.utils import generate_invoice_id
@@ -323,35 +554,38 @@ class OrderService:
             # Auto-generate invoice ID in two scenarios:
             # 1. Status changed to PAID
             # 2. in_date is now set (service completed) and status is PAID (payment complete)
-            if not order.get("invoice_id") and not existing_order.get("invoice_id"):
+            if not order.invoice_id and not existing_order.get("invoice_id"):
                 # Case 1: Status changed to PAID
                 if (
-                    order.get("status") == PaymentStatus.PAID
+                    order.status == PaymentStatus.PAID
                     and old_status != PaymentStatus.PAID
                 ):
-                    # Extract branch and billing_mode from order
-                    order_branch = order.get("branch")
-                    order_billing_mode = order.get("billing_mode")
-                    order["invoice_id"] = generate_invoice_id(
-                        self.repository.database, order_branch, order_billing_mode
+                    order.invoice_id = generate_invoice_id(
+                        self.repository.database, order.branch, order.billing_mode
                     )
-                    order["invoice_date"] = datetime.now(timezone.utc)
+                    order.invoice_date = datetime.now(timezone.utc)
                 # Case 2: in_date is now set (service completed) and status is PAID (payment complete)
                 elif (
-                    order.get("status") == PaymentStatus.PAID
-                    and order.get("in_date")
+                    order.status == PaymentStatus.PAID
+                    and order.in_date
                     and not old_in_date
                 ):
-                    # Extract branch and billing_mode from order
-                    order_branch = order.get("branch")
-                    order_billing_mode = order.get("billing_mode")
-                    order["invoice_id"] = generate_invoice_id(
-                        self.repository.database, order_branch, order_billing_mode
+                    order.invoice_id = generate_invoice_id(
+                        self.repository.database, order.branch, order.billing_mode
                     )
-                    order["invoice_date"] = datetime.now(timezone.utc)
+                    order.invoice_date = datetime.now(timezone.utc)
 
         # Proceed with normal order update
-        return self.repository.update_service_order(order_id=order_id, order=order)
+        order_data = self.repository.update_service_order(order_id=order_id, order=order)
+        self._update_rollups(existing_order, order_data, order_type="service")
+        return order_data
+
+    def delete_service_order(self, order_id: str):
+        current_order = self.repository.get_service_order_by_id(order_id)
+        deleted_count = self.repository.delete_service_order_by_id(order_id=order_id)
+        if deleted_count:
+            self._update_rollups(current_order, None, order_type="service")
+        return deleted_count
 
     def _ensure_unit_response(self, unit_input):
         if isinstance(unit_input, UnitResponse):
@@ -444,11 +678,13 @@ class OrderService:
                 updated_product_details.append(self._normalize_product_detail_unit(product_detail))
 
         # Update the rental order with synced product_details
+        previous_order = dict(rental_order)
         rental_order["product_details"] = updated_product_details
         updated_order = self.repository.update_rental_order(
             order_id=order_id,
             order=RentalOrder(**rental_order)
         )
+        self._update_rollups(previous_order, updated_order)
 
         return updated_order
 
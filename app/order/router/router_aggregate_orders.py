@@ -0,0 +1,53 @@
+from typing import List, Optional
+from fastapi import Depends, HTTPException, Query, status
+from pymongo.errors import OperationFailure
+
+from app.config import env
+from app.order.aggregations import (
+    SummaryDateField,
+    SummaryGroup,
+    SummaryPeriod,
+    rental_summary_pipeline,
+)
+from app.order.filters import FilterBuilder
+from app.order.order_service import OrderService, get_order_service
+from app.order.schema import RentalOrderSummary
+
+from . import router
+
+
+@router.get(
+    "/rentals/summary",
+    status_code=status.HTTP_200_OK,
+    response_model=List[RentalOrderSummary],
+)
+def get_rental_order_summary(
+    filter: Optional[List[str]] = Query(None, description="Filters as 'field:operator:value' or 'field:value'"),
+    group_by: Optional[List[SummaryGroup]] = Query(None, description="Group by branch, billing_mode and/or status"),
+    period: Optional[SummaryPeriod] = Query(None, description="Also group by day or month"),
+    date_field: SummaryDateField = Query(SummaryDateField.CREATED_AT, description="Date used for the period"),
+    timezone: str = Query(None, description="Timezone of the period buckets (defaults to REPORT_TIMEZONE)"),
+    svc: OrderService = Depends(get_order_service),
+) -> List[RentalOrderSummary]:
+    """
+    Revenue, discount, GST, e-way, damage and balance due totals of rental orders,
+    computed in MongoDB with the same formula as calculate_final_amount.
+    final_amount is the balance still due (after balance_paid).
+    """
+    filters = FilterBuilder.build_filters(filter) if filter else {}
+    pipeline = rental_summary_pipeline(
+        filters=filters,
+        group_by=group_by,
+        period=period,
+        date_field=date_field,
+        timezone=timezone or env.report_timezone,
+    )
+    try:
+        summary = svc.repository.aggregate_rental_orders(pipeline)
+    except OperationFailure as e:
+        print(f"Failed to aggregate rental orders: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Could not compute the rental order summary. Check the filters and timezone.",
+        )
+    return summary
@@ -1,9 +1,14 @@
 from typing import Optional
+from anyio import from_thread
 from fastapi import Depends, HTTPException, status, Form, File, UploadFile
 from pydantic_core import ValidationError
 import json
 
-from app.order.order_service import OrderService, get_order_service
+from app.order.order_service import (
+    InsufficientStockError,
+    OrderService,
+    get_order_service,
+)
 from app.order.schema import (
     Deposit,
     ProductDetails,
@@ -15,8 +20,7 @@ from app.order.schema import (
 )
 from app.product.schema import ProductResponse
 from app.contact.schema import ContactResponse
-from app.contact.utils import handle_upload, sanitize_filename
-from app.utils import env
+from app.contact.utils import file_url, handle_upload, sanitize_filename
 
 from . import router
 
@@ -29,7 +33,10 @@ def create_rental_order(
     payload: RentalOrder,
     svc: OrderService = Depends(get_order_service),
 ) -> RentalOrder:
-    order_data = svc.create_rental_order_with_invoice(order=payload)
+    try:
+        order_data = svc.create_rental_order_with_invoice(order=payload)
+    except InsufficientStockError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     if not order_data:
         error_message = (
             "The Rental Order is not created properly or not Found. Please try again"
@@ -150,12 +157,10 @@ def create_purchase_order(
     if invoice_pdf:
         try:
             pdf_filename = sanitize_filename(f"{order_id}.pdf")
-            handle_upload(
-                new_filename=pdf_filename,
-                file=invoice_pdf,
-                type="purchase",
-            )
-            invoice_pdf_path = f"{env.image_domain}/public/purchase/{pdf_filename}"
+            stored = from_thread.run(handle_upload, invoice_pdf, "purchase", pdf_filename)
+            invoice_pdf_path = file_url(stored.name, type="purchase")
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -176,9 +181,10 @@ def create_purchase_order(
         payload = PurchaseOrder(**payload_dict)
         
         # Process products - create new ones or increment existing
-        svc.process_purchase_products(products)
-        
-        order_data = svc.repository.create_purchase_order(order=payload)
+        order_data, outcomes = svc.create_purchase_order_with_products(
+            order=payload, products=products
+        )
+        print("purchase product stock updates: ", outcomes)
         if not order_data:
             error_message = (
                 "The Purchase order is not created properly. Please try again"
@@ -13,7 +13,7 @@ def delete_rental_order(
     id: str,
     svc: OrderService = Depends(get_order_service),
 ):
-    order_data = svc.repository.delete_rental_order_by_id(order_id=id)
+    order_data = svc.delete_rental_order(order_id=id)
     if order_data != 1:
         error_message = "The Order was not deleted. Please try again"
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
@@ -28,7 +28,7 @@ def delete_sales_order(
     id: str,
     svc: OrderService = Depends(get_order_service),
 ):
-    order_data = svc.repository.delete_sales_order_by_id(order_id=id)
+    order_data = svc.delete_sales_order(order_id=id)
     if order_data != 1:
         error_message = "The Order was not deleted. Please try again"
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
@@ -43,7 +43,7 @@ def delete_service_order(
     id: str,
     svc: OrderService = Depends(get_order_service),
 ):
-    order_data = svc.repository.delete_service_order_by_id(order_id=id)
+    order_data = svc.delete_service_order(order_id=id)
     if order_data != 1:
         error_message = "The Order was not deleted. Please try again"
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
@@ -0,0 +1,68 @@
+from typing import List, Optional
+from fastapi import Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.config import env
+from app.order.export import (
+    EXPORT_ORDER_TYPES,
+    ExportFormat,
+    csv_stream,
+    default_columns,
+    ndjson_stream,
+)
+from app.order.filters import FilterBuilder, SortBuilder, check_projection_fields
+from app.order.order_service import OrderService, get_order_service
+
+from . import router
+
+
+@router.get(
+    "/{type}/export",
+    status_code=status.HTTP_200_OK,
+)
+def export_orders(
+    type: str,
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="ndjson or csv"),
+    filter: Optional[List[str]] = Query(None, description="Filters as 'field:operator:value' or 'field:value'"),
+    sort: Optional[List[str]] = Query(None, description="Sort fields as 'field:asc' or 'field:desc'"),
+    columns: Optional[List[str]] = Query(None, description="Fields to export, dotted paths allowed (e.g. customer.name)"),
+    svc: OrderService = Depends(get_order_service),
+):
+    """Stream every matching order (no limit) as NDJSON or CSV."""
+    if type not in EXPORT_ORDER_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown order type '{type}'. Use one of: {', '.join(EXPORT_ORDER_TYPES)}",
+        )
+    collection_name, model = EXPORT_ORDER_TYPES[type]
+
+    filters = FilterBuilder.build_filters(filter) if filter else {}
+    sort_spec = SortBuilder.build_sort(sort) if sort else [("_id", 1)]
+    # Checked here: once the response has started streaming, errors can't be reported
+    if columns:
+        try:
+            check_projection_fields(columns)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    projection = {column: 1 for column in columns} if columns else None
+
+    cursor = svc.repository.iter_orders(
+        collection_name,
+        filters=filters,
+        sort_spec=sort_spec,
+        projection=projection,
+        batch_size=env.export_batch_size,
+    )
+
+    if format == ExportFormat.CSV:
+        content = csv_stream(cursor, columns or default_columns(model), env.export_batch_size)
+        media_type = "text/csv"
+    else:
+        content = ndjson_stream(cursor, env.export_batch_size)
+        media_type = "application/x-ndjson"
+
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{type}-orders.{format.value}"'},
+    )
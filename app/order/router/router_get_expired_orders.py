@@ -1,15 +1,12 @@
-from datetime import datetime, timedelta, timezone
-from typing import List
-from fastapi import Depends, HTTPException, status
+from datetime import datetime, timezone
+from typing import List, Optional
+from fastapi import Depends, HTTPException, Query, status
 from pydantic_core import ValidationError
 
 from app.order.order_service import OrderService, get_order_service
-from app.order.schema import (
-    Deposit,
-    PaymentStatus,
-    ProductDetails,
-    RentalOrder,
-)
+from app.order.filters import FilterBuilder, KeysetPagination, SortBuilder
+from app.order.schema import RentalOrder
+from app.responses import model_list_response
 
 from . import router
 
@@ -20,38 +17,41 @@ from . import router
     response_model=List[RentalOrder],
 )
 def get_rental_orders(
+    filter: Optional[List[str]] = Query(None, description="Filters as 'field:operator:value' or 'field:value'"),
+    sort: Optional[List[str]] = Query(["due_date:asc"], description="Sort fields as 'field:asc' or 'field:desc'"),
+    skip: int = Query(0, ge=0, description="Number of documents to skip"),
+    limit: int = Query(100, ge=0, le=1000, description="Number of documents to return (0 means all)"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     svc: OrderService = Depends(get_order_service),
 ) -> List[RentalOrder]:
-    order_data = svc.repository.get_rental_orders()
+    """Pending rental orders whose due date (out_date + rental_duration days) has passed."""
+    filters = FilterBuilder.build_filters(filter) if filter else {}
+    sort_spec = SortBuilder.build_sort(sort) if sort else None
+
+    # Keyset pagination: `after` replaces `skip` and `_id` keeps the order stable
+    try:
+        filters, sort_spec = KeysetPagination.apply(filters, sort_spec, after)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    order_data = svc.repository.get_expired_rental_orders(
+        now=datetime.now(timezone.utc),
+        filters=filters,
+        sort_spec=sort_spec,
+        skip=0 if after else skip,
+        limit=limit,
+    )
     if not order_data:
-        error_message = "No Rental Order Found. Please create new rental order"
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No expired rental orders found.",
+        )
+
+    next_cursor = KeysetPagination.next_cursor(order_data, sort_spec, limit)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
 
     try:
-        for order in order_data:
-            order["product_details"] = [
-                ProductDetails(**product_detail)
-                for product_detail in order["product_details"]
-            ]
-            order["deposits"] = [
-                Deposit(**product_detail) for product_detail in order["deposits"]
-            ]
-        order_data = [RentalOrder(**order) for order in order_data]
-
-        now = datetime.now(timezone.utc)
-        expired_orders = [
-            order
-            for order in order_data
-            if order.out_date and (order.out_date + timedelta(days=order.rental_duration)) < now and order.status == PaymentStatus.PENDING
-        ]
-
-        if not expired_orders:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No expired rental orders found.",
-            )
-
-        return expired_orders
+        return model_list_response(RentalOrder, order_data, headers=headers)
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
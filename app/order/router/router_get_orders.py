@@ -3,9 +3,9 @@ from fastapi import Depends, HTTPException, status, Query
 from pydantic_core import ValidationError
 
 from app.order.order_service import OrderService, get_order_service
-from app.order.schema import Deposit, ProductDetails, PurchaseOrderProduct, RentalOrder, SalesOrder, ServiceOrder, PurchaseOrder
-from app.order.filters import FilterBuilder, SortBuilder
-from app.product.schema import ProductResponse
+from app.order.schema import RentalOrder, SalesOrder, ServiceOrder, PurchaseOrder
+from app.order.filters import FilterBuilder, KeysetPagination, SortBuilder
+from app.responses import model_list_response
 
 from . import router
 
@@ -20,6 +20,7 @@ def get_rental_orders(
     sort: Optional[List[str]] = Query(["order_id:desc"], description="Sort fields as 'field:asc' or 'field:desc'"),
     skip: int = Query(0, ge=0, description="Number of documents to skip"),
     limit: int = Query(1000, ge=0, le=1000, description="Number of documents to return (0 means all)"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     svc: OrderService = Depends(get_order_service),
 ) -> List[RentalOrder]:
     # Build filters from query parameters
@@ -28,24 +29,23 @@ def get_rental_orders(
     # Build sort specification from query parameters
     sort_spec = SortBuilder.build_sort(sort) if sort else None
     
+    # Keyset pagination: `after` replaces `skip` and `_id` keeps the order stable
+    try:
+        filters, sort_spec = KeysetPagination.apply(filters, sort_spec, after)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     # Get paginated data
-    order_data = svc.repository.get_rental_orders(filters=filters, sort_spec=sort_spec, skip=skip, limit=limit)
+    order_data = svc.repository.get_rental_orders(filters=filters, sort_spec=sort_spec, skip=0 if after else skip, limit=limit)
     if not order_data:
         error_message = "No Rental Order Found. Please create new rental order"
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
 
+    next_cursor = KeysetPagination.next_cursor(order_data, sort_spec, limit)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+
     try:
-        for order in order_data:
-            order["product_details"] = [
-                ProductDetails(**product_detail)
-                for product_detail in order["product_details"]
-            ]
-            order["deposits"] = [
-                Deposit(**product_detail)
-                for product_detail in order["deposits"]
-            ]
-        order_data = [RentalOrder(**order) for order in order_data]
-        return order_data
+        return model_list_response(RentalOrder, order_data, headers=headers)
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -62,6 +62,7 @@ def get_sales_orders(
     sort: Optional[List[str]] = Query(None, description="Sort fields as 'field:asc' or 'field:desc'"),
     skip: int = Query(0, ge=0, description="Number of documents to skip"),
     limit: int = Query(100, ge=0, le=1000, description="Number of documents to return (0 means all)"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     svc: OrderService = Depends(get_order_service),
 ) -> List[SalesOrder]:
     # Build filters from query parameters
@@ -70,20 +71,23 @@ def get_sales_orders(
     # Build sort specification from query parameters
     sort_spec = SortBuilder.build_sort(sort) if sort else None
     
+    # Keyset pagination: `after` replaces `skip` and `_id` keeps the order stable
+    try:
+        filters, sort_spec = KeysetPagination.apply(filters, sort_spec, after)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     # Get paginated data
-    order_data = svc.repository.get_sales_orders(filters=filters, sort_spec=sort_spec, skip=skip, limit=limit)
+    order_data = svc.repository.get_sales_orders(filters=filters, sort_spec=sort_spec, skip=0 if after else skip, limit=limit)
     if not order_data:
         error_message = "No Sales Order Found. Please create new sales order"
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
 
+    next_cursor = KeysetPagination.next_cursor(order_data, sort_spec, limit)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+
     try:
-        for order in order_data:
-            order["products"] = [
-                ProductResponse(**product)
-                for product in order["products"]
-            ]
-        order_data = [SalesOrder(**order) for order in order_data]
-        return order_data
+        return model_list_response(SalesOrder, order_data, headers=headers)
     except ValidationError:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -99,6 +103,7 @@ def get_service_orders(
     sort: Optional[List[str]] = Query(None, description="Sort fields as 'field:asc' or 'field:desc'"),
     skip: int = Query(0, ge=0, description="Number of documents to skip"),
     limit: int = Query(100, ge=0, le=1000, description="Number of documents to return (0 means all)"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     svc: OrderService = Depends(get_order_service),
 ) -> List[ServiceOrder]:
     # Build filters from query parameters
@@ -107,15 +112,23 @@ def get_service_orders(
     # Build sort specification from query parameters
     sort_spec = SortBuilder.build_sort(sort) if sort else None
 
+    # Keyset pagination: `after` replaces `skip` and `_id` keeps the order stable
+    try:
+        filters, sort_spec = KeysetPagination.apply(filters, sort_spec, after)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     # Get paginated data
-    order_data = svc.repository.get_service_orders(filters=filters, sort_spec=sort_spec, skip=skip, limit=limit)
+    order_data = svc.repository.get_service_orders(filters=filters, sort_spec=sort_spec, skip=0 if after else skip, limit=limit)
     if not order_data:
         error_message = "No Service Order Found. Please create new service order"
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
 
+    next_cursor = KeysetPagination.next_cursor(order_data, sort_spec, limit)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+
     try:
-        order_data = [ServiceOrder(**order) for order in order_data]
-        return order_data
+        return model_list_response(ServiceOrder, order_data, headers=headers)
     except ValidationError:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -133,6 +146,7 @@ def get_purchase_orders(
     sort: Optional[List[str]] = Query(None, description="Sort fields as 'field:asc' or 'field:desc'"),
     skip: int = Query(0, ge=0, description="Number of documents to skip"),
     limit: int = Query(100, ge=0, le=1000, description="Number of documents to return (0 means all)"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     svc: OrderService = Depends(get_order_service),
 ) -> List[PurchaseOrder]:
     # Build filters from query parameters
@@ -141,20 +155,24 @@ def get_purchase_orders(
     # Build sort specification from query parameters
     sort_spec = SortBuilder.build_sort(sort) if sort else None
 
+    # Keyset pagination: `after` replaces `skip` and `_id` keeps the order stable
+    try:
+        filters, sort_spec = KeysetPagination.apply(filters, sort_spec, after)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     # Get paginated data
-    order_data = svc.repository.get_purchase_orders(filters=filters, sort_spec=sort_spec, skip=skip, limit=limit)
+    order_data = svc.repository.get_purchase_orders(filters=filters, sort_spec=sort_spec, skip=0 if after else skip, limit=limit)
     if not order_data:
         error_message = "No Purchase Order Found. Please create new purchase order"
         print('error_message: ', error_message)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
 
+    next_cursor = KeysetPagination.next_cursor(order_data, sort_spec, limit)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+
     try:
-        for order in order_data:
-            order["products"] = [
-                PurchaseOrderProduct(**product) for product in order["products"]
-            ]
-        order_data = [PurchaseOrder(**order) for order in order_data]
-        return order_data
+        return model_list_response(PurchaseOrder, order_data, headers=headers)
     except ValidationError:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -0,0 +1,31 @@
+from typing import List, Optional
+from fastapi import Depends, HTTPException, Query, status
+
+from app.order.filters import FilterBuilder, SortBuilder
+from app.rollup.rollup_service import RollupService, get_rollup_service
+from app.rollup.schema import DailyOrderRollup
+
+from . import router
+
+
+@router.get(
+    "/rollups/daily",
+    status_code=status.HTTP_200_OK,
+    response_model=List[DailyOrderRollup],
+)
+def get_daily_order_rollups(
+    filter: Optional[List[str]] = Query(None, description="Filters as 'field:operator:value', e.g. 'date:gte:2026-04-01' or 'branch:PADUR'"),
+    sort: Optional[List[str]] = Query(["date:asc"], description="Sort fields as 'field:asc' or 'field:desc'"),
+    skip: int = Query(0, ge=0, description="Number of documents to skip"),
+    limit: int = Query(1000, ge=0, le=5000, description="Number of documents to return (0 means all)"),
+    svc: RollupService = Depends(get_rollup_service),
+) -> List[DailyOrderRollup]:
+    """Per-day order counts by order type, branch, billing mode and status, with money
+    totals for rental orders (filter with 'order_type:rental')."""
+    filters = FilterBuilder.build_filters(filter) if filter else {}
+    sort_spec = SortBuilder.build_sort(sort) if sort else None
+
+    rollups = svc.repository.get_rollups(filters=filters, sort_spec=sort_spec, skip=skip, limit=limit)
+    if not rollups:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No order rollups found.")
+    return rollups
@@ -1,7 +1,7 @@
 from fastapi.params import Depends, Query
 
 from app.order.order_service import OrderService, get_order_service
-from app.order.utils import generate_invoice_id, generate_order_id
+from app.order.utils import peek_invoice_id, peek_order_id
 from app.auth.schema import Branch
 from app.order.schema import BillingMode
 
@@ -16,8 +16,11 @@ def get_latest_invoice_id(
     ),
     svc: OrderService = Depends(get_order_service),
 ) -> dict:
-    """Get the next invoice ID that would be generated for the specified branch and billing mode."""
-    invoice_id = generate_invoice_id(
+    """Get the next invoice ID that would be generated for the specified branch and billing mode.
+
+    This is a preview only: the number is not reserved.
+    """
+    invoice_id = peek_invoice_id(
         db=svc.repository.database, branch=branch, billing_mode=billing_mode
     )
     return {"invoice_id": invoice_id}
@@ -28,6 +31,6 @@ def get_latest_order_id(
     branch: Branch = Query(default=Branch.PADUR, description="Branch code"),
     svc: OrderService = Depends(get_order_service),
 ) -> dict:
-    """Get the next order ID that would be generated."""
-    order_id = generate_order_id(db=svc.repository.database, branch=branch)
+    """Get the next order ID that would be generated. The number is not reserved."""
+    order_id = peek_order_id(db=svc.repository.database, branch=branch)
     return {"order_id": order_id}
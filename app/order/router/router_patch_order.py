@@ -7,7 +7,11 @@ from app.order.schema import (
     ProductDetails,
     RentalOrder,
 )
-from app.order.order_service import OrderService, get_order_service
+from app.order.order_service import (
+    InsufficientStockError,
+    OrderService,
+    get_order_service,
+)
 from app.order.utils import apply_patch_operation
 
 from . import router
@@ -48,9 +52,12 @@ def patch_rental_order(
             detail="Pydantic Validation Error. Please Contact Admin or Developer.",
         )
 
-    updated_order = svc.update_rental_order_with_invoice(
-        order_id=id, order=order
-    )
+    try:
+        updated_order = svc.update_rental_order_with_invoice(
+            order_id=id, order=order
+        )
+    except InsufficientStockError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     if not updated_order:
         raise HTTPException(status_code=404, detail="Failed to update rental order.")
 
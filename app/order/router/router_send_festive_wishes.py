@@ -1,17 +1,26 @@
+from functools import partial
+from anyio import to_thread
+from bson.errors import InvalidId
 from fastapi import HTTPException, status, UploadFile, File, Form
 import re
 
-from app.contact.utils import handle_upload, sanitize_filename
+from app.contact.utils import handle_upload
 from app.contact.contact_repository import ContactRepository
 from app.config import database
-from app.order.utils import send_festive_message, upload_media_to_whatsapp
+from app.order.utils import festive_message_payload, whatsapp_recipient
+from app.storage.storage import local_path_async
+from app.whatsapp.campaign_service import get_campaign_service
+from app.whatsapp.media_service import get_media_service
+from app.whatsapp.schema import CampaignResponse
 
 from . import router
 
+FESTIVE_TEMPLATE = "festive_wishes"
+
 
 @router.post(
     "/festive-wishes",
-    status_code=status.HTTP_200_OK,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def send_festive_wishes_to_all(
     customer_name_template: str = Form(...),
@@ -20,26 +29,38 @@ async def send_festive_wishes_to_all(
 ):
     """
     Send festive wishes with an image to all customers.
-    
+
+    The image is uploaded to WhatsApp and the messages are then sent in the
+    background; poll GET /festive-wishes/{campaign_id} for progress.
+
     Args:
         customer_name_template: Template for personalizing message (e.g., "Dear {name}")
         message_title: Title or heading for the festive message
         file: Image file to send with the message
-    
+
     Returns:
-        Summary of sent messages with success/failure counts
+        The campaign id and the number of contacts it will message
     """
-    file_name = sanitize_filename(f"{file.filename}")
-    handle_upload(new_filename=file_name, file=file, type="order")
+    stored = await handle_upload(file, type="order")
 
+    svc = get_campaign_service()
     try:
         # Upload media to WhatsApp
-        file_id = upload_media_to_whatsapp(file_name=file_name)
+        async with local_path_async(stored.key) as file_path:
+            file_id = await get_media_service().upload_file_async(
+                file_path, content_type=file.content_type or "image/png"
+            )
         print("file_id: ", file_id)
 
         # Get all contacts from database
         contact_repository = ContactRepository(database=database)
-        contacts = contact_repository.get_contacts()
+        contacts = await to_thread.run_sync(
+            partial(
+                contact_repository.get_contacts,
+                projection={"name": 1, "personal_number": 1},
+                limit=0,
+            )
+        )
 
         if not contacts:
             raise HTTPException(
@@ -47,63 +68,48 @@ async def send_festive_wishes_to_all(
                 detail="No contacts found in the system",
             )
 
-        # Send messages to all customers
-        success_count = 0
-        failed_count = 0
+        messages = []
         failed_contacts = []
-
         for contact in contacts:
-            try:
-                mobile_number = contact.get("personal_number")
-                
-                if not mobile_number:
-                    failed_count += 1
-                    failed_contacts.append(
-                        {
-                            "name": contact.get("name"),
-                            "reason": "No phone number available",
-                        }
-                    )
-                    continue
-
-                # Format mobile number
-                if not mobile_number.startswith("+"):
-                    mobile_number = "+91" + mobile_number
+            name = contact.get("name")
+            mobile_number = contact.get("personal_number")
+            if not mobile_number:
+                failed_contacts.append(
+                    {"name": name, "reason": "No phone number available"}
+                )
+                continue
 
+            try:
                 # Personalize customer name
                 customer_name = customer_name_template.format(
                     name=contact.get("name", "Valued Customer")
                 )
                 customer_name = re.sub(r"[\x00-\x1f\x7f]+", " ", customer_name)
                 customer_name = re.sub(r"\s+", " ", customer_name).strip()
-
-                send_festive_message(
-                    mobile_number=mobile_number,
-                    customer_name=customer_name,
-                    message_title=message_title,
-                    file_id=file_id,
-                )
-
-                success_count += 1
-
             except Exception as e:
-                failed_count += 1
-                failed_contacts.append(
-                    {
-                        "name": contact.get("name"),
-                        "reason": str(e),
-                    }
-                )
-                print(
-                    f"Error sending message to {contact.get('name')}: {e}"
+                failed_contacts.append({"name": name, "reason": str(e)})
+                continue
+
+            mobile_number = whatsapp_recipient(mobile_number)
+            messages.append(
+                (
+                    {"name": customer_name, "mobile_number": mobile_number},
+                    festive_message_payload(mobile_number=mobile_number, file_id=file_id),
                 )
+            )
+
+        campaign_id = await to_thread.run_sync(
+            svc.create_campaign, FESTIVE_TEMPLATE, len(contacts), failed_contacts
+        )
+        svc.start_campaign(campaign_id, messages)
 
         return {
-            "detail": "Festive wishes campaign completed",
-            "success_count": success_count,
-            "failed_count": failed_count,
+            "detail": "Festive wishes campaign started",
+            "campaign_id": campaign_id,
+            "message_title": message_title,
             "total_contacts": len(contacts),
-            "failed_contacts": failed_contacts if failed_contacts else None,
+            "queued_count": len(messages),
+            "failed_count": len(failed_contacts),
         }
 
     except HTTPException:
@@ -114,3 +120,24 @@ async def send_festive_wishes_to_all(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to send festive wishes: {str(e)}",
         )
+
+
+@router.get(
+    "/festive-wishes/{campaign_id}",
+    response_model=CampaignResponse,
+    status_code=status.HTTP_200_OK,
+)
+def get_festive_wishes_campaign(campaign_id: str):
+    """Progress of a festive wishes campaign: status and sent/failed counts."""
+    svc = get_campaign_service()
+    try:
+        campaign = svc.get_campaign(campaign_id)
+    except InvalidId:
+        campaign = None
+    if not campaign:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Campaign not found",
+        )
+    campaign["_id"] = str(campaign["_id"])
+    return campaign
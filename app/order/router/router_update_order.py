@@ -1,10 +1,15 @@
 from typing import Optional
+from anyio import from_thread
 from fastapi import Depends, HTTPException, status, Form, File, UploadFile
 from pydantic_core import ValidationError
 import json
 import os
 
-from app.order.order_service import OrderService, get_order_service
+from app.order.order_service import (
+    InsufficientStockError,
+    OrderService,
+    get_order_service,
+)
 from app.order.schema import (
     Deposit,
     ProductDetails,
@@ -16,8 +21,7 @@ from app.order.schema import (
 )
 from app.product.schema import ProductResponse
 from app.contact.schema import ContactResponse
-from app.contact.utils import handle_upload, sanitize_filename
-from app.utils import env
+from app.contact.utils import file_url, handle_upload, sanitize_filename
 
 from . import router
 
@@ -32,7 +36,10 @@ def update_rental_order(
     payload: RentalOrder,
     svc: OrderService = Depends(get_order_service),
 ) -> RentalOrder:
-    order_data = svc.update_rental_order_with_invoice(order_id=id, order=payload)
+    try:
+        order_data = svc.update_rental_order_with_invoice(order_id=id, order=payload)
+    except InsufficientStockError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     if not order_data:
         error_message = (
             "The Rental Order was not updated properly. Please verify and try again"
@@ -170,12 +177,10 @@ def update_purchase_order(
 
             # Upload new PDF
             pdf_filename = sanitize_filename(f"{order_id}.pdf")
-            handle_upload(
-                new_filename=pdf_filename,
-                file=invoice_pdf,
-                type="purchase",
-            )
-            invoice_pdf_path = f"{env.image_domain}/public/purchase/{pdf_filename}"
+            stored = from_thread.run(handle_upload, invoice_pdf, "purchase", pdf_filename)
+            invoice_pdf_path = file_url(stored.name, type="purchase")
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -200,9 +205,10 @@ def update_purchase_order(
         old_products = existing_order.get("products", [])
 
         # Process product quantity changes
-        svc.process_purchase_products_update(old_products, products)
-
-        order_data = svc.repository.update_purchase_order(order_id=id, order=payload)
+        order_data, outcomes = svc.update_purchase_order_with_products(
+            order_id=id, order=payload, old_products=old_products, products=products
+        )
+        print("purchase product stock updates: ", outcomes)
         if not order_data:
             error_message = "The Purchase Order was not updated properly. Please verify and try again"
             print("error_message: ", error_message)
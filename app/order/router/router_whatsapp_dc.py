@@ -1,15 +1,18 @@
-from fastapi import HTTPException, status, UploadFile, File, Form
+from typing import Optional
+from anyio import to_thread
+from fastapi import Header, HTTPException, status, UploadFile, File, Form
 import re
 
-from app.contact.utils import handle_upload, sanitize_filename
-from app.order.utils import send_whatsapp_message_with_img, upload_media_to_whatsapp
+from app.contact.utils import handle_upload
+from app.jobs.job_service import get_job_service
+from app.jobs.schema import JobType
 
 from . import router
 
 
 @router.post(
     "/rentals/whatsapp-dc",
-    status_code=status.HTTP_200_OK,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def whatsapp_order_dc(
     mobile_number: str = Form(...),
@@ -17,34 +20,48 @@ async def whatsapp_order_dc(
     bill_type: str = Form(...),
     order_id: str = Form(...),
     file: UploadFile = File(...),
+    idempotency_key: Optional[str] = Header(default=None),
 ):
-    file_name = sanitize_filename(f"{file.filename}")
-    handle_upload(new_filename=file_name, file=file, type="order")
+    """
+    Queue the DC/bill image to be sent to the customer on WhatsApp.
+
+    The message is sent by a background worker (with retries); a repeated request
+    with the same Idempotency-Key header returns the already queued job.
+    """
+    # Stored under its content hash, so DCs queued at the same time never overwrite
+    # each other's image before they are sent
+    file_name = (await handle_upload(file, type="order")).name
 
     # sanitize customer name: remove control/escape characters and collapse whitespace
     # removes characters like \n, \r, \t and other control chars
     customer_name = re.sub(r"[\x00-\x1f\x7f]+", " ", customer_name)
     customer_name = re.sub(r"\s+", " ", customer_name).strip()
 
+    if not mobile_number.startswith("+"):
+        mobile_number = "91" + mobile_number
+
     try:
-        file_id = upload_media_to_whatsapp(file_name=file_name)
-        print("file_id: ", file_id)
-
-        if not mobile_number.startswith("+"):
-            mobile_number = "91" + mobile_number
-
-        send_whatsapp_message_with_img(
-            mobile_number=mobile_number,
-            customer_name=customer_name,
-            order_id=order_id,
-            file_id=file_id,
-            bill_type=bill_type,
+        job = await to_thread.run_sync(
+            get_job_service().enqueue,
+            JobType.WHATSAPP_DC.value,
+            {
+                "file_name": file_name,
+                "mobile_number": mobile_number,
+                "customer_name": customer_name,
+                "order_id": order_id,
+                "bill_type": bill_type,
+            },
+            f"whatsapp-dc:{idempotency_key}" if idempotency_key else None,
         )
     except Exception as e:
-        print(f"Error sending WhatsApp message: {e}")
+        print(f"Error queueing WhatsApp message: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to send WhatsApp message: {str(e)}",
+            detail=f"Failed to queue WhatsApp message: {str(e)}",
         )
 
-    return {"detail": "WhatsApp message sent successfully."}
+    return {
+        "detail": "WhatsApp message queued.",
+        "job_id": str(job["_id"]),
+        "status": job["status"],
+    }
@@ -174,6 +174,8 @@ class SalesOrder(Order):
     type: ProductType = Field(default=ProductType.SALES)
     bill_date: datetime = Field(default_factory=get_current_utc_time)
     products: List[ProductResponse]
+    invoice_id: Optional[str] = Field(default=None)
+    invoice_date: Optional[datetime] = Field(default=None)
 
 
 class PurchaseOrder(BaseModel):
@@ -193,6 +195,24 @@ class ServiceOrder(Order):
     type: ProductType = Field(default=ProductType.SERVICE)
     in_date: datetime
     out_date: datetime
+    invoice_id: Optional[str] = Field(default=None)
+    invoice_date: Optional[datetime] = Field(default=None)
+
+
+class RentalOrderSummary(BaseModel):
+    branch: Optional[str] = None
+    billing_mode: Optional[str] = None
+    status: Optional[str] = None
+    period: Optional[str] = None
+    orders: int
+    total_amount: float
+    discount_amount: float
+    gst_amount: float
+    eway_amount: float
+    damage_expenses: float
+    round_off: float
+    balance_paid: float
+    final_amount: float
 
 
 class PatchOperation(BaseModel):
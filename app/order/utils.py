@@ -1,12 +1,15 @@
-import os
 from fastapi import HTTPException
-from app.contact.utils import UPLOAD_DIR
 from app.order.schema import PatchOperation, BillingMode
+from app.product.schema import DiscountType
 from app.dependencies import env
 from app.auth.schema import Branch
 import httpx
 import re
 from pymongo.database import Database
+from app.sequence.sequence_repository import SequenceRepository
+from app.sequence.sequence_service import SequenceService
+from app.storage.storage import get_storage
+from app.whatsapp.media_service import get_media_service
 from datetime import datetime
 
 access_token = env.access_token
@@ -68,21 +71,17 @@ def apply_patch_operation(doc: dict, operation: PatchOperation):
         )
 
 
-def upload_media_to_whatsapp(file_name: str):
+def upload_media_to_whatsapp(file_name: str, refresh: bool = False):
     if not access_token or not phone_number_id:
         raise ValueError("Missing WhatsApp configuration in environment variables.")
 
-    url = f"https://graph.facebook.com/{version}/{phone_number_id}/media"
-    file_path = os.path.join(UPLOAD_DIR, "order", file_name)
-    with open(file_path, "rb") as f:
-        headers = {"Authorization": f"Bearer {access_token}"}
-        files = {"file": (file_name, f, "image/png")}
-        data = {"messaging_product": "whatsapp"}
-        response = httpx.post(url, headers=headers, data=data, files=files)
-        print("response: ", response)
-        response.raise_for_status()
-
-    return response.json().get("id")  # Return media ID
+    # Reuses the media id of an identical image uploaded before (see MediaService);
+    # refresh drops that id first, e.g. after WhatsApp rejected it
+    svc = get_media_service()
+    with get_storage().local_path(f"order/{file_name}") as file_path:
+        if refresh:
+            svc.forget(file_path)
+        return svc.upload_file(file_path)  # Return media ID
 
 
 def send_whatsapp_message_with_img(
@@ -91,7 +90,7 @@ def send_whatsapp_message_with_img(
     if not access_token or not phone_number_id:
         raise ValueError("Missing WhatsApp configuration in environment variables.")
 
-    media_url = f"https://graph.facebook.com/{version}/{phone_number_id}/messages"
+    media_url = f"{env.graph_api_url}/{version}/{phone_number_id}/messages"
     headers = {
         "Authorization": f"Bearer {access_token}",
         "Content-Type": "application/json",
@@ -157,27 +156,17 @@ def send_whatsapp_message_with_img(
     return media_response.json()
 
 
-def send_festive_message(
-    mobile_number: str, customer_name: str, message_title: str, file_id: str
-):
-    """
-    Send a festive wishes message with an image to a customer.
+def whatsapp_recipient(mobile_number: str) -> str:
+    """Phone number with country code; numbers without one are Indian (+91)."""
+    mobile_number = mobile_number.strip()
+    if not mobile_number.startswith("+"):
+        mobile_number = "+91" + mobile_number
+    return mobile_number
 
-    Args:
-        mobile_number: Customer's phone number with country code
-        customer_name: Personalized customer name for the message
-        message_title: Title/heading of the festive message
-        file_id: WhatsApp media ID of the image to send
-    """
-    if not access_token or not phone_number_id:
-        raise ValueError("Missing WhatsApp configuration in environment variables.")
 
-    media_url = f"https://graph.facebook.com/{version}/{phone_number_id}/messages"
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-    }
-    data = {
+def festive_message_payload(mobile_number: str, file_id: str) -> dict:
+    """Body of the "festive_wishes" template message with an image header."""
+    return {
         "messaging_product": "whatsapp",
         "recipient_type": "individual",
         "to": mobile_number,
@@ -202,27 +191,112 @@ def send_festive_message(
         },
     }
 
-    media_response = httpx.post(
-        media_url,
-        headers=headers,
-        json=data,
-        timeout=60,
+
+# Branch mapping used in new-format invoice IDs
+INVOICE_BRANCH_CODES = {
+    Branch.PADUR.value: "PD",
+    Branch.PUDUPAKKAM.value: "PM",
+    Branch.KELAMBAKKAM.value: "KL",
+}
+
+# Invoices created on or after this date use the INV/{type}{yy}/{branch}/ format
+INVOICE_NEW_FORMAT_START_DATE = datetime(2026, 4, 1)
+
+
+def _invoice_stream(
+    db: Database, now: datetime, branch: Branch, billing_mode: BillingMode
+):
+    """
+    Build the counter key, prefix and seed function for a new-format invoice stream.
+
+    The stream is keyed by (prefix, branch, billing mode, year) and lives in the
+    ``counters`` collection. The seed function is only used the first time a
+    stream is touched and scans existing invoices for the highest number issued.
+    """
+    branch = Branch(branch)
+    billing_mode = BillingMode(billing_mode)
+
+    year_2_digits = str(now.year)[-2:]
+    branch_short = INVOICE_BRANCH_CODES.get(branch.value, "XX")
+    type_letter = "B" if billing_mode == BillingMode.B2B else "C"
+
+    # The new standard prefix
+    new_prefix = f"INV/{type_letter}{year_2_digits}/{branch_short}/"
+    manual_prefix = f"INV/{billing_mode.value}/{branch_short}/"
+
+    def seed() -> int:
+        regex_pattern = f"^({re.escape(new_prefix)}|{re.escape(manual_prefix)})"
+        start = INVOICE_NEW_FORMAT_START_DATE
+
+        # Only consider orders invoiced after the new format started
+        orders_with_invoices = db["rental_orders"].find(
+            {
+                "invoice_id": {"$regex": regex_pattern},
+                "$or": [
+                    {"invoice_date": {"$gte": start}},
+                    {"invoice_date": {"$exists": False}, "created_at": {"$gte": start}},
+                    {"invoice_date": None, "created_at": {"$gte": start}},
+                ],
+            },
+            {"invoice_id": 1, "_id": 0},
+        )
+
+        max_invoice_num = 0
+        for order in orders_with_invoices:
+            parts = (order.get("invoice_id") or "").split("/")
+            if len(parts) == 4 and parts[3].isdigit():
+                max_invoice_num = max(max_invoice_num, int(parts[3]))
+        return max_invoice_num
+
+    key = f"invoice:{new_prefix}"
+    metadata = {
+        "kind": "invoice",
+        "prefix": new_prefix,
+        "branch": branch.value,
+        "billing_mode": billing_mode.value,
+        "year": now.year,
+    }
+    return key, new_prefix, seed, metadata
+
+
+def _generate_legacy_invoice_id(db: Database, financial_year: int) -> str:
+    """Old format (INV/{fy}/{number}) used for invoices created before April 1, 2026."""
+    orders_with_invoices = db["rental_orders"].find(
+        {"invoice_id": {"$regex": "^INV/"}}, {"invoice_id": 1, "_id": 0}
     )
 
-    if media_response.status_code != 200:
-        print("Request data: ", data)
-        print("Headers: ", headers)
-        print("URL: ", media_url)
-    media_response.raise_for_status()
+    max_invoice_num = 0
+    latest_year = financial_year
 
-    return media_response.json()
+    for order in orders_with_invoices:
+        invoice_id = order.get("invoice_id")
+        if not invoice_id:
+            continue
+
+        parts = invoice_id.split("/")
+        if len(parts) != 3:
+            continue
+
+        try:
+            year = int(parts[1])
+            invoice_num = int(parts[2])
+
+            if invoice_num > max_invoice_num:
+                max_invoice_num = invoice_num
+                latest_year = year
+        except (ValueError, IndexError):
+            continue
+
+    next_invoice_num = max_invoice_num + 1
+    result_year = latest_year if max_invoice_num > 0 else financial_year
+    return f"INV/{result_year}/{next_invoice_num:04d}"
 
 
 def generate_invoice_id(
     db: Database, branch: Branch = Branch.PADUR, billing_mode: BillingMode = BillingMode.B2B
 ) -> str:
     """
-    Generate the next invoice ID based on existing invoices.
+    Reserve and return the next invoice ID.
 
     Format: INV/{type_letter}{year_2_digits}/{branch_short}/{next_number}
     where type_letter is 'B' for B2B or 'C' for B2C
@@ -231,7 +305,9 @@ def generate_invoice_id(
     and next_number is 4-digit padded increment.
 
     Note: Numbering resets every calendar year.
-    Specifically, we also consider the manually updated April 2026 invoices (INV/B2B/PD/XXXX) when generating sequence numbers.
+    Numbers come from an atomic counter in the ``counters`` collection, so concurrent
+    requests never receive the same invoice ID. The counter is seeded once from the
+    existing invoices, including the manually updated April 2026 invoices (INV/B2B/PD/XXXX).
     Old format (without type/branch) applies to invoices created before April 1, 2026
 
     Args:
@@ -243,123 +319,137 @@ def generate_invoice_id(
         Next invoice ID as string in format: INV/B26/PD/0001
     """
     now = datetime.now()
-    current_year = now.year
-    current_month = now.month
-
-    financial_year = current_year - 1 if current_month < 4 else current_year
-
-    new_format_start_date = datetime(2026, 4, 1)
-    use_new_format = now >= new_format_start_date
-
-    collection = db["rental_orders"]
-
-    if use_new_format:
-        current_year_full = now.year
-        year_2_digits = str(current_year_full)[-2:]
-        
-        # Branch mapping
-        branch_mapping = {
-            Branch.PADUR.value: "PD",
-            Branch.PUDUPAKKAM.value: "PM",
-            Branch.KELAMBAKKAM.value: "KL",
-        }
-        
-        branch_str = branch.value
-        branch_short = branch_mapping.get(branch_str, "XX")
-        
-        type_letter = "B" if billing_mode == BillingMode.B2B else "C"
-        
-        # The new standard prefix
-        new_prefix = f"INV/{type_letter}{year_2_digits}/{branch_short}/"
-        manual_prefix = f"INV/{billing_mode.value}/{branch_short}/"
-        
-        regex_pattern = f"^({re.escape(new_prefix)}|{re.escape(manual_prefix)})"
-        
-        # Performance optimization: only get orders after April 1 2026
-        orders_with_invoices = collection.find(
-            {
-                "invoice_id": {"$regex": regex_pattern},
-                "$or": [
-                    {"invoice_date": {"$gte": new_format_start_date}},
-                    {"invoice_date": {"$exists": False}, "created_at": {"$gte": new_format_start_date}},
-                    {"invoice_date": None, "created_at": {"$gte": new_format_start_date}}
-                ]
-            },
-            {"invoice_id": 1, "_id": 0}
-        )
-        
-        max_invoice_num = 0
-        
-        for order in orders_with_invoices:
-            invoice_id = order.get("invoice_id")
-            if not invoice_id:
-                continue
-                
-            parts = invoice_id.split("/")
-            if len(parts) == 4:
-                try:
-                    invoice_num = int(parts[3])
-                    if invoice_num > max_invoice_num:
-                        max_invoice_num = invoice_num
-                except ValueError:
-                    continue
-                    
-        next_invoice_num = max_invoice_num + 1
-        return f"{new_prefix}{next_invoice_num:04d}"
-        
-    else:
-        # Old format logic
-        orders_with_invoices = collection.find(
-            {"invoice_id": {"$regex": "^INV/"}}, {"invoice_id": 1, "_id": 0}
+    if now < INVOICE_NEW_FORMAT_START_DATE:
+        financial_year = now.year - 1 if now.month < 4 else now.year
+        return _generate_legacy_invoice_id(db, financial_year)
+
+    key, prefix, seed, metadata = _invoice_stream(db, now, branch, billing_mode)
+    sequences = SequenceService(sequence_repository=SequenceRepository(database=db))
+    next_invoice_num = sequences.next_value(key, seed=seed, metadata=metadata)
+    return f"{prefix}{next_invoice_num:04d}"
+
+
+def peek_invoice_id(
+    db: Database, branch: Branch = Branch.PADUR, billing_mode: BillingMode = BillingMode.B2B
+) -> str:
+    """
+    Return the invoice ID that ``generate_invoice_id`` would issue next, without
+    reserving it. Used for previews such as ``GET /orders/invoice/latest-id``.
+    """
+    now = datetime.now()
+    if now < INVOICE_NEW_FORMAT_START_DATE:
+        financial_year = now.year - 1 if now.month < 4 else now.year
+        return _generate_legacy_invoice_id(db, financial_year)
+
+    key, prefix, seed, metadata = _invoice_stream(db, now, branch, billing_mode)
+    sequences = SequenceService(sequence_repository=SequenceRepository(database=db))
+    next_invoice_num = sequences.peek_value(key, seed=seed, metadata=metadata)
+    return f"{prefix}{next_invoice_num:04d}"
+
+
+# Orders created on or after this date use the RO/{branch}/{fy}/ format
+ORDER_NEW_FORMAT_START_DATE = datetime(2026, 4, 1)
+
+
+def get_fiscal_year(now: datetime) -> str:
+    """
+    Fiscal year in format YY-YY (e.g., 25-26). Fiscal year runs from April to March:
+    - If month < 4 (April), fiscal year is previous year to current year
+    - If month >= 4 (April), fiscal year is current year to next year
+    """
+    start_year = now.year - 1 if now.month < 4 else now.year
+    end_year = start_year + 1
+    return f"{str(start_year)[-2:]}-{str(end_year)[-2:]}"
+
+
+def _order_number(order_num_str: str):
+    """Extract the leading numeric part of an order number (handles suffixes like 0001/A)."""
+    numeric_match = re.match(r"^(\d+)", order_num_str)
+    return int(numeric_match.group(1)) if numeric_match else None
+
+
+def _order_stream(db: Database, now: datetime, branch: Branch):
+    """
+    Build the counter key, prefix and seed function for a new-format order stream.
+
+    There is one stream per branch and fiscal year, so numbering rolls over to
+    0001 automatically in April. The seed function is only used the first time a
+    stream is touched and scans the existing order IDs of that branch and year.
+    """
+    branch_code = Branch(branch).value
+    fy = get_fiscal_year(now)
+    prefix = f"RO/{branch_code}/{fy}/"
+
+    def seed() -> int:
+        orders_with_ids = db["rental_orders"].find(
+            {"order_id": {"$regex": f"^{re.escape(prefix)}"}},
+            {"order_id": 1, "_id": 0},
         )
 
-        max_invoice_num = 0
-        latest_year = financial_year
+        max_order_num = 0
+        for order in orders_with_ids:
+            # RO/PADUR-1/25-26/0001 or with suffixes like RO/PADUR-1/25-26/0001/A
+            order_num = _order_number((order.get("order_id") or "")[len(prefix):])
+            if order_num is not None:
+                max_order_num = max(max_order_num, order_num)
+        return max_order_num
+
+    key = f"order:{prefix}"
+    metadata = {
+        "kind": "order",
+        "prefix": prefix,
+        "branch": branch_code,
+        "fiscal_year": fy,
+    }
+    return key, prefix, seed, metadata
 
-        for order in orders_with_invoices:
-            invoice_id = order.get("invoice_id")
-            if not invoice_id:
-                continue
 
-            parts = invoice_id.split("/")
-            if len(parts) != 3:
-                continue
+def _generate_legacy_order_id(db: Database, fy: str) -> str:
+    """Old format (RO/{fy}/{number}) used for orders created before April 1, 2026."""
+    orders_with_ids = db["rental_orders"].find(
+        {"order_id": {"$regex": "^RO/"}}, {"order_id": 1, "_id": 0}
+    )
 
-            try:
-                year = int(parts[1])
-                invoice_num = int(parts[2])
+    max_order_num = 0
+    latest_fy = fy
 
-                if invoice_num > max_invoice_num:
-                    max_invoice_num = invoice_num
-                    latest_year = year
-            except (ValueError, IndexError):
-                continue
+    for order in orders_with_ids:
+        order_id = order.get("order_id")
+        if not order_id:
+            continue
 
-        next_invoice_num = max_invoice_num + 1
-        result_year = latest_year if max_invoice_num > 0 else financial_year
-        return f"INV/{result_year}/{next_invoice_num:04d}"
+        # Parse order_id format: RO/25-26/0001 or with suffixes like RO/25-26/0001/A
+        parts = order_id.split("/")
+        if len(parts) < 3:
+            continue
+
+        order_num = _order_number("/".join(parts[2:]))
+        if order_num is not None and order_num > max_order_num:
+            max_order_num = order_num
+            latest_fy = parts[1]
+
+    # Use the latest fiscal year found, or current fiscal year if no orders exist
+    result_fy = latest_fy if max_order_num > 0 else fy
+    return f"RO/{result_fy}/{max_order_num + 1:04d}"
 
 
 def generate_order_id(db: Database, branch: Branch = Branch.PADUR) -> str:
     """
-    Generate the next order ID based on existing rental orders.
+    Reserve and return the next rental order ID.
 
     Format: RO/{branch_code}/{fy}/{next_number}
     where branch_code is the branch code (e.g., PADUR-1, KLMBK-1, PUDPK-1)
     fy is the fiscal year in format YY-YY (e.g., 25-26)
     and next_number is 4-digit padded increment.
 
-    Fiscal year runs from April to March:
-    - If month < 4 (April), fiscal year is previous year to current year
-    - If month >= 4 (April), fiscal year is current year to next year
-
     Branch-based numbering:
-    - Each branch has its own sequential numbering
+    - Each branch has its own sequential numbering per fiscal year, reset every April
     - New format (with branch) applies to orders created on or after April 1, 2026
     - Old format (without branch) applies to orders created before April 1, 2026
-    
-    Note: Order IDs may have suffixes like /A or trailing characters. The numeric
-    part is extracted for comparison to find the latest order ID accurately.
+
+    Numbers come from an atomic counter in the ``counters`` collection, so creating
+    an order no longer scans the collection. The counter is seeded once from the
+    existing order IDs; suffixes like /A are ignored when reading their numbers.
 
     Args:
         db: MongoDB database instance
@@ -368,133 +458,41 @@ def generate_order_id(db: Database, branch: Branch = Branch.PADUR) -> str:
     Returns:
         Next order ID as string
     """
-    # Get current date
     now = datetime.now()
-    current_year = now.year
-    current_month = now.month
-
-    # Calculate fiscal year (April to March cycle)
-    # If month < 4 (April), fiscal year is previous year to current year
-    # If month >= 4 (April), fiscal year is current year to next year
-    start_year = current_year - 1 if current_month < 4 else current_year
-    end_year = start_year + 1
-    fy = f"{str(start_year)[-2:]}-{str(end_year)[-2:]}"
-
-    # Check if we should use the new format (with branch)
-    # New format starts from April 1, 2026
-    new_format_start_date = datetime(2026, 4, 1)
-    use_new_format = now >= new_format_start_date
-
-    # Extract branch code from branch enum value
-    # Branch values are like "PADUR-1", "KLMBK-1", "PUDPK-1"
-    branch_code = branch.value
-
-    # Query for existing order IDs in the rental_orders collection
-    collection = db["rental_orders"]
-
-    if use_new_format:
-        # New format: Query only orders for the specific branch
-        # Look for order_ids that start with "RO/{branch_code}/"
-        orders_with_ids = collection.find(
-            {"order_id": {"$regex": f"^RO/{branch_code}/"}}, {"order_id": 1, "_id": 0}
-        )
-    else:
-        # Old format: Query all order_ids that start with "RO/"
-        orders_with_ids = collection.find(
-            {"order_id": {"$regex": "^RO/"}}, {"order_id": 1, "_id": 0}
-        )
+    if now < ORDER_NEW_FORMAT_START_DATE:
+        return _generate_legacy_order_id(db, get_fiscal_year(now))
 
-    # Extract order numbers and find the latest
-    max_order_num = 0
-    latest_fy = fy
+    key, prefix, seed, metadata = _order_stream(db, now, branch)
+    sequences = SequenceService(sequence_repository=SequenceRepository(database=db))
+    next_order_num = sequences.next_value(key, seed=seed, metadata=metadata)
+    return f"{prefix}{next_order_num:04d}"
 
-    for order in orders_with_ids:
-        order_id = order.get("order_id")
-        if not order_id:
-            continue
 
-        if use_new_format:
-            # Parse order_id format: RO/PADUR-1/25-26/0001 or with suffixes like RO/PADUR-1/25-26/0001/A
-            parts = order_id.split("/")
-            if len(parts) < 4:
-                continue
-
-            try:
-                order_branch_code = parts[1]
-                order_fy = parts[2]
-                # Extract numeric part from the order number (handles suffixes like /A)
-                order_num_str = parts[3]
-                
-                # If there are more parts (e.g., 0001/A), join the remaining parts
-                if len(parts) > 4:
-                    order_num_str = "/".join(parts[3:])
-                
-                # Extract only the leading numeric digits
-                numeric_match = re.match(r"^(\d+)", order_num_str)
-                if not numeric_match:
-                    continue
-                
-                order_num = int(numeric_match.group(1))
-
-                # Only consider orders for the same branch
-                if order_branch_code == branch_code:
-                    # Track the highest order number found
-                    if order_num > max_order_num:
-                        max_order_num = order_num
-                        latest_fy = order_fy
-            except (ValueError, IndexError, AttributeError):
-                # Skip invalid order IDs
-                continue
-        else:
-            # Old format: Parse order_id format: RO/25-26/0001 or with suffixes like RO/25-26/0001/A
-            parts = order_id.split("/")
-            if len(parts) < 3:
-                continue
-
-            try:
-                order_fy = parts[1]
-                # Extract numeric part from the order number (handles suffixes like /A)
-                order_num_str = parts[2]
-                
-                # If there are more parts (e.g., 0001/A), join the remaining parts
-                if len(parts) > 3:
-                    order_num_str = "/".join(parts[2:])
-                
-                # Extract only the leading numeric digits
-                numeric_match = re.match(r"^(\d+)", order_num_str)
-                if not numeric_match:
-                    continue
-                
-                order_num = int(numeric_match.group(1))
-
-                # Track the highest order number found
-                if order_num > max_order_num:
-                    max_order_num = order_num
-                    latest_fy = order_fy
-            except (ValueError, IndexError, AttributeError):
-                # Skip invalid order IDs
-                continue
-
-    # Generate next order number
-    next_order_num = max_order_num + 1
-
-    # Use the latest fiscal year found, or current fiscal year if no orders exist
-    result_fy = latest_fy if max_order_num > 0 else fy
+def peek_order_id(db: Database, branch: Branch = Branch.PADUR) -> str:
+    """
+    Return the order ID that ``generate_order_id`` would issue next, without
+    reserving it. Used for previews such as ``GET /orders/order/latest-id``.
+    """
+    now = datetime.now()
+    if now < ORDER_NEW_FORMAT_START_DATE:
+        return _generate_legacy_order_id(db, get_fiscal_year(now))
 
-    # Format and return
-    if use_new_format:
-        return f"RO/{branch_code}/{result_fy}/{next_order_num:04d}"
-    else:
-        return f"RO/{result_fy}/{next_order_num:04d}"
+    key, prefix, seed, metadata = _order_stream(db, now, branch)
+    sequences = SequenceService(sequence_repository=SequenceRepository(database=db))
+    next_order_num = sequences.peek_value(key, seed=seed, metadata=metadata)
+    return f"{prefix}{next_order_num:04d}"
 
 
-def calculate_final_amount(order: dict) -> float:
+def calculate_order_amounts(order: dict) -> dict:
     """
-    Calculate the final amount for a rental order.
+    Calculate the amounts of a rental order.
     Mirrors the frontend calculateFinalAmount function.
 
     Formula:
-    final_amount = (total_amount - discount + gst + round_off + eway_amount + damage_expenses) - balance_paid
+    final_amount = (subtotal - discount + gst + round_off + eway_amount + damage_expenses) - balance_paid
+
+    Returns:
+        subtotal, discount_amount, gst_amount and final_amount (rounded to 2 decimals)
     """
     # Calculate total amount from product details
     total_amount = 0.0
@@ -506,7 +504,7 @@ def calculate_final_amount(order: dict) -> float:
 
     # Get other components
     discount = order.get("discount", 0)
-    discount_type = order.get("discount_type", "RUPEES")
+    discount_type = order.get("discount_type", DiscountType.RUPEES)
     gst_percentage = order.get("gst", 18) if order.get("gst") else 18
     round_off = order.get("round_off", 0)
     eway_amount = order.get("eway_amount", 0)
@@ -515,7 +513,7 @@ def calculate_final_amount(order: dict) -> float:
     billing_mode = order.get("billing_mode", "B2C")
 
     # Calculate discount amount
-    if discount_type == "PERCENT":
+    if discount_type == DiscountType.PERCENT:
         discount_amount = (total_amount * discount) / 100
     else:
         discount_amount = discount
@@ -530,4 +528,17 @@ def calculate_final_amount(order: dict) -> float:
     # Calculate final amount
     final_amount = (total_amount - discount_amount + gst_amount + round_off + eway_amount + damage_expenses) - balance_paid
 
-    return round(final_amount, 2)
+    return {
+        "subtotal": total_amount,
+        "discount_amount": discount_amount,
+        "gst_amount": gst_amount,
+        "final_amount": round(final_amount, 2),
+    }
+
+
+def calculate_final_amount(order: dict) -> float:
+    """
+    Calculate the final amount for a rental order.
+    Mirrors the frontend calculateFinalAmount function.
+    """
+    return calculate_order_amounts(order)["final_amount"]
@@ -1,10 +1,10 @@
 from typing import List, Optional
-from fastapi import Depends, HTTPException, status, Query
+from fastapi import Depends, HTTPException, Response, status, Query
 from pydantic_core import ValidationError
 
 from app.petty_cash.petty_cash_service import PettyCashService, get_petty_cash_service
 from app.petty_cash.schema import PettyCash
-from app.order.filters import FilterBuilder, SortBuilder
+from app.order.filters import FilterBuilder, KeysetPagination, SortBuilder
 
 from . import router
 
@@ -15,10 +15,12 @@ from . import router
     response_model=List[PettyCash],
 )
 def get_petty_cash_entries(
+    response: Response,
     filter: Optional[List[str]] = Query(None, description="Filters as 'field:operator:value' or 'field:value'"),
     sort: Optional[List[str]] = Query(["created_date:desc"], description="Sort fields as 'field:asc' or 'field:desc'"),
     skip: int = Query(0, ge=0, description="Number of documents to skip"),
     limit: int = Query(1000, ge=0, le=1000, description="Number of documents to return (0 means all)"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     svc: PettyCashService = Depends(get_petty_cash_service),
 ) -> List[PettyCash]:
     # Build filters from query parameters
@@ -27,12 +29,22 @@ def get_petty_cash_entries(
     # Build sort specification from query parameters
     sort_spec = SortBuilder.build_sort(sort) if sort else None
     
+    # Keyset pagination: `after` replaces `skip` and `_id` keeps the order stable
+    try:
+        filters, sort_spec = KeysetPagination.apply(filters, sort_spec, after)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     # Get paginated data
-    petty_cash_data = svc.repository.get_petty_cash_entries(filters=filters, sort_spec=sort_spec, skip=skip, limit=limit)
+    petty_cash_data = svc.repository.get_petty_cash_entries(filters=filters, sort_spec=sort_spec, skip=0 if after else skip, limit=limit)
     if not petty_cash_data:
         error_message = "No Petty Cash entries found. Please create new petty cash entry"
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
 
+    next_cursor = KeysetPagination.next_cursor(petty_cash_data, sort_spec, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
     try:
         petty_cash_data = [PettyCash(**entry) for entry in petty_cash_data]
         return petty_cash_data
@@ -1,9 +1,11 @@
 from datetime import datetime, timezone
 
 from bson.objectid import ObjectId
+from pymongo import UpdateOne
 from pymongo.database import Database
 
 from app.product.schema import ProductResponse
+from app.search import product_search_fields, search_collection
 
 
 class ProductRepository:
@@ -29,6 +31,7 @@ class ProductRepository:
             "gst_percentage": product.gst_percentage,
             "description": product.description,
         }
+        payload.update(product_search_fields(payload))
 
         result = self.database["products"].insert_one(payload)
         return self.get_product_by_id(product_id=result.inserted_id)
@@ -52,6 +55,7 @@ class ProductRepository:
             "gst_percentage": product.gst_percentage,
             "description": product.description,
         }
+        payload.update(product_search_fields(payload))
 
         self.database["products"].update_one(
             {"_id": ObjectId(product_id)}, {"$set": {**payload}}
@@ -78,6 +82,10 @@ class ProductRepository:
         products = self.database["products"].find({}).to_list()
         return products
 
+    def search_products(self, query: str, limit: int = 10):
+        """Products whose name or product_code match ``query``, best first."""
+        return search_collection(self.database["products"], query, limit=limit)
+
     def increment_product_quantity(self, product_id: str, quantity: int):
         """Increment product quantity and available_stock by the given amount."""
         self.database["products"].update_one(
@@ -86,27 +94,23 @@ class ProductRepository:
         )
         return self.get_product_by_id(product_id=product_id)
 
-    def create_product_from_purchase(
-        self,
+    @staticmethod
+    def purchase_product_fields(
         name: str,
         product_code: str,
         category_id: str,
         unit_id: str,
         type_str: str,
         rent_per_unit: float,
-        quantity: int,
         price: float,
         gst_percentage: float = 0,
         profit: float = 0,
         profit_type: str = "rupees",
-        product_id: str = None,
-    ):
-        """Create a new product from purchase order product data."""
-        payload = {
+    ) -> dict:
+        """Fields of a product created from a purchase order line (without stock counts)."""
+        fields = {
             "name": name,
             "created_at": datetime.now(tz=timezone.utc),
-            "quantity": quantity,
-            "available_stock": quantity,
             "repair_count": 0,
             "product_code": product_code,
             "category": category_id,
@@ -119,10 +123,87 @@ class ProductRepository:
             "profit": profit,
             "profit_type": profit_type,
         }
-        
+        fields.update(product_search_fields(fields))
+        return fields
+
+    def create_product_from_purchase(
+        self,
+        name: str,
+        product_code: str,
+        category_id: str,
+        unit_id: str,
+        type_str: str,
+        rent_per_unit: float,
+        quantity: int,
+        price: float,
+        gst_percentage: float = 0,
+        profit: float = 0,
+        profit_type: str = "rupees",
+        product_id: str = None,
+    ):
+        """Create a new product from purchase order product data."""
+        payload = {
+            **self.purchase_product_fields(
+                name=name,
+                product_code=product_code,
+                category_id=category_id,
+                unit_id=unit_id,
+                type_str=type_str,
+                rent_per_unit=rent_per_unit,
+                price=price,
+                gst_percentage=gst_percentage,
+                profit=profit,
+                profit_type=profit_type,
+            ),
+            "quantity": quantity,
+            "available_stock": quantity,
+        }
+
         # Only add _id if product_id is provided; otherwise let MongoDB auto-generate it
         if product_id:
             payload["_id"] = ObjectId(product_id)
-        
+
         result = self.database["products"].insert_one(payload)
         return self.get_product_by_id(product_id=str(result.inserted_id))
+
+    def get_products_by_ids(self, product_ids: list, projection: dict = None, session=None):
+        products = self.database["products"].find(
+            {"_id": {"$in": [ObjectId(product_id) for product_id in product_ids]}},
+            projection,
+            session=session,
+        ).to_list()
+        return products
+
+    def bulk_write_products(self, operations: list, session=None):
+        """Apply UpdateOne/InsertOne operations in order in a single round-trip."""
+        if not operations:
+            return None
+        return self.database["products"].bulk_write(
+            operations, ordered=True, session=session
+        )
+
+    def reserve_stock(self, product_id: str, quantity: int, session=None) -> bool:
+        """Take ``quantity`` out of available_stock unless that would make it negative.
+
+        Returns False (and changes nothing) when there is not enough stock.
+        """
+        result = self.database["products"].update_one(
+            {"_id": ObjectId(product_id), "available_stock": {"$gte": quantity}},
+            {"$inc": {"available_stock": -quantity}},
+            session=session,
+        )
+        return result.modified_count == 1
+
+    def release_stock(self, quantities: dict, session=None):
+        """Put stock back, ``quantities`` maps product id -> quantity returned."""
+        return self.bulk_write_products(
+            [
+                UpdateOne(
+                    {"_id": ObjectId(product_id)},
+                    {"$inc": {"available_stock": quantity}},
+                )
+                for product_id, quantity in quantities.items()
+                if quantity
+            ],
+            session=session,
+        )
@@ -17,6 +17,39 @@ class ProductService:
         self.product_category_repository = product_category_repository
         self.unit_repository = unit_repository
 
+    def resolve_references(self, products: list) -> list:
+        """Replace the category and unit ids of product documents with the referenced
+        documents, using one batched query per collection instead of two per product.
+
+        Raises KeyError with the collection name if a referenced document is missing.
+        """
+        category_ids = {product["category"] for product in products}
+        unit_ids = {product["unit"] for product in products}
+
+        categories = {
+            str(category["_id"]): category
+            for category in self.product_category_repository.get_product_categories_by_ids(
+                list(category_ids)
+            )
+        }
+        units = {
+            str(unit["_id"]): unit
+            for unit in self.unit_repository.get_units_by_ids(list(unit_ids))
+        }
+
+        for product in products:
+            if product["category"] not in categories:
+                raise KeyError("product_categories")
+            if product["unit"] not in units:
+                raise KeyError("units")
+            product["category"] = categories[product["category"]]
+            product["unit"] = units[product["unit"]]
+        return products
+
+    def get_products(self) -> list:
+        """Get all products with their category and unit documents resolved."""
+        return self.resolve_references(self.repository.get_products())
+
 
 def get_product_service():
     product_repository = ProductRepository(database=database)
@@ -0,0 +1,40 @@
+from typing import List
+from fastapi import Depends, HTTPException, status, Query
+from pydantic_core import ValidationError
+
+from app.product.product_service import ProductService, get_product_service
+from app.product.schema import ProductResponse
+
+from . import router
+
+
+# Registered before GET /{id} (modules load alphabetically), which would match "search"
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    response_model=List[ProductResponse],
+)
+def search_products(
+    q: str = Query(..., min_length=1, description="Start of a product name or code, or whole words"),
+    limit: int = Query(10, ge=1, le=50, description="Number of products to return"),
+    svc: ProductService = Depends(get_product_service),
+) -> List[ProductResponse]:
+    """Typeahead search over products, best matches first. Returns an empty list
+    when nothing matches."""
+    try:
+        product_data = svc.resolve_references(svc.repository.search_products(q, limit=limit))
+    except KeyError as e:
+        error_message = (
+            "The Product Category is not found"
+            if e.args[0] == "product_categories"
+            else "The Unit is not found"
+        )
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
+
+    try:
+        return [ProductResponse(**product) for product in product_data]
+    except ValidationError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Pydantic Validation Error. Please Contact Admin or Developer.",
+        )
@@ -3,8 +3,12 @@ from datetime import datetime, timezone
 from bson.objectid import ObjectId
 from pymongo.database import Database
 
+from app.cache import get_cache
 from app.product_category.schema import ProductCategory
 
+# Categories are reference data: cached by id, invalidated when a category is created
+product_category_cache = get_cache("product_categories")
+
 
 class ProductCategoryRepository:
     def __init__(self, database: Database):
@@ -20,12 +24,34 @@ class ProductCategoryRepository:
         return self.get_product_category_by_id(product_category_id=result.inserted_id)
 
     def get_product_category_by_id(self, product_category_id: str):
-        product_category = self.database["product_categories"].find_one(
-            {
-                "_id": ObjectId(product_category_id),
-            }
-        )
-        return product_category
+        product_category = product_category_cache.get(str(product_category_id))
+        if product_category is None:
+            product_category = self.database["product_categories"].find_one(
+                {
+                    "_id": ObjectId(product_category_id),
+                }
+            )
+            if product_category:
+                product_category_cache.set(str(product_category_id), product_category)
+        return dict(product_category) if product_category else product_category
+
+    def get_product_categories_by_ids(self, product_category_ids: list):
+        product_categories = []
+        missing_ids = []
+        for product_category_id in product_category_ids:
+            product_category = product_category_cache.get(str(product_category_id))
+            if product_category is None:
+                missing_ids.append(product_category_id)
+            else:
+                product_categories.append(dict(product_category))
+
+        if missing_ids:
+            for product_category in self.database["product_categories"].find(
+                {"_id": {"$in": [ObjectId(category_id) for category_id in missing_ids]}}
+            ).to_list():
+                product_category_cache.set(str(product_category["_id"]), product_category)
+                product_categories.append(dict(product_category))
+        return product_categories
 
     def get_product_categories(self):
         product_categories = self.database["product_categories"].find({}).to_list()
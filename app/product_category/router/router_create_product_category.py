@@ -1,6 +1,7 @@
 from fastapi import Depends, HTTPException, status
 from pydantic_core import ValidationError
 
+from app.product_category.product_category_repository import product_category_cache
 from app.product_category.product_category_service import ProductCategoryService, get_product_category_service
 from app.product_category.schema import ProductCategory
 
@@ -17,6 +18,7 @@ def create_product_category(
     svc: ProductCategoryService = Depends(get_product_category_service),
 ) -> ProductCategory:
     product_category_data = svc.repository.create_product_category(product_category=payload)
+    product_category_cache.clear()
     if not product_category_data:
         error_message = "The Product Category is not found"
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
@@ -0,0 +1,64 @@
+from enum import Enum
+from typing import List
+
+import orjson
+from bson import ObjectId
+from fastapi import Response
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.dependencies import env
+
+_list_adapters = {}
+
+
+def list_adapter(model) -> TypeAdapter:
+    """TypeAdapter for ``List[model]``, built once per model."""
+    adapter = _list_adapters.get(model)
+    if adapter is None:
+        adapter = _list_adapters[model] = TypeAdapter(List[model])
+    return adapter
+
+
+def orjson_default(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dump_json(content) -> bytes:
+    """Serialize plain data (e.g. MongoDB documents) straight to JSON bytes."""
+    return orjson.dumps(content, default=orjson_default, option=orjson.OPT_UTC_Z)
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """App-wide JSON response: orjson with ObjectId/PyObjectId, Enum and UTC "Z"
+    datetime encoding."""
+
+    def render(self, content) -> bytes:
+        return dump_json(content)
+
+
+def model_list_response(model, documents: list, headers: dict = None, trusted: bool = None) -> Response:
+    """JSON response for a list of documents, validated at most once.
+
+    Strict mode validates the documents against ``model`` with a single TypeAdapter
+    pass and dumps the result to JSON in Rust; returning the Response directly skips
+    FastAPI's second validation through ``response_model``. Trusted mode skips
+    validation entirely and serializes the documents as stored in MongoDB.
+    The mode defaults to RESPONSE_VALIDATION.
+
+    Raises:
+        ValidationError: In strict mode, if a document does not match ``model``
+    """
+    if trusted is None:
+        trusted = env.response_validation == "trusted"
+
+    if trusted:
+        content = dump_json(documents)
+    else:
+        adapter = list_adapter(model)
+        content = adapter.dump_json(adapter.validate_python(documents), by_alias=True)
+    return Response(content=content, media_type="application/json", headers=headers)
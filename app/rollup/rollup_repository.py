@@ -0,0 +1,46 @@
+from typing import Any, Dict, Optional
+
+from pymongo import UpdateOne
+from pymongo.database import Database
+
+
+class RollupRepository:
+    """Per-day order totals stored in ``daily_order_rollups``, one document per
+    (date, branch, order_type, billing_mode, status)."""
+
+    def __init__(self, database: Database):
+        self.database = database
+
+    def increment(self, changes: list, session=None):
+        """Apply (key, values) increments, creating missing rollup rows."""
+        operations = [
+            UpdateOne(key, {"$inc": values}, upsert=True) for key, values in changes
+        ]
+        if not operations:
+            return None
+        return self.database["daily_order_rollups"].bulk_write(
+            operations, ordered=False, session=session
+        )
+
+    def get_rollups(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_spec: Optional[list] = None,
+        skip: int = 0,
+        limit: int = 1000,
+    ):
+        """Get rollup rows with filtering, sorting and pagination. limit=0 means retrieve all."""
+        cursor = self.database["daily_order_rollups"].find(filters or {}, {"_id": 0})
+        if sort_spec:
+            cursor = cursor.sort(sort_spec)
+        cursor = cursor.skip(skip)
+        if limit > 0:
+            cursor = cursor.limit(limit)
+        return list(cursor)
+
+    def replace_all(self, rows: list):
+        """Replace every rollup row (used by the rebuild)."""
+        collection = self.database["daily_order_rollups"]
+        collection.delete_many({})
+        if rows:
+            collection.insert_many(rows)
@@ -0,0 +1,118 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+from zoneinfo import ZoneInfo
+
+from app.config import database, env
+from app.order.utils import calculate_order_amounts
+from app.rollup.rollup_repository import RollupRepository
+
+ROLLUP_KEY_FIELDS = ["date", "branch", "order_type", "billing_mode", "status"]
+ROLLUP_AMOUNT_FIELDS = [
+    "subtotal",
+    "discount_amount",
+    "gst_amount",
+    "eway_amount",
+    "damage_expenses",
+    "balance_paid",
+    "final_amount",
+]
+
+
+def _value(value):
+    return getattr(value, "value", value)
+
+
+def rollup_contribution(order: Optional[dict], order_type: str = "rental"):
+    """
+    What one order adds to its daily rollup row: (key, values).
+
+    The day is the order's created_at date in REPORT_TIMEZONE, stored as midnight
+    UTC of that date so it can be filtered as a date. Returns None for no order.
+    Only rental orders have amounts (calculate_order_amounts); sales and service
+    orders store no total, so they are only counted.
+    """
+    if not order:
+        return None
+
+    created_at = order.get("created_at") or datetime.now(timezone.utc)
+    if not created_at.tzinfo:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    day = created_at.astimezone(ZoneInfo(env.report_timezone)).date()
+
+    key = {
+        "date": datetime(day.year, day.month, day.day, tzinfo=timezone.utc),
+        "branch": _value(order.get("branch")),
+        "order_type": order_type,
+        "billing_mode": _value(order.get("billing_mode")),
+        "status": _value(order.get("status")),
+    }
+    if order_type != "rental":
+        return key, {"orders": 1}
+
+    amounts = calculate_order_amounts(order)
+    values = {
+        "orders": 1,
+        "subtotal": amounts["subtotal"],
+        "discount_amount": amounts["discount_amount"],
+        "gst_amount": amounts["gst_amount"],
+        "eway_amount": order.get("eway_amount") or 0,
+        "damage_expenses": order.get("damage_expenses") or 0,
+        "balance_paid": order.get("balance_paid") or 0,
+        "final_amount": amounts["final_amount"],
+    }
+    return key, values
+
+
+class RollupService:
+    def __init__(self, rollup_repository: RollupRepository):
+        self.repository = rollup_repository
+
+    def apply_order_change(
+        self,
+        old_order: Optional[dict],
+        new_order: Optional[dict],
+        order_type: str = "rental",
+        session=None,
+    ):
+        """Move an order's contribution from its old rollup row to its new one.
+
+        Pass old_order=None for a created order and new_order=None for a deleted one.
+        """
+        changes = defaultdict(lambda: defaultdict(int))
+        for order, sign in ((old_order, -1), (new_order, 1)):
+            contribution = rollup_contribution(order, order_type)
+            if not contribution:
+                continue
+            key, values = contribution
+            row = changes[tuple(key.items())]
+            for field, value in values.items():
+                row[field] += sign * value
+
+        # Rows whose contribution did not change (e.g. a remarks edit) are skipped
+        return self.repository.increment(
+            [
+                (dict(key), dict(values))
+                for key, values in changes.items()
+                if any(values.values())
+            ],
+            session=session,
+        )
+
+    def build_rollups(self, orders: Iterable[dict], order_type: str = "rental") -> list:
+        """Rollup rows for ``orders`` computed from scratch (for rebuilds)."""
+        rows = {}
+        for order in orders:
+            key, values = rollup_contribution(order, order_type)
+            row = rows.setdefault(
+                tuple(key.items()), {**key, **{field: 0 for field in values}}
+            )
+            for field, value in values.items():
+                row[field] += value
+        return list(rows.values())
+
+
+def get_rollup_service():
+    rollup_repository = RollupRepository(database=database)
+    svc = RollupService(rollup_repository=rollup_repository)
+    return svc
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, field_validator
+
+
+class DailyOrderRollup(BaseModel):
+    date: datetime
+    branch: Optional[str] = None
+    order_type: str
+    billing_mode: Optional[str] = None
+    status: Optional[str] = None
+    orders: int = 0
+    subtotal: float = 0
+    discount_amount: float = 0
+    gst_amount: float = 0
+    eway_amount: float = 0
+    damage_expenses: float = 0
+    balance_paid: float = 0
+    final_amount: float = 0
+
+    @field_validator(
+        "subtotal",
+        "discount_amount",
+        "gst_amount",
+        "eway_amount",
+        "damage_expenses",
+        "balance_paid",
+        "final_amount",
+    )
+    def round_amount(cls, v):
+        # Incremental $inc updates accumulate floating point noise
+        return round(v, 2)
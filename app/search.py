@@ -0,0 +1,147 @@
+"""Typeahead search over contacts and products.
+
+Searchable documents store two normalized fields next to the originals:
+
+- ``search_name``: the lowercased, whitespace-collapsed name;
+- ``search_terms``: every word suffix of the name (and company), lowercased codes
+  such as GSTIN or product_code, and the digits of phone numbers.
+
+A query is matched by anchored, case-sensitive prefix regexes on those fields, which
+MongoDB answers from an index, and then by the collection's text index for whole
+words anywhere in the text.
+"""
+import re
+import unicodedata
+from typing import Iterable, List, Optional
+
+from pymongo.collection import Collection
+
+# Queries of at least this many digits (ignoring spaces, "+", "-" and brackets) are
+# also matched against phone numbers
+MIN_PHONE_DIGITS = 3
+
+
+def normalize_text(value) -> str:
+    """Lowercase ``value``, drop accents and collapse whitespace."""
+    if not value:
+        return ""
+    value = unicodedata.normalize("NFKD", str(value))
+    value = "".join(char for char in value if not unicodedata.combining(char))
+    return " ".join(value.casefold().split())
+
+
+def normalize_digits(value) -> str:
+    """Only the digits of ``value``, e.g. "+91 98765-43210" -> "919876543210"."""
+    return re.sub(r"\D", "", str(value or ""))
+
+
+def word_suffixes(value) -> List[str]:
+    """Every word suffix of ``value``, so a prefix match finds any word.
+
+    Example:
+        "Ravi Kumar Traders" -> ["ravi kumar traders", "kumar traders", "traders"]
+    """
+    words = normalize_text(value).split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+def phone_terms(value) -> List[str]:
+    """Digits of a phone number, plus its last ten digits when it has a country code."""
+    digits = normalize_digits(value)
+    if len(digits) > 10:
+        return [digits, digits[-10:]]
+    return [digits] if digits else []
+
+
+def search_terms(
+    texts: Iterable = (), codes: Iterable = (), phones: Iterable = ()
+) -> List[str]:
+    """Distinct terms for ``search_terms``. Texts match from the start of any word,
+    codes and phone numbers from their start."""
+    terms = []
+    for text in texts:
+        terms.extend(word_suffixes(text))
+    for code in codes:
+        terms.append(normalize_text(code))
+    for phone in phones:
+        terms.extend(phone_terms(phone))
+    return list(dict.fromkeys(term for term in terms if term))
+
+
+def contact_search_fields(contact: dict) -> dict:
+    """Search fields of a contact document (or payload)."""
+    return {
+        "search_name": normalize_text(contact.get("name")),
+        "search_terms": search_terms(
+            texts=[contact.get("name"), contact.get("company_name")],
+            codes=[contact.get("gstin")],
+            phones=[contact.get("personal_number"), contact.get("office_number")],
+        ),
+    }
+
+
+def product_search_fields(product: dict) -> dict:
+    """Search fields of a product document (or payload)."""
+    return {
+        "search_name": normalize_text(product.get("name")),
+        "search_terms": search_terms(
+            texts=[product.get("name")], codes=[product.get("product_code")]
+        ),
+    }
+
+
+def _prefix(term: str) -> re.Pattern:
+    return re.compile("^" + re.escape(term))
+
+
+def search_collection(
+    collection: Collection,
+    query: str,
+    limit: int = 10,
+    projection: Optional[dict] = None,
+) -> list:
+    """Documents matching ``query``, best first, at most ``limit`` of them.
+
+    Results are ranked in three tiers, each one an indexed query that only runs
+    while there is room left:
+
+    1. names starting with the query, in name order (an exact name comes first);
+    2. any word, code or phone number starting with the query;
+    3. text index matches by relevance, for whole words in any order.
+    """
+    text = normalize_text(query)
+    digits = normalize_digits(query)
+    if not text:
+        return []
+
+    prefixes = [_prefix(text)]
+    if (
+        len(digits) >= MIN_PHONE_DIGITS
+        and re.fullmatch(r"[\d\s()+-]+", query.strip())
+        and digits != text
+    ):
+        prefixes.append(_prefix(digits))
+
+    tiers = [
+        lambda seen: collection.find(
+            {"search_name": prefixes[0], "_id": {"$nin": seen}}, projection
+        ).sort("search_name", 1),
+        lambda seen: collection.find(
+            {"search_terms": {"$in": prefixes}, "_id": {"$nin": seen}}, projection
+        ),
+        lambda seen: collection.find(
+            {"$text": {"$search": query}, "_id": {"$nin": seen}},
+            {**(projection or {}), "score": {"$meta": "textScore"}},
+        ).sort([("score", {"$meta": "textScore"})]),
+    ]
+
+    results = []
+    for tier in tiers:
+        seen = [document["_id"] for document in results]
+        results.extend(tier(seen).limit(limit - len(results)))
+        if len(results) >= limit:
+            break
+
+    for document in results:
+        document.pop("score", None)
+    return results
@@ -0,0 +1,38 @@
+from typing import Optional
+
+from pymongo import ReturnDocument
+from pymongo.database import Database
+from pymongo.errors import DuplicateKeyError
+
+
+class SequenceRepository:
+    """Atomic counters stored in the ``counters`` collection (one document per stream)."""
+
+    def __init__(self, database: Database):
+        self.database = database
+
+    def increment(self, key: str) -> Optional[int]:
+        """Reserve the next value of a counter. Returns None if the counter is not seeded."""
+        counter = self.database["counters"].find_one_and_update(
+            {"_id": key},
+            {"$inc": {"seq": 1}},
+            return_document=ReturnDocument.AFTER,
+        )
+        return counter["seq"] if counter else None
+
+    def get_value(self, key: str) -> Optional[int]:
+        """Return the last reserved value of a counter without changing it."""
+        counter = self.database["counters"].find_one({"_id": key}, {"seq": 1})
+        return counter["seq"] if counter else None
+
+    def seed(self, key: str, value: int, metadata: Optional[dict] = None):
+        """Create the counter, or raise it to at least ``value``. Never lowers a counter."""
+        update = {"$max": {"seq": value}}
+        if metadata:
+            update["$setOnInsert"] = metadata
+
+        try:
+            self.database["counters"].update_one({"_id": key}, update, upsert=True)
+        except DuplicateKeyError:
+            # Another request seeded the same counter concurrently
+            self.database["counters"].update_one({"_id": key}, {"$max": {"seq": value}})
@@ -0,0 +1,40 @@
+from typing import Callable, Optional
+
+from app.config import database
+from app.sequence.sequence_repository import SequenceRepository
+
+
+class SequenceService:
+    def __init__(self, sequence_repository: SequenceRepository):
+        self.repository = sequence_repository
+
+    def next_value(
+        self, key: str, seed: Callable[[], int], metadata: Optional[dict] = None
+    ) -> int:
+        """Reserve and return the next number of the ``key`` stream.
+
+        ``seed`` is only called the first time a stream is used and must return the
+        highest number already issued (0 if none), e.g. by scanning existing documents.
+        Reserved numbers are never handed out twice, even if the caller later fails.
+        """
+        value = self.repository.increment(key)
+        if value is None:
+            self.repository.seed(key, seed(), metadata)
+            value = self.repository.increment(key)
+        return value
+
+    def peek_value(
+        self, key: str, seed: Callable[[], int], metadata: Optional[dict] = None
+    ) -> int:
+        """Return the number ``next_value`` would hand out next, without reserving it."""
+        current = self.repository.get_value(key)
+        if current is None:
+            current = seed()
+            self.repository.seed(key, current, metadata)
+        return current + 1
+
+
+def get_sequence_service():
+    sequence_repository = SequenceRepository(database=database)
+    svc = SequenceService(sequence_repository=sequence_repository)
+    return svc
@@ -0,0 +1,75 @@
+import os
+import re
+from email.utils import parsedate_to_datetime
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+
+from app.dependencies import env
+
+# Uploads stored under their SHA-256 (see app/storage) never change once written
+CONTENT_ADDRESSED_NAME = re.compile(r"^(?P<sha256>[0-9a-f]{64})(\.[0-9A-Za-z]+)?$")
+# Folders of files derived from an upload and named after its hash (address proof
+# thumbnails/previews); they are rewritten when regenerated, so they are not immutable
+DERIVED_FOLDERS = {"thumbnails", "previews"}
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def static_headers(path: str) -> dict:
+    """Cache headers for a served file. Content-addressed files are cached forever with
+    their hash as ETag; other files (which can be overwritten, e.g. purchase PDFs)
+    keep Starlette's mtime/size ETag and are revalidated after STATIC_MAX_AGE_SECONDS."""
+    match = CONTENT_ADDRESSED_NAME.match(os.path.basename(path))
+    if match and os.path.basename(os.path.dirname(path)) not in DERIVED_FOLDERS:
+        return {
+            "cache-control": IMMUTABLE_CACHE_CONTROL,
+            "etag": f'"{match.group("sha256")}"',
+        }
+    return {
+        "cache-control": f"public, max-age={env.static_max_age_seconds}, must-revalidate"
+    }
+
+
+def is_not_modified(response_headers: Headers, request_headers: Headers) -> bool:
+    """Conditional GET: If-None-Match wins over If-Modified-Since when both are sent."""
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = response_headers.get("etag")
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return etag is not None and ("*" in tags or etag in tags)
+
+    if_modified_since = request_headers.get("if-modified-since")
+    last_modified = response_headers.get("last-modified")
+    if if_modified_since and last_modified:
+        try:
+            return parsedate_to_datetime(if_modified_since) >= parsedate_to_datetime(
+                last_modified
+            )
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def static_file_response(
+    path: str, stat_result: os.stat_result, request_headers: Headers, filename: str = None
+) -> Response:
+    """FileResponse with cache headers, answering 304 to a matching conditional GET.
+    Range requests are handled by FileResponse."""
+    response = FileResponse(
+        path, stat_result=stat_result, headers=static_headers(path), filename=filename
+    )
+    if is_not_modified(response.headers, request_headers):
+        return NotModifiedResponse(response.headers)
+    return response
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles serving with the cache headers of static_file_response."""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        if status_code != 200:
+            # html mode 404 pages
+            return super().file_response(full_path, stat_result, scope, status_code)
+        return static_file_response(str(full_path), stat_result, Headers(scope=scope))
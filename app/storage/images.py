@@ -0,0 +1,35 @@
+from io import BytesIO
+from typing import Dict
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+# Variant format -> (Pillow format, extension, content type)
+IMAGE_FORMATS = {
+    "webp": ("WEBP", "webp", "image/webp"),
+    "jpeg": ("JPEG", "jpg", "image/jpeg"),
+}
+
+
+def make_image_variants(path: str, sizes: Dict[str, int], image_format: str, quality: int):
+    """Downscaled copies of the image at ``path``, one per ``sizes`` entry (name ->
+    longest side in pixels), encoded as ``image_format``. Returns name -> bytes, or
+    {} when the file is not an image Pillow can read (e.g. a PDF)."""
+    pil_format = IMAGE_FORMATS[image_format][0]
+    try:
+        with Image.open(path) as original:
+            # Phone cameras store rotation in EXIF; bake it in before resizing
+            image = ImageOps.exif_transpose(original)
+            if pil_format == "JPEG" or image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGB")
+
+            variants = {}
+            for name, size in sizes.items():
+                variant = image.copy()
+                variant.thumbnail((size, size))
+                buffer = BytesIO()
+                variant.save(buffer, format=pil_format, quality=quality, optimize=True)
+                variants[name] = buffer.getvalue()
+            return variants
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        print(f"Not creating image variants for {path}: {e}")
+        return {}
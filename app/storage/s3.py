@@ -0,0 +1,191 @@
+import hashlib
+import hmac
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import quote, urlsplit
+
+import anyio
+import httpx
+from fastapi import UploadFile
+
+from app.dependencies import env
+from app.storage.storage import CHUNK_SIZE, StoredFile, spool_upload, split_key, upload_key
+
+EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode(), hashlib.sha256).digest()
+
+
+def sign_request(
+    method: str,
+    url: str,
+    headers: dict,
+    payload_sha256: str,
+    region: str,
+    access_key_id: str,
+    secret_access_key: str,
+    now: Optional[datetime] = None,
+) -> dict:
+    """Headers for an AWS Signature Version 4 signed S3 request (no query string)."""
+    now = now or datetime.now(timezone.utc)
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    date = now.strftime("%Y%m%d")
+    parts = urlsplit(url)
+
+    headers = {k.lower(): str(v).strip() for k, v in headers.items()}
+    headers.update(
+        {"host": parts.netloc, "x-amz-date": amz_date, "x-amz-content-sha256": payload_sha256}
+    )
+    signed_headers = ";".join(sorted(headers))
+    canonical_request = "\n".join(
+        [
+            method,
+            quote(parts.path or "/", safe="/-_.~"),
+            "",
+            "".join(f"{k}:{headers[k]}\n" for k in sorted(headers)),
+            signed_headers,
+            payload_sha256,
+        ]
+    )
+    scope = f"{date}/{region}/s3/aws4_request"
+    string_to_sign = "\n".join(
+        [
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ]
+    )
+    key = _hmac(("AWS4" + secret_access_key).encode(), date)
+    for part in (region, "s3", "aws4_request"):
+        key = _hmac(key, part)
+    signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    headers["authorization"] = (
+        f"AWS4-HMAC-SHA256 Credential={access_key_id}/{scope}, "
+        f"SignedHeaders={signed_headers}, Signature={signature}"
+    )
+    del headers["host"]
+    return headers
+
+
+async def _file_chunks(path: str):
+    async with await anyio.open_file(path, "rb") as f:
+        while chunk := await f.read(CHUNK_SIZE):
+            yield chunk
+
+
+class S3Storage:
+    """Files in an S3-compatible bucket (AWS S3, MinIO, ...), addressed path-style as
+    ``{endpoint_url}/{bucket}/{key}``. Uploads are spooled to a temporary file while
+    hashing, since the content hash names and signs the object."""
+
+    def __init__(
+        self,
+        endpoint_url: str,
+        bucket: str,
+        region: str,
+        access_key_id: str,
+        secret_access_key: str,
+        public_url: Optional[str] = None,
+    ):
+        if not endpoint_url or not bucket:
+            raise ValueError("S3 storage needs S3_ENDPOINT_URL and S3_BUCKET")
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.bucket = bucket
+        self.region = region
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self.public_url = (public_url or f"{self.endpoint_url}/{bucket}").rstrip("/")
+
+    def _object_url(self, key: str) -> str:
+        return f"{self.endpoint_url}/{self.bucket}/{key}"
+
+    def _headers(self, method: str, key: str, payload_sha256=EMPTY_SHA256, headers=None):
+        return sign_request(
+            method,
+            self._object_url(key),
+            headers or {},
+            payload_sha256,
+            self.region,
+            self.access_key_id,
+            self.secret_access_key,
+        )
+
+    async def save(
+        self,
+        file: UploadFile,
+        folder: str,
+        name: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> StoredFile:
+        temp_path, sha256, size = await spool_upload(
+            file, tempfile.gettempdir(), max_bytes or env.upload_max_bytes
+        )
+        key = upload_key(folder, sha256, file, name)
+        try:
+            async with httpx.AsyncClient(timeout=60) as client:
+                if not name:
+                    response = await client.head(
+                        self._object_url(key), headers=self._headers("HEAD", key)
+                    )
+                    if response.status_code == 200:
+                        # Same content already stored
+                        return StoredFile(
+                            key=key, name=split_key(key)[1], sha256=sha256, size=size
+                        )
+
+                headers = {
+                    "content-length": str(size),
+                    "content-type": file.content_type or "application/octet-stream",
+                }
+                response = await client.put(
+                    self._object_url(key),
+                    headers=self._headers("PUT", key, sha256, headers),
+                    content=_file_chunks(temp_path),
+                )
+                response.raise_for_status()
+        finally:
+            os.remove(temp_path)
+        return StoredFile(key=key, name=split_key(key)[1], sha256=sha256, size=size)
+
+    def put_bytes(self, key: str, data: bytes, content_type: str):
+        headers = {"content-length": str(len(data)), "content-type": content_type}
+        response = httpx.put(
+            self._object_url(key),
+            headers=self._headers("PUT", key, hashlib.sha256(data).hexdigest(), headers),
+            content=data,
+            timeout=60,
+        )
+        response.raise_for_status()
+
+    def delete(self, key: str):
+        response = httpx.delete(
+            self._object_url(key), headers=self._headers("DELETE", key), timeout=60
+        )
+        if response.status_code not in (200, 204, 404):
+            response.raise_for_status()
+
+    def url(self, key: str) -> str:
+        return f"{self.public_url}/{key}"
+
+    @contextmanager
+    def local_path(self, key: str):
+        """Download the object to a temporary file for the duration of the block."""
+        _, name = split_key(key)
+        fd, path = tempfile.mkstemp(suffix=os.path.splitext(name)[1])
+        try:
+            with os.fdopen(fd, "wb") as f, httpx.stream(
+                "GET", self._object_url(key), headers=self._headers("GET", key), timeout=60
+            ) as response:
+                response.raise_for_status()
+                for chunk in response.iter_bytes(CHUNK_SIZE):
+                    f.write(chunk)
+            yield path
+        finally:
+            os.remove(path)
@@ -0,0 +1,172 @@
+import hashlib
+import os
+import tempfile
+from contextlib import asynccontextmanager, contextmanager
+from typing import Optional
+
+import anyio
+from anyio import to_thread
+from fastapi import UploadFile
+from pydantic import BaseModel
+
+from app.dependencies import env
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class FileTooLargeError(Exception):
+    """Raised while streaming an upload once it exceeds the size limit."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        super().__init__(f"File is larger than {max_bytes} bytes")
+
+
+class StoredFile(BaseModel):
+    key: str  # "<folder>/<name>", e.g. "contact/<sha256>.png"
+    name: str
+    sha256: str
+    size: int
+
+
+def split_key(key: str):
+    folder, _, name = key.rpartition("/")
+    return folder, name
+
+
+async def spool_upload(file: UploadFile, directory: str, max_bytes: int):
+    """Write an upload to a temporary file in ``directory`` chunk by chunk, hashing it
+    on the way. Returns (temp path, sha256, size); the temp file is removed if the
+    upload fails or grows past ``max_bytes``."""
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+    os.close(fd)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with await anyio.open_file(temp_path, "wb") as buffer:
+            while chunk := await file.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise FileTooLargeError(max_bytes)
+                digest.update(chunk)
+                await buffer.write(chunk)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    finally:
+        await file.close()
+    return temp_path, digest.hexdigest(), size
+
+
+def upload_key(folder: str, sha256: str, file: UploadFile, name: Optional[str]) -> str:
+    """Uploads without an explicit name are stored under their content hash, so the
+    same bytes are stored once and different uploads never collide."""
+    if not name:
+        _, ext = os.path.splitext(file.filename or "")
+        name = f"{sha256}{ext.lower()}"
+    return f"{folder}/{name}"
+
+
+class LocalStorage:
+    """Files under ``root`` (app/public), served by the /public static mount."""
+
+    def __init__(self, root: str, public_url: str):
+        self.root = root
+        self.public_url = public_url.rstrip("/")
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, *key.split("/"))
+
+    async def save(
+        self,
+        file: UploadFile,
+        folder: str,
+        name: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> StoredFile:
+        directory = os.path.join(self.root, folder)
+        temp_path, sha256, size = await spool_upload(
+            file, directory, max_bytes or env.upload_max_bytes
+        )
+        key = upload_key(folder, sha256, file, name)
+        path = self.path(key)
+        if not name and os.path.exists(path):
+            # Same content already stored
+            os.remove(temp_path)
+        else:
+            os.replace(temp_path, path)
+        return StoredFile(key=key, name=split_key(key)[1], sha256=sha256, size=size)
+
+    def put_bytes(self, key: str, data: bytes, content_type: str):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.part"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def delete(self, key: str):
+        path = self.path(key)
+        if os.path.isfile(path):
+            os.remove(path)
+
+    def url(self, key: str) -> str:
+        return f"{self.public_url}/public/{key}"
+
+    @contextmanager
+    def local_path(self, key: str):
+        """Path of the stored file on local disk."""
+        yield self.path(key)
+
+
+def create_local_storage():
+    return LocalStorage(root="app/public", public_url=env.image_domain)
+
+
+def create_s3_storage():
+    from app.storage.s3 import S3Storage
+
+    return S3Storage(
+        endpoint_url=env.s3_endpoint_url,
+        bucket=env.s3_bucket,
+        region=env.s3_region,
+        access_key_id=env.s3_access_key_id,
+        secret_access_key=env.s3_secret_access_key,
+        public_url=env.s3_public_url,
+    )
+
+
+# STORAGE_BACKEND name -> factory
+STORAGE_BACKENDS = {
+    "local": create_local_storage,
+    "s3": create_s3_storage,
+}
+
+_storage = None
+
+
+def get_storage():
+    """The upload storage selected by STORAGE_BACKEND, created on first use."""
+    global _storage
+    if _storage is None:
+        factory = STORAGE_BACKENDS.get(env.storage_backend)
+        if factory is None:
+            raise ValueError(f"Unknown storage backend: {env.storage_backend}")
+        _storage = factory()
+    return _storage
+
+
+@asynccontextmanager
+async def local_path_async(key: str):
+    """``get_storage().local_path`` for the event loop: fetching the file (an S3
+    download) and removing the temporary copy run in a worker thread."""
+    manager = get_storage().local_path(key)
+    path = await to_thread.run_sync(manager.__enter__)
+    try:
+        yield path
+    except BaseException as e:
+        if not await to_thread.run_sync(manager.__exit__, type(e), e, e.__traceback__):
+            raise
+    else:
+        await to_thread.run_sync(manager.__exit__, None, None, None)
@@ -1,6 +1,7 @@
 from fastapi import Depends, HTTPException, status
 from pydantic_core import ValidationError
 
+from app.unit.unit_repository import unit_cache
 from app.unit.unit_service import UnitService, get_unit_service
 from app.unit.schema import Unit
 
@@ -17,6 +18,7 @@ def create_unit(
     svc: UnitService = Depends(get_unit_service),
 ) -> Unit:
     unit_data = svc.repository.create_unit(unit=payload)
+    unit_cache.clear()
     if not unit_data:
         error_message = "The Unit is not found"
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
@@ -3,8 +3,12 @@ from datetime import datetime, timezone
 from bson.objectid import ObjectId
 from pymongo.database import Database
 
+from app.cache import get_cache
 from app.unit.schema import Unit
 
+# Units are reference data: cached by id, invalidated when a unit is created
+unit_cache = get_cache("units")
+
 
 class UnitRepository:
     def __init__(self, database: Database):
@@ -20,12 +24,34 @@ class UnitRepository:
         return self.get_unit_by_id(unit_id=result.inserted_id)
 
     def get_unit_by_id(self, unit_id: str):
-        unit = self.database["units"].find_one(
-            {
-                "_id": ObjectId(unit_id),
-            }
-        )
-        return unit
+        unit = unit_cache.get(str(unit_id))
+        if unit is None:
+            unit = self.database["units"].find_one(
+                {
+                    "_id": ObjectId(unit_id),
+                }
+            )
+            if unit:
+                unit_cache.set(str(unit_id), unit)
+        return dict(unit) if unit else unit
+
+    def get_units_by_ids(self, unit_ids: list):
+        units = []
+        missing_ids = []
+        for unit_id in unit_ids:
+            unit = unit_cache.get(str(unit_id))
+            if unit is None:
+                missing_ids.append(unit_id)
+            else:
+                units.append(dict(unit))
+
+        if missing_ids:
+            for unit in self.database["units"].find(
+                {"_id": {"$in": [ObjectId(unit_id) for unit_id in missing_ids]}}
+            ).to_list():
+                unit_cache.set(str(unit["_id"]), unit)
+                units.append(dict(unit))
+        return units
 
     def get_units(self):
         units = self.database["units"].find({}).to_list()
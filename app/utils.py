@@ -7,7 +7,6 @@ from email.message import EmailMessage
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from bson.objectid import ObjectId
-from fastapi import HTTPException, status
 from pydantic import BaseModel
 
 from app.dependencies import env
@@ -39,7 +38,8 @@ def import_routers(package_name):
             print(f"Failed to import {module_name}, error: {e}")
             
 
-def send_email(subject: str, email: str, custom_message: str) -> str:
+def deliver_email(subject: str, email: str, custom_message: str):
+    """Send an HTML email over SMTP_SSL; raises on any SMTP error."""
     smtp_server = env.smtp_server
     smtp_port = env.smtp_port
     smtp_user=env.smtp_email
@@ -52,18 +52,11 @@ def send_email(subject: str, email: str, custom_message: str) -> str:
     msg.add_alternative(custom_message, subtype="html")
 
     # Send the email
-    try:
-        with smtplib.SMTP_SSL(smtp_server, smtp_port) as smtp:
-            smtp.login(smtp_user, smtp_password)
-            smtp.send_message(msg)
-        return(f"Email sent successfully to {email}")
-    except Exception as e:
-        print(f"Failed to send email: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Error in sending email. Check the Internet Connection.",
-        )
-        
+    with smtplib.SMTP_SSL(smtp_server, smtp_port) as smtp:
+        smtp.login(smtp_user, smtp_password)
+        smtp.send_message(msg)
+
+
 def generate_otp(length=6):
     return ''.join(secrets.choice("0123456789") for _ in range(length))
 
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from bson.objectid import ObjectId
+from pymongo.database import Database
+
+
+class CampaignRepository:
+    """Progress of WhatsApp broadcast campaigns, kept in ``whatsapp_campaigns`` so any
+    worker process can report on a campaign another one is running."""
+
+    def __init__(self, database: Database):
+        self.database = database
+
+    def create_campaign(self, campaign: dict) -> str:
+        result = self.database["whatsapp_campaigns"].insert_one(campaign)
+        return str(result.inserted_id)
+
+    def get_campaign_by_id(self, campaign_id: str):
+        return self.database["whatsapp_campaigns"].find_one({"_id": ObjectId(campaign_id)})
+
+    def update_campaign(
+        self, campaign_id: str, fields: dict, increments: dict = None, failures: list = None
+    ):
+        """Set ``fields``, add ``increments`` to the counters and append ``failures``."""
+        update = {"$set": fields}
+        if increments:
+            update["$inc"] = increments
+        if failures:
+            update["$push"] = {"failures": {"$each": failures}}
+        self.database["whatsapp_campaigns"].update_one(
+            {"_id": ObjectId(campaign_id)}, update
+        )
+
+    def fail_stale_campaigns(
+        self, statuses: list, updated_before: datetime, fields: dict
+    ) -> int:
+        """Set ``fields`` on campaigns in ``statuses`` that have not reported progress
+        since ``updated_before`` (or never did); returns how many were updated."""
+        result = self.database["whatsapp_campaigns"].update_many(
+            {
+                "status": {"$in": statuses},
+                "$or": [
+                    {"updated_at": {"$lt": updated_before}},
+                    {"updated_at": {"$exists": False}},
+                ],
+            },
+            {"$set": fields},
+        )
+        return result.modified_count
@@ -0,0 +1,181 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from anyio import to_thread
+
+from app.config import database, env
+from app.whatsapp.campaign_repository import CampaignRepository
+from app.whatsapp.client import TokenBucket, auth_headers, graph_url, post_with_retry
+from app.whatsapp.schema import CampaignStatus
+
+# How often a running campaign writes its counters back to MongoDB
+PROGRESS_FLUSH_SECONDS = 2
+# A queued or running campaign without progress for this long lost its process
+# (crash or redeploy) and is marked failed
+CAMPAIGN_STALE_SECONDS = 60
+
+# Keep a reference to running campaigns so they are not garbage collected mid-run
+_running_campaigns = set()
+
+
+class CampaignService:
+    def __init__(self, campaign_repository: CampaignRepository):
+        self.campaign_repository = campaign_repository
+
+    def create_campaign(self, template: str, total: int, failures: Optional[list] = None) -> str:
+        """Record a queued campaign; ``failures`` are recipients rejected up front."""
+        failures = failures or []
+        now = datetime.now(timezone.utc)
+        return self.campaign_repository.create_campaign(
+            {
+                "template": template,
+                "status": CampaignStatus.QUEUED.value,
+                "total": total,
+                "sent": 0,
+                "failed": len(failures),
+                "failures": failures,
+                "error": None,
+                "created_at": now,
+                "updated_at": now,
+                "started_at": None,
+                "finished_at": None,
+            }
+        )
+
+    def get_campaign(self, campaign_id: str):
+        campaign = self.campaign_repository.get_campaign_by_id(campaign_id)
+        if campaign and self._is_stale(campaign):
+            self.fail_interrupted_campaigns()
+            campaign = self.campaign_repository.get_campaign_by_id(campaign_id)
+        return campaign
+
+    def fail_interrupted_campaigns(self) -> int:
+        """Mark queued or running campaigns whose process is gone (they stopped
+        reporting progress) as failed; returns how many there were."""
+        now = datetime.now(timezone.utc)
+        return self.campaign_repository.fail_stale_campaigns(
+            [CampaignStatus.QUEUED.value, CampaignStatus.RUNNING.value],
+            now - timedelta(seconds=CAMPAIGN_STALE_SECONDS),
+            {
+                "status": CampaignStatus.FAILED.value,
+                "error": "Campaign interrupted",
+                "finished_at": now,
+            },
+        )
+
+    @staticmethod
+    def _is_stale(campaign: dict) -> bool:
+        if campaign.get("status") not in (
+            CampaignStatus.QUEUED.value,
+            CampaignStatus.RUNNING.value,
+        ):
+            return False
+        updated_at = campaign.get("updated_at")
+        if updated_at is None:
+            return True
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) - updated_at > timedelta(
+            seconds=CAMPAIGN_STALE_SECONDS
+        )
+
+    def start_campaign(self, campaign_id: str, messages: List[tuple]) -> asyncio.Task:
+        """Run the campaign in the background of the current event loop."""
+        task = asyncio.create_task(self.run_campaign(campaign_id, messages))
+        _running_campaigns.add(task)
+        task.add_done_callback(_running_campaigns.discard)
+        return task
+
+    async def run_campaign(self, campaign_id: str, messages: List[tuple]):
+        """
+        Send (recipient, payload) messages with WHATSAPP_CONCURRENCY workers sharing a
+        WHATSAPP_RATE_PER_SECOND token bucket. Rate-limited and 5xx responses are
+        retried (see post_with_retry); a message that still fails is recorded against
+        its recipient and the campaign carries on.
+        """
+        url = graph_url(f"{env.phone_number_id}/messages")
+        bucket = TokenBucket(env.whatsapp_rate_per_second)
+        queue = asyncio.Queue()
+        for message in messages:
+            queue.put_nowait(message)
+
+        # Counters since the last flush to MongoDB
+        pending = {"sent": 0, "failed": 0, "failures": []}
+
+        async def flush(fields: dict):
+            # updated_at doubles as a heartbeat (see fail_interrupted_campaigns)
+            fields = {**fields, "updated_at": datetime.now(timezone.utc)}
+            increments = {"sent": pending["sent"], "failed": pending["failed"]}
+            failures = pending["failures"]
+            pending.update(sent=0, failed=0, failures=[])
+            await to_thread.run_sync(
+                self.campaign_repository.update_campaign,
+                campaign_id,
+                fields,
+                increments,
+                failures,
+            )
+
+        async def send():
+            headers = auth_headers()
+            while True:
+                try:
+                    recipient, payload = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    await post_with_retry(
+                        url, before_attempt=bucket.acquire, headers=headers, json=payload
+                    )
+                    pending["sent"] += 1
+                except Exception as e:
+                    print(f"Error sending message to {recipient.get('name')}: {e}")
+                    pending["failed"] += 1
+                    pending["failures"].append({**recipient, "reason": str(e)})
+
+        async def report_progress():
+            while True:
+                await asyncio.sleep(PROGRESS_FLUSH_SECONDS)
+                await flush({})
+
+        await flush(
+            {
+                "status": CampaignStatus.RUNNING.value,
+                "started_at": datetime.now(timezone.utc),
+            }
+        )
+        reporter = asyncio.create_task(report_progress())
+        status, error = CampaignStatus.COMPLETED, None
+        try:
+            workers = min(env.whatsapp_concurrency, queue.qsize()) or 1
+            await asyncio.gather(*(send() for _ in range(workers)))
+        except asyncio.CancelledError:
+            status, error = CampaignStatus.FAILED, "Campaign interrupted"
+            raise
+        except Exception as e:
+            print(f"Error in campaign {campaign_id}: {e}")
+            status, error = CampaignStatus.FAILED, str(e)
+        finally:
+            reporter.cancel()
+            await flush(
+                {
+                    "status": status.value,
+                    "error": error,
+                    "finished_at": datetime.now(timezone.utc),
+                }
+            )
+
+
+async def cancel_running_campaigns():
+    """Stop campaigns still running in this process (on shutdown); each is marked failed."""
+    tasks = list(_running_campaigns)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def get_campaign_service():
+    campaign_repository = CampaignRepository(database=database)
+    svc = CampaignService(campaign_repository=campaign_repository)
+    return svc
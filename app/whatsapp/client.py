@@ -0,0 +1,118 @@
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+from app.dependencies import env
+
+# Status codes worth retrying: rate limited or a Graph API server error
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def graph_url(path: str) -> str:
+    """URL of a Graph API path (e.g. "{phone_number_id}/messages") for the configured
+    API version. GRAPH_API_URL can point at a local fake server for testing."""
+    return f"{env.graph_api_url.rstrip('/')}/{env.version}/{path.lstrip('/')}"
+
+
+def auth_headers() -> dict:
+    if not env.access_token or not env.phone_number_id:
+        raise ValueError("Missing WhatsApp configuration in environment variables.")
+    return {"Authorization": f"Bearer {env.access_token}"}
+
+
+def is_rejected(response: httpx.Response) -> bool:
+    """True for a 4xx other than 429: the Graph API refused the request itself (e.g.
+    an unknown or expired media id), so sending it again unchanged will not help."""
+    return 400 <= response.status_code < 500 and response.status_code != 429
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """The process-wide AsyncClient, so every request shares one connection pool."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60, connect=10),
+            limits=httpx.Limits(
+                max_connections=env.whatsapp_concurrency,
+                max_keepalive_connections=env.whatsapp_concurrency,
+            ),
+        )
+    return _client
+
+
+async def close_async_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` tokens per second, bursting up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        # At least one whole token, or a rate below 1/s would never allow a request
+        self.capacity = max(1.0, capacity or rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+    """Retry-After if the server sent one, else exponential backoff with jitter."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    delay = min(env.whatsapp_retry_max_seconds, env.whatsapp_retry_base_seconds * 2**attempt)
+    return delay * random.uniform(0.5, 1)
+
+
+async def post_with_retry(
+    url: str,
+    before_attempt: Optional[Callable[[], Awaitable]] = None,
+    **kwargs,
+) -> httpx.Response:
+    """POST with the shared client, retrying 429/5xx responses and network errors.
+
+    ``before_attempt`` (e.g. a TokenBucket's acquire) is awaited before every
+    attempt, retries included. Raises httpx.HTTPStatusError once retries run out or
+    for other error statuses.
+    """
+    client = get_async_client()
+    for attempt in range(env.whatsapp_max_retries + 1):
+        if before_attempt:
+            await before_attempt()
+
+        response = None
+        try:
+            response = await client.post(url, **kwargs)
+        except httpx.TransportError:
+            if attempt == env.whatsapp_max_retries:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or attempt == env.whatsapp_max_retries:
+                response.raise_for_status()
+                return response
+
+        await asyncio.sleep(_retry_delay(attempt, response))
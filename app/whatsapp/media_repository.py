@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from pymongo.database import Database
+
+
+class MediaRepository:
+    """WhatsApp media ids by content hash in ``whatsapp_media``, so an image that was
+    already uploaded is not uploaded again while its id is still valid."""
+
+    def __init__(self, database: Database):
+        self.database = database
+
+    def get_media(self, content_hash: str, phone_number_id: str, now: datetime):
+        return self.database["whatsapp_media"].find_one(
+            {
+                "content_hash": content_hash,
+                "phone_number_id": phone_number_id,
+                "expires_at": {"$gt": now},
+            }
+        )
+
+    def save_media(
+        self,
+        content_hash: str,
+        phone_number_id: str,
+        media_id: str,
+        file_name: str,
+        now: datetime,
+        expires_at: datetime,
+    ):
+        self.database["whatsapp_media"].update_one(
+            {"content_hash": content_hash, "phone_number_id": phone_number_id},
+            {
+                "$set": {
+                    "media_id": media_id,
+                    "file_name": file_name,
+                    "uploaded_at": now,
+                    "expires_at": expires_at,
+                }
+            },
+            upsert=True,
+        )
+
+    def delete_media(self, content_hash: str, phone_number_id: str):
+        self.database["whatsapp_media"].delete_one(
+            {"content_hash": content_hash, "phone_number_id": phone_number_id}
+        )
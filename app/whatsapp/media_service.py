@@ -0,0 +1,99 @@
+import hashlib
+import os
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from anyio import to_thread
+
+from app.config import database, env
+from app.whatsapp.client import auth_headers, graph_url, post_with_retry
+from app.whatsapp.media_repository import MediaRepository
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(file_path: str) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MediaService:
+    """Uploads images to the WhatsApp Cloud API once per content: the returned media
+    id is kept for WHATSAPP_MEDIA_TTL_DAYS (WhatsApp keeps uploads for 30 days) and
+    reused for every later send of the same bytes. Uploads stream from disk."""
+
+    def __init__(self, media_repository: MediaRepository):
+        self.media_repository = media_repository
+
+    def _cached_media_id(self, content_hash: str):
+        media = self.media_repository.get_media(
+            content_hash, env.phone_number_id, datetime.now(timezone.utc)
+        )
+        return media["media_id"] if media else None
+
+    def _remember(self, content_hash: str, media_id: str, file_path: str):
+        now = datetime.now(timezone.utc)
+        self.media_repository.save_media(
+            content_hash,
+            env.phone_number_id,
+            media_id,
+            os.path.basename(file_path),
+            now,
+            now + timedelta(days=env.whatsapp_media_ttl_days),
+        )
+
+    def upload_file(self, file_path: str, content_type: str = "image/png") -> str:
+        """Media id for the file, uploading it only if it is not cached."""
+        content_hash = file_sha256(file_path)
+        media_id = self._cached_media_id(content_hash)
+        if media_id:
+            return media_id
+
+        with open(file_path, "rb") as f:
+            response = httpx.post(
+                graph_url(f"{env.phone_number_id}/media"),
+                headers=auth_headers(),
+                data={"messaging_product": "whatsapp"},
+                files={"file": (os.path.basename(file_path), f, content_type)},
+                timeout=60,
+            )
+            response.raise_for_status()
+
+        media_id = response.json().get("id")
+        self._remember(content_hash, media_id, file_path)
+        return media_id
+
+    async def upload_file_async(self, file_path: str, content_type: str = "image/png") -> str:
+        """upload_file for the event loop: hashing and MongoDB calls run in worker
+        threads and the upload uses the shared AsyncClient with retries."""
+        content_hash = await to_thread.run_sync(file_sha256, file_path)
+        media_id = await to_thread.run_sync(self._cached_media_id, content_hash)
+        if media_id:
+            return media_id
+
+        # httpx rewinds and streams the file in chunks on every attempt
+        with open(file_path, "rb") as f:
+            response = await post_with_retry(
+                graph_url(f"{env.phone_number_id}/media"),
+                headers=auth_headers(),
+                data={"messaging_product": "whatsapp"},
+                files={"file": (os.path.basename(file_path), f, content_type)},
+            )
+
+        media_id = response.json().get("id")
+        await to_thread.run_sync(self._remember, content_hash, media_id, file_path)
+        return media_id
+
+    def forget(self, file_path: str):
+        """Drop the cached id of a file (e.g. WhatsApp no longer knows it)."""
+        self.media_repository.delete_media(file_sha256(file_path), env.phone_number_id)
+
+
+def get_media_service():
+    media_repository = MediaRepository(database=database)
+    svc = MediaService(media_repository=media_repository)
+    return svc
@@ -0,0 +1,33 @@
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+from pydantic import Field
+
+from app.utils import AppModel
+
+
+class CampaignStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class CampaignFailure(AppModel):
+    name: Optional[str] = None
+    mobile_number: Optional[str] = None
+    reason: str
+
+
+class CampaignResponse(AppModel):
+    id: str = Field(default=None, alias="_id")
+    template: str
+    status: CampaignStatus
+    total: int = 0
+    sent: int = 0
+    failed: int = 0
+    failures: List[CampaignFailure] = []
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,54 @@
+"""
+Create thumbnails and previews for address proofs uploaded before they were made
+on upload.
+
+Finds every address proof file whose contacts have no variants made from it and
+runs ContactService.create_address_proof_images for it (files that are not
+images, e.g. PDFs, are skipped). Requires Pillow.
+
+Usage:
+    python -m scripts.backfill_contact_thumbnails
+    python -m scripts.backfill_contact_thumbnails --execute
+"""
+import argparse
+
+from app.config import database
+from app.contact.contact_service import get_contact_service
+
+
+def backfill_contact_thumbnails(dry_run=True):
+    contacts = database["contacts"].find(
+        {"address_proof": {"$nin": ["", None]}},
+        {"address_proof": 1, "address_proof_variants": 1},
+    )
+    filenames = sorted(
+        {
+            contact["address_proof"]
+            for contact in contacts
+            if (contact.get("address_proof_variants") or {}).get("source")
+            != contact["address_proof"]
+        }
+    )
+    print(f"{len(filenames)} address proof files without thumbnails")
+
+    if dry_run:
+        print(f"--- DRY RUN: thumbnails would be created for {len(filenames)} files ---")
+        return
+
+    svc = get_contact_service()
+    created = 0
+    for filename in filenames:
+        try:
+            if svc.create_address_proof_images(filename):
+                created += 1
+        except Exception as e:
+            print(f"{filename}: {e}")
+    print(f"--- BACKFILL COMPLETE. Created thumbnails for {created} of {len(filenames)} files ---")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--execute", action="store_true", help="Actually create the thumbnails")
+    args = parser.parse_args()
+
+    backfill_contact_thumbnails(dry_run=not args.execute)
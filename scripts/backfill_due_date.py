@@ -0,0 +1,46 @@
+"""
+Backfill the ``due_date`` field (out_date + rental_duration days) on rental orders.
+
+New and updated rental orders get due_date on write; this fills it in for older
+orders so GET /orders/rentals/expired can use the (status, due_date) index for all
+of them. The update runs server-side as a single pipeline update.
+"""
+import argparse
+
+from app.config import database
+
+
+def backfill_due_date(dry_run=True):
+    collection = database["rental_orders"]
+    query = {"due_date": {"$exists": False}, "out_date": {"$ne": None}}
+
+    count = collection.count_documents(query)
+    if dry_run:
+        print(f"--- DRY RUN: {count} rental orders are missing due_date ---")
+        return
+
+    result = collection.update_many(
+        query,
+        [
+            {
+                "$set": {
+                    "due_date": {
+                        "$dateAdd": {
+                            "startDate": "$out_date",
+                            "unit": "day",
+                            "amount": {"$ifNull": ["$rental_duration", 0]},
+                        }
+                    }
+                }
+            }
+        ],
+    )
+    print(f"--- BACKFILL COMPLETE. Updated {result.modified_count} rental orders ---")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--execute", action="store_true", help="Actually execute the database updates")
+    args = parser.parse_args()
+
+    backfill_due_date(dry_run=not args.execute)
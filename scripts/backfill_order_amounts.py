@@ -0,0 +1,55 @@
+"""
+Backfill the stored ``subtotal``, ``gst_amount`` and ``final_amount`` fields on
+rental orders.
+
+New and updated rental orders get them on write; this fills them in for older
+orders (or, with --all, recomputes every order after a change to
+calculate_order_amounts) so filters and sorts such as final_amount:gte:10000 can
+use the final_amount index.
+"""
+import argparse
+
+from pymongo import UpdateOne
+
+from app.config import database
+from app.order.utils import calculate_order_amounts
+
+BATCH_SIZE = 1000
+AMOUNT_FIELDS = ["subtotal", "gst_amount", "final_amount"]
+
+
+def backfill_order_amounts(dry_run=True, recompute_all=False):
+    collection = database["rental_orders"]
+    query = {} if recompute_all else {"final_amount": {"$exists": False}}
+
+    count = collection.count_documents(query)
+    if dry_run:
+        print(f"--- DRY RUN: {count} rental orders would be updated ---")
+        return
+
+    updated = 0
+    operations = []
+    for order in collection.find(query, batch_size=BATCH_SIZE):
+        amounts = calculate_order_amounts(order)
+        operations.append(
+            UpdateOne(
+                {"_id": order["_id"]},
+                {"$set": {field: amounts[field] for field in AMOUNT_FIELDS}},
+            )
+        )
+        if len(operations) >= BATCH_SIZE:
+            updated += collection.bulk_write(operations, ordered=False).modified_count
+            operations = []
+    if operations:
+        updated += collection.bulk_write(operations, ordered=False).modified_count
+
+    print(f"--- BACKFILL COMPLETE. Updated {updated} rental orders ---")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--execute", action="store_true", help="Actually execute the database updates")
+    parser.add_argument("--all", action="store_true", help="Recompute the amounts of every rental order")
+    args = parser.parse_args()
+
+    backfill_order_amounts(dry_run=not args.execute, recompute_all=args.all)
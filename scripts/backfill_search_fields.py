@@ -0,0 +1,59 @@
+"""
+Backfill the ``search_name`` and ``search_terms`` fields on contacts and products.
+
+New and updated contacts and products get them on write; this fills them in for
+older documents so GET /contacts/search and GET /products/search can find them.
+Pass --all to recompute them everywhere, e.g. after changing app/search.py.
+
+Usage:
+    python -m scripts.backfill_search_fields
+    python -m scripts.backfill_search_fields --execute [--all]
+"""
+import argparse
+
+from pymongo import UpdateOne
+
+from app.config import database
+from app.search import contact_search_fields, product_search_fields
+
+SEARCH_FIELDS = {
+    "contacts": (
+        contact_search_fields,
+        ["name", "company_name", "gstin", "personal_number", "office_number"],
+    ),
+    "products": (product_search_fields, ["name", "product_code"]),
+}
+
+
+def backfill_search_fields(dry_run=True, recompute=False, batch_size=1000):
+    for collection_name, (search_fields, source_fields) in SEARCH_FIELDS.items():
+        collection = database[collection_name]
+        query = {} if recompute else {"search_terms": {"$exists": False}}
+
+        count = collection.count_documents(query)
+        if dry_run:
+            print(f"--- DRY RUN: {count} {collection_name} would be updated ---")
+            continue
+
+        updated = 0
+        operations = []
+        for document in collection.find(query, {field: 1 for field in source_fields}):
+            operations.append(
+                UpdateOne({"_id": document["_id"]}, {"$set": search_fields(document)})
+            )
+            if len(operations) == batch_size:
+                updated += collection.bulk_write(operations, ordered=False).modified_count
+                operations = []
+        if operations:
+            updated += collection.bulk_write(operations, ordered=False).modified_count
+
+        print(f"--- BACKFILL COMPLETE. Updated {updated} {collection_name} ---")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--execute", action="store_true", help="Actually execute the database updates")
+    parser.add_argument("--all", action="store_true", help="Recompute the fields on every document")
+    args = parser.parse_args()
+
+    backfill_search_fields(dry_run=not args.execute, recompute=args.all)
@@ -0,0 +1,84 @@
+"""
+Benchmark invoice ID generation as ``rental_orders`` grows.
+
+Compares the legacy full scan (regex find + max in Python) with the counter-backed
+``generate_invoice_id``. Runs against a scratch database on MONGO_URI which is
+dropped afterwards, so it is safe to point at a local mongod.
+
+Usage:
+    python -m scripts.benchmark_invoice_ids --sizes 1000,10000,100000,1000000
+"""
+from datetime import datetime
+import argparse
+import statistics
+import time
+
+from app.auth.schema import Branch
+from app.config import client
+from app.order.schema import BillingMode
+from app.order.utils import _invoice_stream, generate_invoice_id
+
+BATCH_SIZE = 10_000
+
+
+def fill_rental_orders(db, prefix: str, start: int, stop: int, now: datetime):
+    for batch_start in range(start, stop, BATCH_SIZE):
+        batch_stop = min(batch_start + BATCH_SIZE, stop)
+        db["rental_orders"].insert_many(
+            [
+                {
+                    "order_id": f"RO/PADUR-1/26-27/{i:04d}",
+                    "invoice_id": f"{prefix}{i:04d}",
+                    "invoice_date": now,
+                    "created_at": now,
+                    "branch": Branch.PADUR.value,
+                    "billing_mode": BillingMode.B2B.value,
+                }
+                for i in range(batch_start + 1, batch_stop + 1)
+            ],
+            ordered=False,
+        )
+
+
+def time_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database", default="ims_benchmark")
+    args = parser.parse_args()
+
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    db = client[args.database]
+    client.drop_database(args.database)
+
+    now = datetime.now()
+    _, prefix, legacy_scan, _ = _invoice_stream(db, now, Branch.PADUR, BillingMode.B2B)
+
+    print(f"{'rows':>10} {'legacy scan (ms)':>18} {'counter (ms)':>14}")
+    try:
+        filled = 0
+        for size in sizes:
+            fill_rental_orders(db, prefix, filled, size, now)
+            filled = size
+
+            legacy_ms = time_ms(legacy_scan, args.repeat)
+            counter_ms = time_ms(
+                lambda: generate_invoice_id(db, Branch.PADUR, BillingMode.B2B),
+                args.repeat,
+            )
+            print(f"{size:>10} {legacy_ms:>18.2f} {counter_ms:>14.2f}")
+    finally:
+        client.drop_database(args.database)
+
+
+if __name__ == "__main__":
+    main()
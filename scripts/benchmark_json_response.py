@@ -0,0 +1,82 @@
+"""
+Benchmark rendering list endpoint responses with the stdlib JSONResponse versus
+the app's ORJSONResponse (the default response class).
+
+FastAPI turns a response_model result into JSON-ready data and hands it to the
+response class to render; this times that render step for the rental and product
+list payloads, plus ORJSONResponse on raw MongoDB documents (ObjectId, datetime).
+
+Usage:
+    python -m scripts.benchmark_json_response --orders 1000 --lines 10
+"""
+from datetime import datetime, timezone
+import argparse
+import statistics
+import time
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+
+from app.order.schema import RentalOrder
+from app.product.schema import ProductResponse
+from app.responses import ORJSONResponse, list_adapter
+from scripts.benchmark_order_serialization import rental_document
+
+
+def product_document(now: datetime) -> dict:
+    return {
+        "_id": ObjectId(),
+        "name": "Product",
+        "product_code": "P1",
+        "category": {"_id": str(ObjectId()), "name": "Lighting"},
+        "unit": {"_id": str(ObjectId()), "name": "pcs"},
+        "price": 1500,
+        "repair_count": 0,
+        "quantity": 40,
+        "available_stock": 32,
+        "rent_per_unit": 150.0,
+        "type": "rental",
+        "created_at": now,
+        "purchase_date": now,
+    }
+
+
+def time_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--lines", type=int, default=10)
+    parser.add_argument("--products", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    rentals = [rental_document(args.lines, now) for _ in range(args.orders)]
+    products = [product_document(now) for _ in range(args.products)]
+
+    for name, model, documents in (
+        (f"rentals ({args.orders} x {args.lines} lines)", RentalOrder, rentals),
+        (f"products ({args.products})", ProductResponse, products),
+    ):
+        adapter = list_adapter(model)
+        content = adapter.dump_python(adapter.validate_python(documents), mode="json", by_alias=True)
+        before = time_ms(lambda: JSONResponse(content), args.repeat)
+        after = time_ms(lambda: ORJSONResponse(content), args.repeat)
+        raw = time_ms(lambda: ORJSONResponse(documents), args.repeat)
+        size = len(ORJSONResponse(content).body)
+        print(name)
+        print(f"  JSONResponse        {before:8.2f} ms  {size / before / 1000:8.1f} MB/s")
+        print(f"  ORJSONResponse      {after:8.2f} ms  {size / after / 1000:8.1f} MB/s")
+        print(f"  ORJSONResponse raw  {raw:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Load-test a running API instance and report latency percentiles and throughput.
+
+Start the server against a local mongod, then run this script once per
+configuration you want to compare, e.g. with the previous default threadpool and
+with THREADPOOL_SIZE / MONGO_MAX_POOL_SIZE tuned:
+
+    THREADPOOL_SIZE=40 sh ./scripts/launch_prod.sh
+    python -m scripts.benchmark_load --url http://localhost:8000/orders/rentals?limit=50
+
+    THREADPOOL_SIZE=100 MONGO_MAX_POOL_SIZE=100 sh ./scripts/launch_prod.sh
+    python -m scripts.benchmark_load --url http://localhost:8000/orders/rentals?limit=50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def run(url: str, requests: int, concurrency: int):
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+
+        async def one():
+            nonlocal errors
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    if response.status_code >= 500:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p99_index = max(0, int(len(latencies) * 0.99) - 1)
+    print(f"requests     {requests} ({concurrency} concurrent), errors {errors}")
+    print(f"p50          {statistics.median(latencies):.1f} ms")
+    print(f"p99          {latencies[p99_index]:.1f} ms")
+    print(f"throughput   {requests / elapsed:.1f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://localhost:8000/orders/rentals?limit=50")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.url, args.requests, args.concurrency))
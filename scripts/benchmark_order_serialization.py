@@ -0,0 +1,113 @@
+"""
+Benchmark building the GET /orders/rentals response for a 1000-order page.
+
+Compares, on synthetic documents shaped like stored rental orders:
+- previous: ProductDetails/Deposit/RentalOrder built by hand, then FastAPI's
+  response_model pass (dump, validate again, jsonable dump, json.dumps);
+- strict:   one TypeAdapter validation and a Rust JSON dump (model_list_response);
+- trusted:  orjson over the raw documents (RESPONSE_VALIDATION=trusted).
+
+No database is needed.
+
+Usage:
+    python -m scripts.benchmark_order_serialization --orders 1000 --lines 10
+"""
+from datetime import datetime, timezone
+import argparse
+import copy
+import json
+import statistics
+import time
+
+from bson import ObjectId
+
+from app.order.schema import Deposit, ProductDetails, RentalOrder
+from app.responses import list_adapter, model_list_response
+
+
+def rental_document(lines: int, now: datetime) -> dict:
+    return {
+        "_id": ObjectId(),
+        "order_id": "RO/PADUR-1/26-27/0001",
+        "customer": None,
+        "remarks": "",
+        "gst": 18,
+        "created_at": now,
+        "out_date": now,
+        "in_date": None,
+        "rental_duration": 3,
+        "event_address": "Chennai",
+        "deposits": [
+            {"_id": str(ObjectId()), "amount": 1000.0, "date": now, "product": None, "mode": "Cash"}
+        ],
+        "product_details": [
+            {
+                "_id": str(ObjectId()),
+                "name": f"Product {i}",
+                "category": "Lighting",
+                "billing_unit": "days",
+                "product_unit": {"_id": str(ObjectId()), "name": "pcs"},
+                "in_date": None,
+                "out_date": now,
+                "order_repair_count": 0,
+                "order_quantity": 4,
+                "rent_per_unit": 150.0,
+                "product_code": f"P{i}",
+                "duration": 3,
+                "damage": "",
+                "type": "rental",
+                "description": "",
+            }
+            for i in range(lines)
+        ],
+    }
+
+
+def previous_path(documents: list) -> bytes:
+    for order in documents:
+        order["product_details"] = [ProductDetails(**line) for line in order["product_details"]]
+        order["deposits"] = [Deposit(**deposit) for deposit in order["deposits"]]
+    models = [RentalOrder(**order) for order in documents]
+
+    # What FastAPI does with the returned models for response_model=List[RentalOrder]
+    adapter = list_adapter(RentalOrder)
+    validated = adapter.validate_python([model.model_dump(by_alias=True) for model in models])
+    content = adapter.dump_python(validated, mode="json", by_alias=True)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def time_ms(fn, documents: list, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        batch = copy.deepcopy(documents)
+        started = time.perf_counter()
+        fn(batch)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--lines", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    documents = [rental_document(args.lines, now) for _ in range(args.orders)]
+
+    paths = {
+        "previous": previous_path,
+        "strict": lambda batch: model_list_response(RentalOrder, batch, trusted=False).body,
+        "trusted": lambda batch: model_list_response(RentalOrder, batch, trusted=True).body,
+    }
+    print(f"{args.orders} rental orders x {args.lines} lines")
+    baseline = None
+    for name, fn in paths.items():
+        elapsed = time_ms(fn, documents, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{name:<10} {elapsed:8.1f} ms  ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
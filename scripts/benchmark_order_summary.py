@@ -0,0 +1,112 @@
+"""
+Benchmark rental order totals: the aggregation pipeline behind
+GET /orders/rentals/summary versus fetching every order and looping over
+``calculate_final_amount`` in Python.
+
+Runs against a scratch database on MONGO_URI which is dropped afterwards, and
+checks both give the same grouped totals.
+
+Usage:
+    python -m scripts.benchmark_order_summary --sizes 1000,10000,100000
+"""
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+import argparse
+import random
+import statistics
+import time
+
+from app.config import client
+from app.order.aggregations import SummaryGroup, rental_summary_pipeline
+from app.order.utils import calculate_final_amount
+
+BATCH_SIZE = 10_000
+GROUP_BY = [SummaryGroup.BRANCH, SummaryGroup.BILLING_MODE, SummaryGroup.STATUS]
+
+
+def rental_document(rng: random.Random, now: datetime) -> dict:
+    return {
+        "order_id": "RO/BENCH",
+        "branch": rng.choice(["PADUR", "KELAMBAKKAM", "PUDUPAKKAM"]),
+        "billing_mode": rng.choice(["B2B", "B2C"]),
+        "status": rng.choice(["pending", "paid", "no bill"]),
+        "created_at": now - timedelta(days=rng.randint(0, 365)),
+        "discount": rng.choice([0, 50, 10]),
+        "discount_type": rng.choice(["rupees", "percent"]),
+        "gst": rng.choice([0, 18, 12]),
+        "round_off": rng.choice([0, 0.5, -0.25]),
+        "eway_amount": rng.choice([0, 500]),
+        "damage_expenses": rng.choice([0, 250]),
+        "balance_paid": rng.choice([0, 1000]),
+        "product_details": [
+            {
+                "order_quantity": rng.randint(1, 20),
+                "duration": rng.randint(1, 10),
+                "rent_per_unit": rng.choice([12.5, 150, 99.99]),
+            }
+            for _ in range(rng.randint(1, 10))
+        ],
+    }
+
+
+def python_summary(collection) -> dict:
+    totals = defaultdict(lambda: [0, 0.0])
+    for order in collection.find({}):
+        key = tuple(order.get(group.value) for group in GROUP_BY)
+        totals[key][0] += 1
+        totals[key][1] += calculate_final_amount(order)
+    return {key: (count, round(amount, 2)) for key, (count, amount) in totals.items()}
+
+
+def aggregation_summary(collection) -> dict:
+    return {
+        tuple(row.get(group.value) for group in GROUP_BY): (row["orders"], row["final_amount"])
+        for row in collection.aggregate(rental_summary_pipeline(group_by=GROUP_BY))
+    }
+
+
+def time_ms(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database", default="ims_benchmark")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    collection = client[args.database]["rental_orders"]
+    collection.drop()
+
+    try:
+        filled = 0
+        for size in sorted(int(size) for size in args.sizes.split(",")):
+            while filled < size:
+                count = min(BATCH_SIZE, size - filled)
+                collection.insert_many([rental_document(rng, now) for _ in range(count)])
+                filled += count
+
+            python_ms, expected = time_ms(lambda: python_summary(collection), args.repeat)
+            aggregation_ms, actual = time_ms(lambda: aggregation_summary(collection), args.repeat)
+            matches = expected.keys() == actual.keys() and all(
+                expected[key][0] == actual[key][0] and abs(expected[key][1] - actual[key][1]) <= 0.01 * expected[key][0]
+                for key in expected
+            )
+            print(
+                f"{size:>9} orders  python {python_ms:9.1f} ms  aggregation {aggregation_ms:9.1f} ms"
+                f"  ({python_ms / aggregation_ms:.1f}x)  totals {'match' if matches else 'DIFFER'}"
+            )
+    finally:
+        client.drop_database(args.database)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark resolving categories and units for the product catalog.
+
+Compares the previous per-product lookups (2N+1 round-trips) with
+ProductService.get_products (3 round-trips). Runs against a scratch database on
+MONGO_URI which is dropped afterwards.
+
+Usage:
+    python -m scripts.benchmark_products --products 5000
+"""
+from datetime import datetime, timezone
+import argparse
+import time
+
+from app.config import client
+from app.product.product_repository import ProductRepository
+from app.product.product_service import ProductService
+from app.product_category.product_category_repository import ProductCategoryRepository
+from app.unit.unit_repository import UnitRepository
+
+
+def seed_catalog(db, products: int, categories: int = 50, units: int = 10):
+    now = datetime.now(tz=timezone.utc)
+    category_ids = db["product_categories"].insert_many(
+        [{"name": f"Category {i}", "created_at": now} for i in range(categories)]
+    ).inserted_ids
+    unit_ids = db["units"].insert_many(
+        [{"name": f"Unit {i}", "created_at": now} for i in range(units)]
+    ).inserted_ids
+    db["products"].insert_many(
+        [
+            {
+                "name": f"Product {i}",
+                "created_at": now,
+                "quantity": 10,
+                "available_stock": 10,
+                "repair_count": 0,
+                "product_code": f"P{i:05d}",
+                "category": str(category_ids[i % categories]),
+                "price": 100,
+                "type": "rental",
+                "purchase_date": now,
+                "unit": str(unit_ids[i % units]),
+                "rent_per_unit": 10.0,
+            }
+            for i in range(products)
+        ]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, default=5000)
+    parser.add_argument("--database", default="ims_benchmark")
+    args = parser.parse_args()
+
+    client.drop_database(args.database)
+    db = client[args.database]
+    svc = ProductService(
+        product_repository=ProductRepository(database=db),
+        product_category_repository=ProductCategoryRepository(database=db),
+        unit_repository=UnitRepository(database=db),
+    )
+
+    try:
+        seed_catalog(db, args.products)
+
+        started = time.perf_counter()
+        for product in svc.repository.get_products():
+            svc.product_category_repository.get_product_category_by_id(product["category"])
+            svc.unit_repository.get_unit_by_id(product["unit"])
+        per_row_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        svc.get_products()
+        batched_ms = (time.perf_counter() - started) * 1000
+
+        print(f"products          {args.products}")
+        print(f"per-row lookups   {per_row_ms:.1f} ms")
+        print(f"batched lookups   {batched_ms:.1f} ms")
+    finally:
+        client.drop_database(args.database)
+
+
+if __name__ == "__main__":
+    main()
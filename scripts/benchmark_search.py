@@ -0,0 +1,101 @@
+"""
+Benchmark typeahead search over contacts.
+
+Seeds a scratch database on MONGO_URI with synthetic contacts and the indexes from
+app/indexes.py, then times ContactRepository.search_contacts against the previous
+unanchored, case-insensitive regex filter for the same queries. The database is
+dropped afterwards.
+
+Usage:
+    python -m scripts.benchmark_search --contacts 100000
+"""
+from datetime import datetime, timezone
+import argparse
+import random
+import re
+import time
+
+from app.config import client
+from app.contact.contact_repository import ContactRepository
+from app.indexes import INDEXES, ensure_indexes
+from app.search import contact_search_fields
+
+FIRST_NAMES = ["Ravi", "Priya", "Arun", "Lakshmi", "Karthik", "Divya", "Suresh", "Meena", "Vijay", "Anitha"]
+LAST_NAMES = ["Kumar", "Raman", "Subramanian", "Krishnan", "Natarajan", "Selvam", "Murugan", "Pillai"]
+COMPANIES = ["Traders", "Constructions", "Builders", "Enterprises", "Engineering", "Hardwares"]
+
+QUERIES = ["ra", "ravi k", "kumar", "constr", "98401", "+91 98401 0", "33ab", "priya raman"]
+
+
+def seed_contacts(db, contacts: int):
+    rng = random.Random(0)
+    now = datetime.now(tz=timezone.utc)
+    batch = []
+    for i in range(contacts):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        contact = {
+            "name": f"{first} {last} {i}",
+            "personal_number": f"+91 98{rng.randrange(10**8):08d}",
+            "office_number": None,
+            "gstin": f"33AB{rng.randrange(10**6):06d}Z{i % 10}",
+            "email": f"contact{i}@example.com",
+            "address": "Chennai",
+            "pincode": "600001",
+            "address_proof": "",
+            "company_name": f"{last} {rng.choice(COMPANIES)}",
+            "remarks": "",
+            "branch": "PADUR-1",
+            "created_at": now,
+        }
+        batch.append({**contact, **contact_search_fields(contact)})
+        if len(batch) == 10000:
+            db["contacts"].insert_many(batch)
+            batch = []
+    if batch:
+        db["contacts"].insert_many(batch)
+
+
+def timed(function, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--contacts", type=int, default=100000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database", default="ims_benchmark")
+    args = parser.parse_args()
+
+    client.drop_database(args.database)
+    db = client[args.database]
+    repository = ContactRepository(database=db)
+
+    try:
+        seed_contacts(db, args.contacts)
+        ensure_indexes(db, {"contacts": INDEXES["contacts"]})
+
+        print(f"contacts {args.contacts}, limit {args.limit}")
+        print(f"{'query':<16} {'regex ms':>10} {'search ms':>10}  top result")
+        for query in QUERIES:
+            regex = {"$regex": re.escape(query), "$options": "i"}
+            regex_ms = timed(
+                lambda: db["contacts"]
+                .find({"$or": [{"name": regex}, {"company_name": regex}, {"gstin": regex}, {"personal_number": regex}]})
+                .limit(args.limit)
+                .to_list(),
+                args.repeat,
+            )
+            search_ms = timed(lambda: repository.search_contacts(query, limit=args.limit), args.repeat)
+            results = repository.search_contacts(query, limit=args.limit)
+            top = results[0]["name"] if results else "-"
+            print(f"{query:<16} {regex_ms:>10.1f} {search_ms:>10.1f}  {top}")
+    finally:
+        client.drop_database(args.database)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Benchmark repeat loads of uploaded files with and without the cache headers of
+app/static.py.
+
+Writes ``--files`` content-addressed images and one ``--pdf-mb`` purchase PDF into
+app/public (removed afterwards), then loads them ``--loads`` times through a small
+browser-cache model that honours Cache-Control max-age/immutable and revalidates
+with If-None-Match. It compares the plain StaticFiles mount and FileResponse
+download that were used before with CachedStaticFiles and the current
+/download-static endpoint. It also fetches the last 256 KiB of the PDF with a
+Range request.
+
+Usage:
+    python -m scripts.benchmark_static_files --files 20 --loads 10
+"""
+import argparse
+import hashlib
+import os
+import re
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import FileResponse
+from fastapi.staticfiles import StaticFiles
+from fastapi.testclient import TestClient
+
+from app.static import CachedStaticFiles, static_file_response
+
+
+class BrowserCache:
+    """Just enough of a browser HTTP cache to count what repeat loads transfer."""
+
+    def __init__(self, client: TestClient):
+        self.client = client
+        self.entries = {}
+        self.requests = 0
+        self.bytes = 0
+
+    def get(self, url: str):
+        entry = self.entries.get(url)
+        if entry and entry["expires_at"] > time.monotonic():
+            return  # fresh: served from cache without a request
+
+        headers = {}
+        if entry and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        response = self.client.get(url, headers=headers)
+        self.requests += 1
+        self.bytes += len(response.content)
+
+        if response.status_code == 304:
+            entry["expires_at"] = time.monotonic() + self._max_age(response)
+            return
+        self.entries[url] = {
+            "etag": response.headers.get("etag"),
+            "expires_at": time.monotonic() + self._max_age(response),
+        }
+
+    @staticmethod
+    def _max_age(response) -> float:
+        match = re.search(r"max-age=(\d+)", response.headers.get("cache-control", ""))
+        return int(match.group(1)) if match else 0
+
+
+def baseline_app(root: str) -> FastAPI:
+    """The serving setup before app/static.py."""
+    app = FastAPI()
+    app.mount("/public", StaticFiles(directory=root), name="public")
+
+    @app.get("/download-static/contact/{file_name}")
+    def download(file_name: str):
+        path = os.path.join(root, "contact", file_name)
+        return FileResponse(path=path, filename=file_name)
+
+    return app
+
+
+def cached_app(root: str) -> FastAPI:
+    app = FastAPI()
+    app.mount("/public", CachedStaticFiles(directory=root), name="public")
+
+    @app.get("/download-static/contact/{file_name}")
+    def download(file_name: str, request: Request):
+        path = os.path.join(root, "contact", file_name)
+        return static_file_response(path, os.stat(path), request.headers, filename=file_name)
+
+    return app
+
+
+def write_files(root: str, files: int, image_kb: int, pdf_mb: int):
+    paths, urls = [], []
+    for i in range(files):
+        content = os.urandom(image_kb * 1024)
+        name = f"{hashlib.sha256(content).hexdigest()}.png"
+        path = os.path.join(root, "contact", name)
+        with open(path, "wb") as f:
+            f.write(content)
+        paths.append(path)
+        urls.append(f"/public/contact/{name}")
+        urls.append(f"/download-static/contact/{name}")
+
+    os.makedirs(os.path.join(root, "purchase"), exist_ok=True)
+    pdf_path = os.path.join(root, "purchase", "BENCHMARK.pdf")
+    with open(pdf_path, "wb") as f:
+        f.write(os.urandom(pdf_mb * 1024 * 1024))
+    paths.append(pdf_path)
+    urls.append("/public/purchase/BENCHMARK.pdf")
+    return paths, urls
+
+
+def run(label: str, app: FastAPI, urls: list, loads: int):
+    browser = BrowserCache(TestClient(app))
+    for url in urls:
+        browser.get(url)
+    first = (browser.requests, browser.bytes)
+    for _ in range(loads):
+        for url in urls:
+            browser.get(url)
+    repeat_requests = browser.requests - first[0]
+    repeat_bytes = browser.bytes - first[1]
+    print(
+        f"{label:<10} first load: {first[0]:>4} requests {first[1] / 1024:>10.0f} KiB | "
+        f"{loads} repeat loads: {repeat_requests:>5} requests {repeat_bytes / 1024:>10.0f} KiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--image-kb", type=int, default=200)
+    parser.add_argument("--pdf-mb", type=int, default=5)
+    parser.add_argument("--loads", type=int, default=10)
+    args = parser.parse_args()
+
+    root = "app/public"
+    paths, urls = write_files(root, args.files, args.image_kb, args.pdf_mb)
+    try:
+        run("baseline", baseline_app(root), urls, args.loads)
+        run("cached", cached_app(root), urls, args.loads)
+
+        client = TestClient(cached_app(root))
+        response = client.get(
+            "/public/purchase/BENCHMARK.pdf", headers={"Range": "bytes=-262144"}
+        )
+        print(
+            f"Range request for the PDF tail: {response.status_code}, "
+            f"{len(response.content) / 1024:.0f} KiB of {args.pdf_mb * 1024} KiB"
+        )
+    finally:
+        for path in paths:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
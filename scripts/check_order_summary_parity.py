@@ -0,0 +1,57 @@
+"""
+Check that the aggregation behind GET /orders/rentals/summary computes the same
+final amount as ``calculate_final_amount`` for every rental order.
+
+Read-only; runs against the configured database. Exits non-zero on mismatches.
+
+Usage:
+    python -m scripts.check_order_summary_parity
+    python -m scripts.check_order_summary_parity --filter branch:PADUR
+"""
+import argparse
+import sys
+
+from app.config import database
+from app.order.aggregations import final_amount_stages
+from app.order.filters import FilterBuilder
+from app.order.utils import calculate_final_amount
+
+# calculate_final_amount rounds each order to 2 decimals; allow for the last digit
+TOLERANCE = 0.005
+
+
+def check_parity(filters: dict) -> int:
+    collection = database["rental_orders"]
+    aggregated = {
+        order["_id"]: order["final_amount"]
+        for order in collection.aggregate(
+            [{"$match": filters}, *final_amount_stages(), {"$project": {"final_amount": 1}}]
+        )
+    }
+
+    checked = 0
+    mismatches = 0
+    for order in collection.find(filters):
+        checked += 1
+        try:
+            expected = calculate_final_amount(order)
+        except TypeError as e:
+            print(f"{order.get('order_id')}: calculate_final_amount failed ({e})")
+            mismatches += 1
+            continue
+        actual = aggregated.get(order["_id"])
+        if actual is None or abs(actual - expected) > TOLERANCE:
+            print(f"{order.get('order_id')}: python {expected} != aggregation {actual}")
+            mismatches += 1
+
+    print(f"--- {checked} rental orders checked, {mismatches} mismatches ---")
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--filter", action="append", help="Filters as 'field:operator:value' or 'field:value'")
+    args = parser.parse_args()
+
+    filters = FilterBuilder.build_filters(args.filter) if args.filter else {}
+    sys.exit(1 if check_parity(filters) else 0)
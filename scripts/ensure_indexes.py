@@ -0,0 +1,40 @@
+"""
+Create the MongoDB indexes declared in app/indexes.py and report on index usage.
+
+The application also applies the registry on startup (unless ENSURE_INDEXES=false),
+so this script is mostly useful for large collections before a deploy and for
+finding indexes that are missing, not declared in the registry, or never used.
+
+Usage:
+    python -m scripts.ensure_indexes --report
+    python -m scripts.ensure_indexes --execute
+"""
+import argparse
+
+from app.config import database
+from app.indexes import ensure_indexes, index_report
+
+
+def print_report():
+    for collection_name, report in index_report(database).items():
+        print(f"{collection_name}:")
+        for label in ["missing", "unregistered", "unused"]:
+            names = ", ".join(report[label]) or "-"
+            print(f"  {label:<13} {names}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--execute", action="store_true", help="Create missing indexes")
+    parser.add_argument("--report", action="store_true", help="Print the index report")
+    args = parser.parse_args()
+
+    if args.execute:
+        errors = ensure_indexes(database)
+        for collection_name, messages in errors.items():
+            for message in messages:
+                print(f"Failed to create index on {collection_name}: {message}")
+        print("--- INDEXES APPLIED ---" if not errors else "--- INDEXES APPLIED WITH ERRORS ---")
+
+    if args.report or not args.execute:
+        print_report()
@@ -0,0 +1,96 @@
+"""
+A local stand-in for the WhatsApp Cloud API (Graph API) to exercise broadcast
+campaigns without sending real messages.
+
+Serves POST /{version}/{phone_number_id}/messages and .../media with a random
+``--latency``, answers ``--rate-limit-ratio`` of the requests with 429 (with a
+Retry-After header) and ``--error-ratio`` with 500, and counts what it accepted
+at GET /stats. Start it, then run the API with GRAPH_API_URL pointing at it:
+
+Usage:
+    python -m scripts.fake_graph_api --port 9000 --rate-limit-ratio 0.05 --error-ratio 0.02
+    GRAPH_API_URL=http://127.0.0.1:9000 ACCESS_TOKEN=test PHONE_NUMBER_ID=1 python -m uvicorn app.main:app
+"""
+from collections import Counter
+import argparse
+import asyncio
+import random
+import uuid
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+app = FastAPI()
+settings = {"latency": 0.05, "rate_limit_ratio": 0.0, "error_ratio": 0.0}
+stats = Counter()
+
+
+async def _simulate(kind: str):
+    """Sleep like a real request and maybe fail; returns an error response or None."""
+    stats[f"{kind}_requests"] += 1
+    await asyncio.sleep(random.uniform(0, 2 * settings["latency"]))
+    roll = random.random()
+    if roll < settings["rate_limit_ratio"]:
+        stats[f"{kind}_429"] += 1
+        return JSONResponse(
+            {"error": {"message": "Rate limit hit", "code": 130429}},
+            status_code=429,
+            headers={"Retry-After": "1"},
+        )
+    if roll < settings["rate_limit_ratio"] + settings["error_ratio"]:
+        stats[f"{kind}_500"] += 1
+        return JSONResponse({"error": {"message": "Internal error"}}, status_code=500)
+    return None
+
+
+@app.post("/{version}/{phone_number_id}/messages")
+async def send_message(version: str, phone_number_id: str, request: Request):
+    error = await _simulate("messages")
+    if error:
+        return error
+    payload = await request.json()
+    stats["messages_sent"] += 1
+    return {
+        "messaging_product": "whatsapp",
+        "contacts": [{"input": payload.get("to"), "wa_id": payload.get("to")}],
+        "messages": [{"id": f"wamid.{uuid.uuid4().hex}"}],
+    }
+
+
+@app.post("/{version}/{phone_number_id}/media")
+async def upload_media(version: str, phone_number_id: str, request: Request):
+    error = await _simulate("media")
+    if error:
+        return error
+    await request.body()
+    stats["media_uploaded"] += 1
+    return {"id": str(random.randint(10**15, 10**16))}
+
+
+@app.get("/stats")
+def get_stats():
+    return dict(stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mean seconds per request")
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0)
+    parser.add_argument("--error-ratio", type=float, default=0.0)
+    args = parser.parse_args()
+
+    settings.update(
+        latency=args.latency,
+        rate_limit_ratio=args.rate_limit_ratio,
+        error_ratio=args.error_ratio,
+    )
+
+    import uvicorn
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
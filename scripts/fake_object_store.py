@@ -0,0 +1,86 @@
+"""
+A local stand-in for an S3-compatible object store (MinIO-style, path-style URLs)
+to exercise STORAGE_BACKEND=s3 without a real bucket.
+
+Serves PUT/GET/HEAD/DELETE /{bucket}/{key} from a temporary directory. Requests
+must carry a SigV4 Authorization header, and PUT bodies must match their
+x-amz-content-sha256. Start it, then run the API against it:
+
+Usage:
+    python -m scripts.fake_object_store --port 9100
+    STORAGE_BACKEND=s3 S3_ENDPOINT_URL=http://127.0.0.1:9100 S3_BUCKET=uploads \\
+        S3_ACCESS_KEY_ID=test S3_SECRET_ACCESS_KEY=test python -m uvicorn app.main:app
+"""
+import argparse
+import hashlib
+import os
+import tempfile
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import FileResponse
+
+app = FastAPI()
+root = tempfile.mkdtemp(prefix="fake-object-store-")
+
+
+def _path(bucket: str, key: str) -> str:
+    return os.path.join(root, bucket, *key.split("/"))
+
+
+def _unauthorized(request: Request):
+    if not request.headers.get("authorization", "").startswith("AWS4-HMAC-SHA256 "):
+        return Response(status_code=403)
+    return None
+
+
+@app.put("/{bucket}/{key:path}")
+async def put_object(bucket: str, key: str, request: Request):
+    error = _unauthorized(request)
+    if error:
+        return error
+    body = await request.body()
+    if hashlib.sha256(body).hexdigest() != request.headers.get("x-amz-content-sha256"):
+        return Response("XAmzContentSHA256Mismatch", status_code=400)
+    path = _path(bucket, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(body)
+    return Response(status_code=200)
+
+
+@app.api_route("/{bucket}/{key:path}", methods=["GET", "HEAD"])
+def get_object(bucket: str, key: str, request: Request):
+    error = _unauthorized(request)
+    if error:
+        return error
+    path = _path(bucket, key)
+    if not os.path.isfile(path):
+        return Response(status_code=404)
+    return FileResponse(path)
+
+
+@app.delete("/{bucket}/{key:path}")
+def delete_object(bucket: str, key: str, request: Request):
+    error = _unauthorized(request)
+    if error:
+        return error
+    path = _path(bucket, key)
+    if os.path.isfile(path):
+        os.remove(path)
+    return Response(status_code=204)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    print(f"Storing objects in {root}")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
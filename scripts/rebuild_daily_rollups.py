@@ -0,0 +1,41 @@
+"""
+Rebuild the ``daily_order_rollups`` collection from the rental, sales and service
+orders.
+
+Order writes keep the rollups up to date incrementally; run this once to
+backfill existing orders, after changing REPORT_TIMEZONE or the amount formula,
+or if the rollups drifted (e.g. a rollup update failed outside a transaction).
+Run it while no orders are being edited.
+"""
+import argparse
+
+from app.config import database
+from app.rollup.rollup_repository import RollupRepository
+from app.rollup.rollup_service import RollupService
+
+ROLLUP_ORDER_TYPES = ["rental", "sales", "service"]
+
+
+def rebuild_daily_rollups(dry_run=True):
+    svc = RollupService(RollupRepository(database=database))
+    rows = []
+    for order_type in ROLLUP_ORDER_TYPES:
+        rows += svc.build_rollups(
+            database[f"{order_type}_orders"].find({}, batch_size=1000), order_type
+        )
+
+    if dry_run:
+        orders = sum(row["orders"] for row in rows)
+        print(f"--- DRY RUN: {orders} orders would give {len(rows)} rollup rows ---")
+        return
+
+    svc.repository.replace_all(rows)
+    print(f"--- REBUILD COMPLETE. Wrote {len(rows)} rollup rows ---")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--execute", action="store_true", help="Actually execute the database updates")
+    args = parser.parse_args()
+
+    rebuild_daily_rollups(dry_run=not args.execute)
@@ -0,0 +1,69 @@
+"""
+Take stock out for rental orders created before stock reservation existed.
+
+New rental orders reserve ``products.available_stock`` when they are written and
+are flagged with ``stock_reserved``. Older orders never took stock out, so their
+returns must not put stock back. This script subtracts what each older order still
+holds (see ``rental_stock_holdings``) from available_stock and flags the order,
+after which its updates, returns and deletion move stock like any new order.
+
+Run it once after deploying, while no rentals are being edited.
+"""
+import argparse
+from collections import defaultdict
+
+from pymongo import UpdateOne
+from bson import ObjectId
+
+from app.config import database
+from app.order.order_service import rental_stock_holdings
+
+
+def reconcile_rental_stock(dry_run=True):
+    orders = list(database["rental_orders"].find({"stock_reserved": {"$ne": True}}))
+
+    held = defaultdict(int)
+    for order in orders:
+        for product_id, quantity in rental_stock_holdings(order).items():
+            held[product_id] += quantity
+
+    products = {
+        str(product["_id"]): product
+        for product in database["products"].find(
+            {"_id": {"$in": [ObjectId(product_id) for product_id in held]}},
+            {"name": 1, "available_stock": 1},
+        )
+    }
+    for product_id, quantity in sorted(held.items()):
+        product = products.get(product_id)
+        if not product:
+            print(f"{product_id}: product not found, {quantity} held ignored")
+            continue
+        remaining = product.get("available_stock", 0) - quantity
+        warning = "  <-- goes negative" if remaining < 0 else ""
+        print(f"{product.get('name')}: {product.get('available_stock', 0)} -> {remaining}{warning}")
+
+    if dry_run:
+        print(f"--- DRY RUN: {len(orders)} rental orders and {len(held)} products would be updated ---")
+        return
+
+    operations = [
+        UpdateOne({"_id": ObjectId(product_id)}, {"$inc": {"available_stock": -quantity}})
+        for product_id, quantity in held.items()
+        if product_id in products
+    ]
+    if operations:
+        database["products"].bulk_write(operations, ordered=False)
+    result = database["rental_orders"].update_many(
+        {"_id": {"$in": [order["_id"] for order in orders]}},
+        {"$set": {"stock_reserved": True}},
+    )
+    print(f"--- RECONCILE COMPLETE. Flagged {result.modified_count} rental orders, updated {len(operations)} products ---")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--execute", action="store_true", help="Actually execute the database updates")
+    args = parser.parse_args()
+
+    reconcile_rental_stock(dry_run=not args.execute)
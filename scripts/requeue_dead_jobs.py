@@ -0,0 +1,45 @@
+"""
+List background jobs that failed every attempt (status "dead") and optionally
+queue them again with a fresh set of attempts.
+
+Usage:
+    python -m scripts.requeue_dead_jobs --types whatsapp_dc
+    python -m scripts.requeue_dead_jobs --execute
+"""
+import argparse
+from datetime import datetime, timezone
+
+from app.config import database
+from app.jobs.job_repository import JobRepository
+from app.jobs.schema import JobType
+
+
+def requeue_dead_jobs(job_types=None, dry_run=True):
+    job_repository = JobRepository(database=database)
+    # Sensitive jobs (e.g. OTP emails) lose their payload when they die
+    jobs = [job for job in job_repository.get_dead_jobs(job_types) if job["payload"] is not None]
+    for job in jobs:
+        print(
+            f"{job['_id']} {job['type']} attempts={job['attempts']} "
+            f"failed_at={job.get('failed_at')} error={job.get('last_error')}"
+        )
+
+    if dry_run:
+        print(f"--- DRY RUN: {len(jobs)} dead jobs would be requeued ---")
+        return
+
+    count = job_repository.requeue(
+        [job["_id"] for job in jobs], datetime.now(timezone.utc)
+    )
+    print(f"--- REQUEUE COMPLETE. Requeued {count} jobs ---")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--types", nargs="*", choices=[job_type.value for job_type in JobType]
+    )
+    parser.add_argument("--execute", action="store_true", help="Actually requeue the jobs")
+    args = parser.parse_args()
+
+    requeue_dead_jobs(args.types, dry_run=not args.execute)
@@ -0,0 +1,53 @@
+"""
+Run background job workers (emails, WhatsApp DCs) outside the API processes.
+
+Each worker thread claims one job at a time from the ``jobs`` collection, so the
+API and any number of these processes can share the queue. Set JOB_WORKERS=0 on
+the API when all jobs should run here.
+
+Usage:
+    python -m scripts.run_job_worker --workers 4
+    python -m scripts.run_job_worker --types send_email
+"""
+import argparse
+import signal
+import threading
+
+from app.config import database
+from app.jobs.schema import JobType
+from app.jobs.worker import create_job_workers
+
+
+def run_job_workers(count: int, job_types=None):
+    workers = create_job_workers(database, count, job_types)
+    stopped = threading.Event()
+
+    def stop(signum, frame):
+        print("Stopping job workers...")
+        stopped.set()
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    for worker in workers:
+        worker.start()
+    print(f"Started {len(workers)} job workers for {', '.join(workers[0].job_types)}")
+
+    stopped.wait()
+    for worker in workers:
+        # A job interrupted here is run again once its lease expires
+        worker.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=2, help="Worker threads")
+    parser.add_argument(
+        "--types",
+        nargs="*",
+        choices=[job_type.value for job_type in JobType],
+        help="Only run these job types (default: all)",
+    )
+    args = parser.parse_args()
+
+    run_job_workers(args.workers, args.types)
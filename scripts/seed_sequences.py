@@ -0,0 +1,64 @@
+"""
+Seed the atomic counters in the ``counters`` collection from existing documents.
+
+Counters are also seeded lazily the first time a stream is used, so this script is
+only needed once after deploying the counter-based ID generation (or to repair a
+counter that fell behind after manual edits). Counters are only ever raised.
+"""
+from datetime import datetime
+import argparse
+
+from app.auth.schema import Branch
+from app.config import database
+from app.order.schema import BillingMode
+from app.order.utils import _invoice_stream, _order_stream
+from app.sequence.sequence_repository import SequenceRepository
+
+
+def seed_invoice_counters(repository: SequenceRepository, now: datetime, dry_run=True):
+    for branch in Branch:
+        for billing_mode in BillingMode:
+            key, prefix, seed, metadata = _invoice_stream(
+                database, now, branch, billing_mode
+            )
+            highest = seed()
+            current = repository.get_value(key)
+            print(f"{key}: highest issued {highest}, counter at {current}")
+
+            if not dry_run:
+                repository.seed(key, highest, metadata)
+
+
+def seed_order_counters(repository: SequenceRepository, now: datetime, dry_run=True):
+    for branch in Branch:
+        key, prefix, seed, metadata = _order_stream(database, now, branch)
+        highest = seed()
+        current = repository.get_value(key)
+        print(f"{key}: highest issued {highest}, counter at {current}")
+
+        if not dry_run:
+            repository.seed(key, highest, metadata)
+
+
+def seed_sequences(dry_run=True):
+    now = datetime.now()
+    repository = SequenceRepository(database=database)
+
+    if dry_run:
+        print("--- DRY RUN: counters will not be changed ---")
+
+    seed_invoice_counters(repository, now, dry_run=dry_run)
+    seed_order_counters(repository, now, dry_run=dry_run)
+
+    if dry_run:
+        print("--- DRY RUN COMPLETE. Add --execute to seed the counters ---")
+    else:
+        print("--- SEEDING COMPLETE ---")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--execute", action="store_true", help="Actually write the counters")
+    args = parser.parse_args()
+
+    seed_sequences(dry_run=not args.execute)
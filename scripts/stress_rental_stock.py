@@ -0,0 +1,106 @@
+"""
+Fire many concurrent rental creates at the same products and check stock stays
+consistent.
+
+Runs ``OrderService.create_rental_order_with_invoice`` from a thread pool against
+a scratch database on MONGO_URI (dropped afterwards). Every product starts with
+``--stock`` units and every order rents ``--quantity`` of each, so at most
+stock // quantity orders can succeed, the rest must fail with
+InsufficientStockError, and every product must end with exactly
+stock - created * quantity units (never negative).
+Set MONGO_TRANSACTIONS=true (replica set required) to exercise the transactional
+path.
+
+Usage:
+    python -m scripts.stress_rental_stock --orders 500 --workers 100
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import argparse
+
+from bson import ObjectId
+
+from app.config import client
+from app.order.order_repository import OrderRepository
+from app.order.order_service import InsufficientStockError, OrderService
+from app.order.schema import RentalOrder
+from app.product.product_repository import ProductRepository
+
+
+def rental_payload(products: list, quantity: int) -> RentalOrder:
+    now = datetime.now(timezone.utc)
+    return RentalOrder(
+        order_id="RO/STRESS",
+        remarks="",
+        gst=0,
+        deposits=[],
+        out_date=now,
+        in_date=None,
+        event_address="-",
+        product_details=[
+            {
+                "_id": str(product["_id"]),
+                "name": product["name"],
+                "category": "-",
+                "product_unit": {"_id": str(ObjectId()), "name": "pcs"},
+                "out_date": now,
+                "order_repair_count": 0,
+                "order_quantity": quantity,
+                "rent_per_unit": 1,
+            }
+            for product in products
+        ],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=100)
+    parser.add_argument("--products", type=int, default=3)
+    parser.add_argument("--stock", type=int, default=1000)
+    parser.add_argument("--quantity", type=int, default=7)
+    parser.add_argument("--database", default="ims_benchmark")
+    args = parser.parse_args()
+
+    db = client[args.database]
+    db["products"].drop()
+    db["rental_orders"].drop()
+    products = [
+        {"_id": ObjectId(), "name": f"Stress {i}", "quantity": args.stock, "available_stock": args.stock}
+        for i in range(args.products)
+    ]
+    db["products"].insert_many(products)
+
+    svc = OrderService(OrderRepository(db), ProductRepository(db))
+
+    def create(_):
+        try:
+            svc.create_rental_order_with_invoice(rental_payload(products, args.quantity))
+            return True
+        except InsufficientStockError:
+            return False
+
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(create, range(args.orders)))
+
+        created = sum(results)
+        max_created = min(args.orders, args.stock // args.quantity)
+        expected_stock = args.stock - created * args.quantity
+        print(f"orders       {args.orders} ({args.workers} concurrent)")
+        print(f"created      {created} (at most {max_created})")
+        print(f"rejected     {args.orders - created}")
+        print(f"stored       {db['rental_orders'].count_documents({})}")
+
+        ok = created <= max_created and created == db["rental_orders"].count_documents({})
+        for product in db["products"].find({}, {"name": 1, "available_stock": 1}):
+            print(f"{product['name']}: available_stock {product['available_stock']} (expected {expected_stock})")
+            ok = ok and product["available_stock"] == expected_stock
+        print("OK" if ok else "MISMATCH")
+    finally:
+        client.drop_database(args.database)
+
+
+if __name__ == "__main__":
+    main()